@@ -0,0 +1,13 @@
+"""
+Benchmark suite for the simulation engines, plotting and DOCX export.
+
+Run from the repository root:
+
+    python -m benchmarks                 # every case, recorded to benchmarks/history.json
+    python -m benchmarks -k csma         # only cases whose name contains "csma"
+    python -m benchmarks --fail-on-regression
+
+Each case is timed like `python -m timeit` (best of --repeat runs) and
+compared against the median of its recent results on the same machine;
+cases slower than that by more than --threshold are flagged.
+"""
@@ -0,0 +1,121 @@
+"""Benchmark runner: times the cases, records them and flags regressions."""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+from datetime import datetime
+from statistics import median
+
+import numpy as np
+
+from .cases import iter_cases
+
+DEFAULT_HISTORY = os.path.join(os.path.dirname(__file__), "history.json")
+
+
+def machine_info():
+    """Fields identifying the machine; results are only compared within one machine."""
+    return {"node": platform.node(), "machine": platform.machine(), "python": platform.python_version(),
+            "numpy": np.__version__, "cpus": os.cpu_count()}
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def time_case(fn, repeat):
+    """Best seconds per call over `repeat` rounds, each long enough to time reliably (like timeit)."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return json.load(f)["runs"]
+
+
+def save_history(path, runs):
+    with open(path, "w") as f:
+        json.dump({"runs": runs}, f, indent=1)
+        f.write("\n")
+
+
+def baseline_times(runs, machine, last):
+    """Median of each case's last `last` recorded times on this machine."""
+    times = {}
+    for run in runs:
+        if run["machine"] == machine:
+            for name, seconds in run["results"].items():
+                times.setdefault(name, []).append(seconds)
+    return {name: median(values[-last:]) for name, values in times.items()}
+
+
+def format_seconds(seconds):
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="MAC simulator benchmark suite")
+    parser.add_argument("-k", dest="pattern", help="only run cases whose name contains PATTERN")
+    parser.add_argument("--repeat", type=int, default=5, help="timing rounds per case; the best is kept")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="JSON history file")
+    parser.add_argument("--baseline-runs", type=int, default=5,
+                        help="number of recent recorded runs the baseline median is taken over")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="flag cases slower than the baseline by more than this fraction")
+    parser.add_argument("--no-record", action="store_true", help="compare only; do not append to the history")
+    parser.add_argument("--fail-on-regression", action="store_true", help="exit with status 1 on any regression")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    machine = machine_info()
+    runs = load_history(args.history)
+    baseline = baseline_times(runs, machine, args.baseline_runs)
+
+    results = {}
+    regressions = []
+    for name, setup in iter_cases(args.pattern):
+        seconds = time_case(setup(), args.repeat)
+        results[name] = seconds
+        base = baseline.get(name)
+        ratio = seconds / base if base else None
+        flag = ""
+        if ratio is not None and ratio > 1 + args.threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<64} {format_seconds(seconds):>10} {format_seconds(base):>10} "
+              f"{f'{ratio:.2f}x' if ratio else '-':>7}{flag}", flush=True)
+
+    if not results:
+        print(f"no benchmark matches {args.pattern!r}", file=sys.stderr)
+        return 2
+    if not args.no_record:
+        runs.append({"timestamp": datetime.now().isoformat(timespec="seconds"), "commit": git_commit(),
+                     "machine": machine, "results": results})
+        save_history(args.history, runs)
+    if regressions:
+        print(f"{len(regressions)} of {len(results)} cases regressed by more than "
+              f"{args.threshold:.0%}", file=sys.stderr)
+        return 1 if args.fail_on_regression else 0
+    return 0
+
+
+raise SystemExit(main())
@@ -0,0 +1,132 @@
+"""
+Benchmark cases.
+
+A case is a factory registered with @case over a parameter grid, in the
+style of asv: it is called once per grid point to do the setup and
+returns the zero-argument callable that gets timed. ALOHA cases run at
+offered load G = 1 (p = 1 / nodes).
+"""
+
+import io
+from itertools import product
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from csmacdsim.csma import CSMA_PROTOCOLS, simulate_csma, simulate_csma_events
+from csmacdsim.csma_ca import CSMA_CA_VARIANTS, simulate_csma_ca
+from csmacdsim.plotting import draw_timeline
+from csmacdsim.pure_aloha import simulate_pure_aloha, simulate_pure_aloha_vectorized
+from csmacdsim.report import build_report
+from csmacdsim.rng import SAMPLING_MODES
+from csmacdsim.slotted_aloha import (simulate_slotted_aloha, simulate_slotted_aloha_stats,
+                                     simulate_slotted_aloha_vectorized)
+
+SEED = 12345
+TIMELINE_COLORS = {0: '#d3d3d3', 1: '#32CD32', 2: '#FF6347'}
+
+# (name, factory, grid) in registration order
+CASES = []
+
+
+def case(name, **grid):
+    """Register a case factory, called with every combination of the grid values."""
+    def register(factory):
+        CASES.append((name, factory, grid))
+        return factory
+    return register
+
+
+def iter_cases(pattern=None):
+    """(full name, setup factory) per grid point, e.g. 'slotted_aloha[nodes=10,slots=1000]'."""
+    for name, factory, grid in CASES:
+        for values in product(*grid.values()):
+            params = dict(zip(grid, values))
+            full_name = f"{name}[{','.join(f'{k}={v}' for k, v in params.items())}]"
+            if pattern is None or pattern in full_name:
+                yield full_name, lambda factory=factory, params=params: factory(**params)
+
+
+@case("pure_aloha", nodes=[10, 50], units=[1_000, 10_000])
+def pure_aloha(nodes, units):
+    return lambda: simulate_pure_aloha(nodes, 1 / nodes, units, 2, seed=SEED)
+
+
+@case("pure_aloha_vectorized", nodes=[10, 50], units=[10_000, 100_000])
+def pure_aloha_vectorized(nodes, units):
+    return lambda: simulate_pure_aloha_vectorized(nodes, 1 / nodes, units, 2, seed=SEED)
+
+
+@case("slotted_aloha", nodes=[10, 50], slots=[1_000, 10_000])
+def slotted_aloha(nodes, slots):
+    return lambda: simulate_slotted_aloha(nodes, 1 / nodes, slots, seed=SEED)
+
+
+@case("slotted_aloha_vectorized", nodes=[10, 50], slots=[10_000, 100_000])
+def slotted_aloha_vectorized(nodes, slots):
+    return lambda: simulate_slotted_aloha_vectorized(nodes, 1 / nodes, slots, seed=SEED)
+
+
+@case("slotted_aloha_stats", nodes=[10, 50], slots=[100_000, 10_000_000])
+def slotted_aloha_stats(nodes, slots):
+    return lambda: simulate_slotted_aloha_stats(nodes, 1 / nodes, slots, seed=SEED)
+
+
+@case("csma", protocol=CSMA_PROTOCOLS, nodes=[10, 50], slots=[400, 4_000])
+def csma(protocol, nodes, slots):
+    return lambda: simulate_csma(nodes, 20, 1, 5, 0.1, protocol, seed=SEED, max_time=slots)
+
+
+@case("csma_events", nodes=[10, 50], slots=[400, 4_000])
+def csma_events(nodes, slots):
+    return lambda: simulate_csma_events(nodes, 20, 1, 5, 0.1, CSMA_PROTOCOLS[-1], seed=SEED, max_time=slots)
+
+
+@case("csma_ca", variant=CSMA_CA_VARIANTS, nodes=[10, 50], slots=[400, 4_000])
+def csma_ca(variant, nodes, slots):
+    return lambda: simulate_csma_ca(nodes, 20, 1, 5, 0.1, variant, seed=SEED, max_time=slots)
+
+
+@case("light_load_slotted_aloha", sampling=SAMPLING_MODES, slots=[100_000])
+def light_load_slotted_aloha(sampling, slots):
+    return lambda: simulate_slotted_aloha_vectorized(50, 0.002, slots, seed=SEED, sampling=sampling)
+
+
+@case("light_load_csma", sampling=SAMPLING_MODES, slots=[4_000, 40_000])
+def light_load_csma(sampling, slots):
+    return lambda: simulate_csma(10, 20, 1, 5, 0.002, CSMA_PROTOCOLS[-1], seed=SEED, max_time=slots,
+                                 sampling=sampling)
+
+
+@case("light_load_csma_ca", sampling=SAMPLING_MODES, slots=[4_000, 40_000])
+def light_load_csma_ca(sampling, slots):
+    return lambda: simulate_csma_ca(10, 20, 1, 5, 0.002, CSMA_CA_VARIANTS[0], seed=SEED, max_time=slots,
+                                    sampling=sampling)
+
+
+@case("plot_timeline", nodes=[10, 50], slots=[400, 4_000])
+def plot_timeline(nodes, slots):
+    timeline = simulate_csma(nodes, 20, 1, 5, 0.1, CSMA_PROTOCOLS[0], seed=SEED, max_time=slots)[6]
+
+    def render():
+        fig, ax = plt.subplots(figsize=(12, 6))
+        draw_timeline(ax, timeline, TIMELINE_COLORS, height=0.6)
+        fig.savefig(io.BytesIO(), format="png")
+        plt.close(fig)
+    return render
+
+
+@case("docx_report", nodes=[10, 50])
+def docx_report(nodes):
+    usage, _, _, efficiency, throughput, utilization, timeline = simulate_csma(
+        nodes, 20, 1, 5, 0.1, CSMA_PROTOCOLS[0], seed=SEED, max_time=400)
+    data = {"num_nodes": nodes, "efficiency": efficiency, "throughput": throughput,
+            "utilization": utilization, "event_log": usage.to_frame(), "node_timeline": timeline}
+    fig, ax = plt.subplots(figsize=(12, 6))
+    draw_timeline(ax, timeline, TIMELINE_COLORS, height=0.6)
+    plot = io.BytesIO()
+    fig.savefig(plot, format="png")
+    plt.close(fig)
+    return lambda: build_report([("CSMA/CD", data, plot.getvalue(), "Timeline")])
@@ -0,0 +1,58 @@
+"""
+Headless simulation library behind the Streamlit pages.
+
+Nothing here imports Streamlit. Engines are loaded on first attribute
+access, so `import csmacdsim` only pays for NumPy and the timeline types:
+
+    from csmacdsim import simulate_csma, simulate_slotted_aloha
+"""
+
+from .timeline import COLLISION, IDLE, STATE_LABELS, SUCCESS, NodeTimeline, NodeTrack
+
+# name -> submodule for the lazily imported engines
+_EXPORTS = {
+    'CSMA_PROTOCOLS': 'csma',
+    'simulate_csma': 'csma',
+    'simulate_csma_events': 'csma',
+    'compare_csma_protocols': 'csma',
+    'CSMA_CA_VARIANTS': 'csma_ca',
+    'simulate_csma_ca': 'csma_ca',
+    'simulate_pure_aloha': 'pure_aloha',
+    'simulate_pure_aloha_vectorized': 'pure_aloha',
+    'replicate_pure_aloha': 'pure_aloha',
+    'simulate_slotted_aloha': 'slotted_aloha',
+    'simulate_slotted_aloha_vectorized': 'slotted_aloha',
+    'simulate_slotted_aloha_stats': 'slotted_aloha',
+    'replicate_slotted_aloha': 'slotted_aloha',
+    'summarize_replications': 'stats',
+    'stream_csma': 'streaming',
+    'stream_pure_aloha': 'streaming',
+    'stream_slotted_aloha': 'streaming',
+    'EventLog': 'eventlog',
+    'Event': 'events',
+    'iter_csma_ca_events': 'events',
+    'iter_csma_events': 'events',
+    'iter_pure_aloha_events': 'events',
+    'iter_slotted_aloha_events': 'events',
+    'tally_events': 'events',
+    'write_events_csv': 'events',
+    'build_report': 'report',
+    'SAMPLING_MODES': 'rng',
+    'make_rng': 'rng',
+    'fresh_seed': 'rng',
+}
+
+__all__ = ['COLLISION', 'IDLE', 'STATE_LABELS', 'SUCCESS', 'NodeTimeline', 'NodeTrack', *_EXPORTS]
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f'.{_EXPORTS[name]}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
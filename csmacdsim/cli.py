@@ -0,0 +1,126 @@
+"""
+Command-line batch runner for parameter sweeps.
+
+    python -m csmacdsim sweep --protocol "Slotted ALOHA" --nodes 5,10,20 \
+        --p 0.01:0.2:20 --seeds 50 --out slotted.csv
+
+Grid values are comma lists or start:stop:num ranges (inclusive, like
+numpy.linspace). Runs go to a process pool and every row is written as
+soon as its run finishes, so memory does not grow with the sweep size.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+from .parallel import iter_runs
+from .rng import SAMPLING_MODES, fresh_seed
+from .sweep import SWEEP_PROTOCOLS, check_range, open_row_writer, run_point, sweep_points
+
+
+def parse_grid(text, kind=float, name="value", low=None, high=None, strict=False):
+    """
+    Parse '1,2,5' or 'start:stop:num' into a list of `kind` values;
+    ValueError when one is outside [low, high] (see check_range).
+    """
+    if ":" in text:
+        start, stop, num = text.split(":")
+        values = np.linspace(float(start), float(stop), int(num))
+        if kind is int:
+            values = sorted(set(int(round(v)) for v in values))
+        else:
+            values = [float(v) for v in values]
+    else:
+        values = [kind(v) for v in text.split(",") if v.strip()]
+    if low is not None:
+        check_range(name, values, low, high, strict)
+    return values
+
+
+def grid_type(kind=float, name="value", low=None, high=None, strict=False):
+    """argparse type for a grid option, so a bad value is a usage error before the sweep starts."""
+    def parse(text):
+        try:
+            return parse_grid(text, kind, name, low, high, strict)
+        except ValueError as exc:
+            raise argparse.ArgumentTypeError(f"invalid grid {text!r}: {exc}")
+    return parse
+
+
+def positive_int(text):
+    """argparse type for counts and lengths that must be at least 1."""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {value}")
+    return value
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m csmacdsim", description="MAC protocol simulator batch runner")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    sweep = commands.add_parser("sweep", help="run a parameter sweep and stream one row per run")
+    sweep.add_argument("--protocol", action="append", choices=SWEEP_PROTOCOLS, metavar="NAME",
+                       help=f"protocol to sweep, repeatable (default: all of {', '.join(SWEEP_PROTOCOLS)})")
+    sweep.add_argument("--nodes", type=grid_type(int, "nodes", 1), default="10",
+                       help="node counts (default: 10)")
+    sweep.add_argument("--p", type=grid_type(float, "p", 0, 1), default="0.1",
+                       help="ALOHA transmission probabilities (default: 0.1)")
+    sweep.add_argument("--gen-prob", type=grid_type(float, "gen_prob", 0, 1), default="0.1",
+                       help="CSMA packet generation probabilities (default: 0.1)")
+    sweep.add_argument("--tx-time", type=grid_type(float, "tx_time", 0, strict=True), default="1",
+                       help="CSMA transmission times in slots (default: 1)")
+    sweep.add_argument("--seeds", type=positive_int, default=1, help="replications per grid point (default: 1)")
+    sweep.add_argument("--root-seed", type=int, default=None, help="root seed (default: fresh entropy)")
+    sweep.add_argument("--slots", type=positive_int, default=1000,
+                       help="ALOHA slots / time units per run (default: 1000)")
+    sweep.add_argument("--packet-duration", type=positive_int, default=1,
+                       help="Pure ALOHA packet duration (default: 1)")
+    sweep.add_argument("--packets", type=int, default=5, help="CSMA packets per node (default: 5)")
+    sweep.add_argument("--prop-delay", type=float, default=0.0, help="CSMA propagation delay (default: 0)")
+    sweep.add_argument("--max-time", type=positive_int, default=400, help="CSMA simulated slots (default: 400)")
+    sweep.add_argument("--csma-engine", choices=["slotted", "events"], default="slotted",
+                       help="engine for the CSMA protocols (default: slotted)")
+    sweep.add_argument("--sampling", choices=SAMPLING_MODES, default="per-slot",
+                       help="geometric skips idle slots, much faster at light load (default: per-slot)")
+    sweep.add_argument("--workers", type=positive_int, default=None, help="worker processes (default: CPU count)")
+    sweep.add_argument("--serial", action="store_true", help="run in this process, no pool")
+    sweep.add_argument("--batch-size", type=positive_int, default=1000, help="Parquet row group size (default: 1000)")
+    sweep.add_argument("--out", required=True, help="output file, .csv or .parquet")
+    return parser
+
+
+def run_sweep(args):
+    root_seed = fresh_seed() if args.root_seed is None else args.root_seed
+    points = sweep_points(
+        args.protocol or SWEEP_PROTOCOLS,
+        args.nodes, args.p, args.gen_prob, args.tx_time,
+        args.seeds, root_seed,
+        num_slots=args.slots, packet_duration=args.packet_duration, num_packets=args.packets,
+        prop_delay=args.prop_delay, max_time=args.max_time, csma_engine=args.csma_engine,
+        sampling=args.sampling,
+    )
+    writer = open_row_writer(args.out, batch_size=args.batch_size)
+    started = time.perf_counter()
+    done = 0
+    try:
+        # Keep a few runs per worker queued so the pool never idles
+        max_pending = 4 * (args.workers or os.cpu_count() or 1)
+        for _, row in iter_runs(run_point, points, max_workers=args.workers,
+                                parallel=not args.serial, max_pending=max_pending):
+            writer.write(row)
+            done += 1
+    finally:
+        writer.close()
+    elapsed = time.perf_counter() - started
+    print(f"{done} runs written to {args.out} in {elapsed:.1f}s (root seed {root_seed})", file=sys.stderr)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == "sweep":
+        run_sweep(args)
+    return 0
@@ -0,0 +1,416 @@
+"""CSMA / CSMA/CD engines (slotted and discrete-event) and protocol comparison."""
+
+import heapq
+import math
+
+import numpy as np
+
+from .eventlog import BUSY, EventLog
+from .rng import ArrivalBlocks, GeometricArrivals, check_sampling, make_rng, spawn_stream
+from .timeline import COLLISION, IDLE, SUCCESS, NodeTimeline
+
+CSMA_PROTOCOLS = ["1-Persistent CSMA", "Non-Persistent CSMA", "p-Persistent CSMA (CSMA/CD)"]
+
+# --------------------- SLOTTED ENGINE ---------------------
+def _decrement_backoff(backoff, slots=1):
+    backoff -= slots
+    np.maximum(backoff, 0, out=backoff)
+
+
+def iter_csma_spans(num_nodes, num_packets, prop_delay, tx_time, gen_prob, protocol, seed=None, max_time=400,
+                    sampling="per-slot"):
+    """
+    Step the slotted engine, yielding (start, stop, code, nodes) per run of slots.
+
+    Every slot in which the channel is free is its own span; a busy period
+    is a single (start, stop, BUSY, []) span. Arrivals are pre-drawn in
+    (slots, nodes) blocks by ArrivalBlocks on the run's stream, and backoffs
+    and persistence coins come from a child stream, so jumping to the end
+    of a busy period in one step gives the same results as stepping
+    through it slot by slot.
+
+    With sampling="geometric", arrivals are drawn as geometric gaps
+    instead (see _iter_csma_spans_geometric): the same model, run in time
+    proportional to the traffic, but a different random stream.
+    """
+    check_sampling(sampling)
+    rng = make_rng(seed)
+    total_slots = int(max_time)
+    if sampling == "geometric":
+        yield from _iter_csma_spans_geometric(num_nodes, tx_time, gen_prob, protocol, rng, total_slots)
+        return
+
+    arrivals = ArrivalBlocks(rng, gen_prob, num_nodes)
+    backoff_rng = spawn_stream(rng)
+    channel_busy_until = 0.0
+    backoff = np.zeros(num_nodes)
+    packet_ready = np.zeros(num_nodes)
+    retransmission_attempts = np.zeros(num_nodes)
+
+    t = 0
+    while t < total_slots:
+        if t < channel_busy_until:
+            stop = min(total_slots, math.ceil(channel_busy_until))
+            busy_arrivals = arrivals.take(stop - t)
+            if protocol == "Non-Persistent CSMA":
+                for row in busy_arrivals:
+                    packet_ready[row] = 1
+                    sensing = np.flatnonzero((packet_ready == 1) & (backoff <= 0))
+                    backoff[sensing] = backoff_rng.integers(2, 8, size=len(sensing))
+                    _decrement_backoff(backoff)
+            elif protocol == "p-Persistent CSMA (CSMA/CD)":
+                for row in busy_arrivals:
+                    packet_ready[row] = 1
+                    # Sensing nodes toss their p = 0.4 coin but defer anyway
+                    backoff_rng.random(np.count_nonzero((packet_ready == 1) & (backoff <= 0)))
+                    _decrement_backoff(backoff)
+            else:
+                packet_ready[busy_arrivals.any(axis=0)] = 1
+                _decrement_backoff(backoff, stop - t)
+            yield t, stop, BUSY, []
+            t = stop
+            continue
+
+        packet_ready[arrivals.take()[0]] = 1
+
+        sensing_nodes = np.flatnonzero((packet_ready == 1) & (backoff <= 0)).tolist()
+
+        if len(sensing_nodes) == 0:
+            yield t, t + 1, IDLE, []
+        elif len(sensing_nodes) == 1:
+            node = sensing_nodes[0]
+            packet_ready[node] = 0
+            retransmission_attempts[node] = 0
+            channel_busy_until = t + max(1.0, tx_time)
+            yield t, t + 1, SUCCESS, sensing_nodes
+        else:
+            retransmission_attempts[sensing_nodes] += 1
+            k = np.minimum(retransmission_attempts[sensing_nodes], 10).astype(np.int64)
+            backoff[sensing_nodes] = backoff_rng.integers(1, 2 ** k)
+            channel_busy_until = t + max(1.0, tx_time * 0.5)
+            yield t, t + 1, COLLISION, sensing_nodes
+        _decrement_backoff(backoff)
+        t += 1
+
+
+def _iter_csma_spans_geometric(num_nodes, tx_time, gen_prob, protocol, rng, total_slots):
+    """
+    iter_csma_spans driven by GeometricArrivals.
+
+    Each node's next arrival comes from the heap and its backoff is kept
+    as the first slot it may sense again, so a stretch of idle slots is
+    one IDLE span that ends at the next arrival or backoff expiry.
+    """
+    arrivals = GeometricArrivals(rng, gen_prob, num_nodes)
+    ready_since = np.full(num_nodes, -1, dtype=np.int64)   # arrival slot of the waiting packet, -1 if none
+    eligible_at = np.zeros(num_nodes, dtype=np.int64)      # first slot the backoff lets the node sense
+    retransmission_attempts = np.zeros(num_nodes, dtype=np.int64)
+    channel_busy_until = 0.0
+
+    t = 0
+    while t < total_slots:
+        if t < channel_busy_until:
+            stop = min(total_slots, math.ceil(channel_busy_until))
+            for slot, node in arrivals.pop_before(stop):
+                ready_since[node] = slot
+            if protocol == "Non-Persistent CSMA":
+                # A node sensing the busy channel backs off 2-7 slots, then senses again
+                for node in np.flatnonzero(ready_since >= 0).tolist():
+                    sense = max(t, ready_since[node], eligible_at[node])
+                    while sense < stop:
+                        sense = eligible_at[node] = sense + rng.integers(2, 8)
+            yield t, stop, BUSY, []
+            t = stop
+            continue
+
+        for slot, node in arrivals.pop_before(t + 1):
+            ready_since[node] = slot
+        ready = ready_since >= 0
+        sensing_nodes = np.flatnonzero(ready & (eligible_at <= t)).tolist()
+
+        if len(sensing_nodes) == 0:
+            stop = min(arrivals.next_slot(), eligible_at[ready].min(initial=total_slots), total_slots)
+            yield t, int(stop), IDLE, []
+            t = int(stop)
+            continue
+        if len(sensing_nodes) == 1:
+            node = sensing_nodes[0]
+            ready_since[node] = -1
+            retransmission_attempts[node] = 0
+            arrivals.schedule(node, t)
+            channel_busy_until = t + max(1.0, tx_time)
+            yield t, t + 1, SUCCESS, sensing_nodes
+        else:
+            retransmission_attempts[sensing_nodes] += 1
+            k = np.minimum(retransmission_attempts[sensing_nodes], 10)
+            eligible_at[sensing_nodes] = t + rng.integers(1, 2 ** k)
+            channel_busy_until = t + max(1.0, tx_time * 0.5)
+            yield t, t + 1, COLLISION, sensing_nodes
+        t += 1
+
+
+def iter_csma_slots(num_nodes, num_packets, prop_delay, tx_time, gen_prob, protocol, seed=None, max_time=400,
+                    sampling="per-slot"):
+    """
+    Step the slotted engine, yielding (slot, code, nodes) once per slot.
+
+    code is the eventlog code (IDLE, BUSY, SUCCESS or COLLISION) and nodes
+    the list of nodes that succeeded or collided in that slot. This is
+    iter_csma_spans with the busy spans expanded, so simulate_csma and the
+    streaming runner draw the same random numbers for the same seed.
+    """
+    for start, stop, code, nodes in iter_csma_spans(num_nodes, num_packets, prop_delay, tx_time, gen_prob,
+                                                    protocol, seed=seed, max_time=max_time, sampling=sampling):
+        for t in range(start, stop):
+            yield t, code, nodes
+
+def csma_progress(slots, success_count, collision_count, busy_time):
+    """Running metrics after `slots` slots, as passed to on_chunk callbacks."""
+    return {
+        "slots": slots,
+        "success": success_count,
+        "collisions": collision_count,
+        "efficiency": success_count / slots,
+        "throughput": success_count / slots,
+        "utilization": busy_time / slots,
+    }
+
+def simulate_csma(num_nodes, num_packets, prop_delay, tx_time, gen_prob, protocol, seed=None, max_time=400,
+                  on_chunk=None, chunk_slots=50, sampling="per-slot", jit=None):
+    """
+    Slotted CSMA / CSMA/CD engine.
+
+    With on_chunk set, csma_progress metrics are reported every chunk_slots
+    slots while the run is in progress; the results are the same either way.
+    sampling="geometric" skips idle stretches for light-load runs (see
+    iter_csma_spans).
+
+    Per-slot runs without on_chunk use the compiled kernel from .kernels
+    when a working Numba is available (jit=None, falling back to Python on
+    any import or compile failure), always (jit=True, which raises instead
+    and cannot be combined with on_chunk or geometric sampling) or never
+    (jit=False). The results are identical to the Python engine.
+    """
+    if jit and (on_chunk is not None or sampling != "per-slot"):
+        raise ValueError("jit=True needs sampling='per-slot' and no on_chunk")
+    if sampling == "per-slot" and on_chunk is None and jit is not False:
+        from . import kernels
+        result = kernels.run_kernel(kernels.csma_slot_loop, make_rng(seed), num_nodes, tx_time, gen_prob,
+                                    kernels.csma_persistence(protocol), max_time, required=bool(jit))
+        if result is not None:
+            return result
+
+    success_count = 0
+    collision_count = 0
+    busy_slots = 0
+    usage_log = EventLog.for_slots(int(max_time))
+    node_timelines = NodeTimeline.empty(num_nodes, int(max_time))
+
+    for start, stop, code, nodes in iter_csma_spans(num_nodes, num_packets, prop_delay, tx_time, gen_prob,
+                                                    protocol, seed=seed, max_time=max_time, sampling=sampling):
+        usage_log.code[start:stop] = code
+        if code != IDLE:
+            busy_slots += stop - start
+        if code == COLLISION:
+            collision_count += 1
+            node_timelines.states[nodes, start] = COLLISION
+        elif code == SUCCESS:
+            success_count += 1
+            usage_log.node[start] = nodes[0]
+            node_timelines.states[nodes[0], start] = SUCCESS
+        if on_chunk is not None:
+            # Every chunk boundary inside the span; busy slots after it are not counted yet
+            for done in range(start - start % chunk_slots + chunk_slots, stop + 1, chunk_slots):
+                on_chunk(csma_progress(done, success_count, collision_count,
+                                       busy_slots - (stop - done) * (code != IDLE)))
+
+    total_slots = int(max_time)
+    efficiency = success_count / total_slots
+    throughput = success_count / total_slots
+    utilization = busy_slots / total_slots
+    return usage_log, success_count, collision_count, efficiency, throughput, utilization, node_timelines
+
+# --------------------- EVENT-DRIVEN ENGINE ---------------------
+# Event kinds; at equal timestamps a freed channel is handled first and a
+# contention window is resolved last, so same-instant attempts collide.
+EVENT_CHANNEL_FREE = 0
+EVENT_ARRIVAL = 1
+EVENT_SENSE = 2
+EVENT_RESOLVE = 3
+
+def iter_csma_event_outcomes(num_nodes, num_packets, prop_delay, tx_time, gen_prob, protocol, seed=None, max_time=400):
+    """
+    Run the discrete-event engine, yielding (start, code, nodes, busy_until) per transmission.
+
+    start is the (fractional) time the contention window opened, code
+    SUCCESS or COLLISION, nodes the contenders and busy_until the time the
+    channel is released. simulate_csma_events consumes this stream.
+    """
+    rng = make_rng(seed)
+
+    events = []
+    counter = 0
+    channel_busy_until = 0.0
+    contention_start = None
+    contenders = []
+    waiting = set()
+    retransmission_attempts = np.zeros(num_nodes, dtype=int)
+    outcomes = []
+
+    def schedule(time, kind, node=-1):
+        nonlocal counter
+        heapq.heappush(events, (time, kind, counter, node))
+        counter += 1
+
+    def schedule_arrival(node, after_slot):
+        if gen_prob > 0:
+            schedule(after_slot + float(rng.geometric(gen_prob)), EVENT_ARRIVAL, node)
+
+    def transmit(node, t):
+        nonlocal contention_start
+        if contention_start is None:
+            contention_start = t
+            schedule(t + prop_delay, EVENT_RESOLVE)
+        contenders.append(node)
+
+    def sense(node, t):
+        if t < channel_busy_until:
+            if protocol == "Non-Persistent CSMA":
+                schedule(t + rng.integers(2, 8), EVENT_SENSE, node)
+            else:
+                waiting.add(node)
+        elif protocol == "p-Persistent CSMA (CSMA/CD)" and rng.random() >= 0.4:
+            schedule(t + 1, EVENT_SENSE, node)
+        else:
+            transmit(node, t)
+
+    def resolve():
+        nonlocal contention_start, channel_busy_until
+        start = contention_start
+        slot = int(start)
+        if len(contenders) == 1:
+            node = contenders[0]
+            code = SUCCESS
+            retransmission_attempts[node] = 0
+            channel_busy_until = start + tx_time + prop_delay
+            schedule_arrival(node, slot)
+        else:
+            code = COLLISION
+            for i in contenders:
+                retransmission_attempts[i] += 1
+                k = int(min(retransmission_attempts[i], 10))
+                schedule(start + rng.integers(1, 2 ** k), EVENT_SENSE, i)
+            channel_busy_until = start + 0.5 * tx_time + 2 * prop_delay
+        outcomes.append((start, code, list(contenders), channel_busy_until))
+        schedule(channel_busy_until, EVENT_CHANNEL_FREE)
+        contention_start = None
+        contenders.clear()
+
+    for i in range(num_nodes):
+        schedule_arrival(i, -1)
+
+    while events and events[0][0] < max_time:
+        t, kind, _, node = heapq.heappop(events)
+        if kind == EVENT_ARRIVAL or kind == EVENT_SENSE:
+            sense(node, t)
+        elif kind == EVENT_RESOLVE:
+            resolve()
+            yield outcomes.pop()
+        else:
+            for i in sorted(waiting):
+                if protocol == "p-Persistent CSMA (CSMA/CD)" and rng.random() >= 0.4:
+                    schedule(t + 1, EVENT_SENSE, i)
+                else:
+                    transmit(i, t)
+            waiting.clear()
+
+    # A contention window opened before max_time is still counted
+    if contention_start is not None:
+        resolve()
+        yield outcomes.pop()
+
+def simulate_csma_events(num_nodes, num_packets, prop_delay, tx_time, gen_prob, protocol, seed=None, max_time=400,
+                         on_chunk=None, chunk_slots=50):
+    """
+    Discrete-event CSMA/CD engine with the same return values as simulate_csma.
+
+    Packet arrivals, backoff expiries, contention resolution and channel-free
+    instants are kept in a heap, so cost scales with the number of events
+    rather than the simulated time, and fractional tx_time/prop_delay are
+    used as-is. Arrivals still follow the per-slot gen_prob (geometric gaps).
+
+    A transmission starting at s is heard by other nodes after prop_delay,
+    so every attempt in [s, s + prop_delay] joins it. A lone transmission
+    holds the channel for tx_time + prop_delay; a collision is detected after
+    the round trip and jammed, holding it for 0.5 * tx_time + 2 * prop_delay.
+    At integer tx_time and zero prop_delay, 1-persistent and Non-Persistent
+    runs match simulate_csma in distribution. p-Persistent nodes here toss
+    their p = 0.4 coin whenever they find the channel free, while the
+    slotted engine only tosses it during busy periods and defers anyway,
+    so that protocol behaves differently in the two engines.
+    usage_log is an EventLog with one entry per transmission at its (fractional) start.
+    on_chunk works as in simulate_csma, reported as event time passes each
+    multiple of chunk_slots.
+    """
+    success_count = 0
+    collision_count = 0
+    log_slots, log_codes, log_nodes = [], [], []
+    node_timelines = NodeTimeline.empty(num_nodes, int(max_time))
+    busy_time = 0.0
+    next_report = chunk_slots
+
+    for start, code, nodes, busy_until in iter_csma_event_outcomes(
+            num_nodes, num_packets, prop_delay, tx_time, gen_prob, protocol, seed=seed, max_time=max_time):
+        while on_chunk is not None and start >= next_report:
+            on_chunk(csma_progress(next_report, success_count, collision_count, busy_time))
+            next_report += chunk_slots
+        log_slots.append(start)
+        log_codes.append(code)
+        if code == COLLISION:
+            collision_count += 1
+            log_nodes.append(-1)
+            node_timelines.states[nodes, int(start)] = COLLISION
+        else:
+            success_count += 1
+            log_nodes.append(nodes[0])
+            node_timelines.states[nodes[0], int(start)] = SUCCESS
+        busy_time += min(busy_until, max_time) - start
+
+    while on_chunk is not None and next_report <= max_time:
+        on_chunk(csma_progress(next_report, success_count, collision_count, busy_time))
+        next_report += chunk_slots
+
+    total_slots = int(max_time)
+    efficiency = success_count / total_slots
+    throughput = success_count / total_slots
+    utilization = busy_time / total_slots
+    usage_log = EventLog(np.array(log_slots, dtype=np.float64), log_codes, log_nodes)
+    return usage_log, success_count, collision_count, efficiency, throughput, utilization, node_timelines
+
+# --------------------- PROTOCOL COMPARISON ---------------------
+COMPARE_METRICS = ["efficiency", "throughput", "utilization"]
+
+def compare_csma_protocols(num_nodes, num_packets, prop_delay, tx_time, gen_prob, runs, root_seed,
+                           protocols=CSMA_PROTOCOLS, engine=simulate_csma, max_time=400, max_workers=None):
+    """
+    Run every protocol `runs` times in a process pool and aggregate the metrics.
+
+    Run seeds are child SeedSequences spawned from root_seed, and every
+    protocol sees the same seeds, so a comparison is reproducible and the protocols are
+    compared on common random traffic. Returns (means, stdevs), each a
+    (len(protocols), 3) array with columns in COMPARE_METRICS order.
+    """
+    # Imported here so the engines load without multiprocessing
+    from .parallel import iter_runs, run_metrics, run_seeds
+
+    seeds = run_seeds(root_seed, runs)
+    tasks = [
+        (engine, (num_nodes, num_packets, prop_delay, tx_time, gen_prob, protocol), seed, max_time)
+        for protocol in protocols for seed in seeds
+    ]
+    results = np.zeros((len(tasks), len(COMPARE_METRICS)))
+    for index, result in iter_runs(run_metrics, tasks, max_workers=max_workers):
+        results[index] = result
+    results = results.reshape(len(protocols), runs, len(COMPARE_METRICS))
+    stdevs = results.std(axis=1, ddof=1) if runs > 1 else np.zeros_like(results[:, 0])
+    return results.mean(axis=1), stdevs
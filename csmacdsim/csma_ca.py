@@ -0,0 +1,172 @@
+"""CSMA/CA engine (basic and RTS/CTS variants)."""
+
+import math
+
+import numpy as np
+
+from .eventlog import BUSY, EventLog
+from .rng import ArrivalBlocks, GeometricArrivals, check_sampling, make_rng, spawn_stream
+from .timeline import COLLISION, IDLE, SUCCESS, NodeTimeline
+
+CSMA_CA_VARIANTS = ["Basic CSMA/CA", "CSMA/CA with RTS/CTS"]
+
+def iter_csma_ca_spans(num_nodes, num_packets, prop_delay, tx_time, gen_prob, variant="Basic CSMA/CA", seed=None, max_time=400,
+                       sampling="per-slot"):
+    """
+    Step the CSMA/CA engine, yielding (start, stop, code, nodes) per run of slots.
+
+    Same contract as csma.iter_csma_spans: a busy period is one BUSY span,
+    every other slot its own span, arrivals come from ArrivalBlocks and
+    backoffs from a child stream, and sampling="geometric" also folds idle
+    stretches into one span.
+    """
+    check_sampling(sampling)
+    rng = make_rng(seed)
+    total_slots = int(max_time)
+    if sampling == "geometric":
+        yield from _iter_csma_ca_spans_geometric(num_nodes, tx_time, gen_prob, variant, rng, total_slots)
+        return
+
+    arrivals = ArrivalBlocks(rng, gen_prob, num_nodes)
+    backoff_rng = spawn_stream(rng)
+    channel_busy_until = 0.0
+    backoff = np.zeros(num_nodes)
+    packet_ready = np.zeros(num_nodes)
+
+    t = 0
+    while t < total_slots:
+        # Channel busy: skip to the end of the period
+        if t < channel_busy_until:
+            stop = min(total_slots, math.ceil(channel_busy_until))
+            packet_ready[arrivals.take(stop - t).any(axis=0)] = 1
+            backoff -= stop - t
+            np.maximum(backoff, 0, out=backoff)
+            yield t, stop, BUSY, []
+            t = stop
+            continue
+
+        # Packet generation
+        packet_ready[arrivals.take()[0]] = 1
+
+        active_nodes = np.flatnonzero((packet_ready == 1) & (backoff <= 0)).tolist()
+
+        if len(active_nodes) == 0:
+            yield t, t + 1, IDLE, []
+        elif len(active_nodes) == 1:
+            node = active_nodes[0]
+
+            # RTS/CTS handshake delay
+            if variant == "CSMA/CA with RTS/CTS":
+                handshake_time = 0.5 * tx_time
+                channel_busy_until = t + tx_time + handshake_time
+            else:
+                channel_busy_until = t + tx_time
+
+            packet_ready[node] = 0
+            yield t, t + 1, SUCCESS, active_nodes
+        else:
+            # Virtual collisions due to RTS overlaps
+            backoff[active_nodes] = backoff_rng.integers(1, 8, size=len(active_nodes))
+            channel_busy_until = t + tx_time * 0.5
+            yield t, t + 1, COLLISION, active_nodes
+
+        backoff -= 1
+        np.maximum(backoff, 0, out=backoff)
+        t += 1
+
+def _iter_csma_ca_spans_geometric(num_nodes, tx_time, gen_prob, variant, rng, total_slots):
+    """iter_csma_ca_spans driven by GeometricArrivals, like csma._iter_csma_spans_geometric."""
+    arrivals = GeometricArrivals(rng, gen_prob, num_nodes)
+    packet_ready = np.zeros(num_nodes, dtype=bool)
+    eligible_at = np.zeros(num_nodes, dtype=np.int64)   # first slot the backoff lets the node transmit
+    channel_busy_until = 0.0
+
+    t = 0
+    while t < total_slots:
+        if t < channel_busy_until:
+            stop = min(total_slots, math.ceil(channel_busy_until))
+            for _, node in arrivals.pop_before(stop):
+                packet_ready[node] = True
+            yield t, stop, BUSY, []
+            t = stop
+            continue
+
+        for _, node in arrivals.pop_before(t + 1):
+            packet_ready[node] = True
+        active_nodes = np.flatnonzero(packet_ready & (eligible_at <= t)).tolist()
+
+        if len(active_nodes) == 0:
+            stop = min(arrivals.next_slot(), eligible_at[packet_ready].min(initial=total_slots), total_slots)
+            yield t, int(stop), IDLE, []
+            t = int(stop)
+            continue
+        if len(active_nodes) == 1:
+            node = active_nodes[0]
+            if variant == "CSMA/CA with RTS/CTS":
+                channel_busy_until = t + tx_time + 0.5 * tx_time
+            else:
+                channel_busy_until = t + tx_time
+            packet_ready[node] = False
+            arrivals.schedule(node, t)
+            yield t, t + 1, SUCCESS, active_nodes
+        else:
+            eligible_at[active_nodes] = t + rng.integers(1, 8, size=len(active_nodes))
+            channel_busy_until = t + tx_time * 0.5
+            yield t, t + 1, COLLISION, active_nodes
+        t += 1
+
+def iter_csma_ca_slots(num_nodes, num_packets, prop_delay, tx_time, gen_prob, variant="Basic CSMA/CA", seed=None, max_time=400,
+                       sampling="per-slot"):
+    """
+    Step the CSMA/CA engine, yielding (slot, code, nodes) once per slot.
+
+    Same contract as csma.iter_csma_slots: code is the eventlog code and
+    nodes the nodes that succeeded or collided in that slot.
+    """
+    for start, stop, code, nodes in iter_csma_ca_spans(num_nodes, num_packets, prop_delay, tx_time, gen_prob,
+                                                       variant, seed=seed, max_time=max_time, sampling=sampling):
+        for t in range(start, stop):
+            yield t, code, nodes
+
+def simulate_csma_ca(num_nodes, num_packets, prop_delay, tx_time, gen_prob, variant="Basic CSMA/CA", seed=None, max_time=400,
+                     sampling="per-slot", jit=None):
+    """
+    Slotted CSMA/CA engine.
+
+    jit selects the compiled slot loop as in csma.simulate_csma: None uses
+    it when a working Numba is available and otherwise falls back to the
+    Python engine, True requires it (per-slot sampling only) and False
+    never uses it. The results are the same either way.
+    """
+    if jit and sampling != "per-slot":
+        raise ValueError("jit=True needs sampling='per-slot'")
+    if sampling == "per-slot" and jit is not False:
+        from . import kernels
+        result = kernels.run_kernel(kernels.csma_ca_slot_loop, make_rng(seed), num_nodes, tx_time, gen_prob,
+                                    kernels.csma_ca_rts_cts(variant), max_time, required=bool(jit))
+        if result is not None:
+            return result
+
+    success_count = 0
+    collision_count = 0
+    usage_log = EventLog.for_slots(int(max_time))
+    node_timelines = NodeTimeline.empty(num_nodes, int(max_time))
+
+    for start, stop, code, nodes in iter_csma_ca_spans(num_nodes, num_packets, prop_delay, tx_time, gen_prob,
+                                                       variant, seed=seed, max_time=max_time, sampling=sampling):
+        usage_log.code[start:stop] = code
+        if code == COLLISION:
+            collision_count += 1
+            node_timelines.states[nodes, start] = COLLISION
+        elif code == SUCCESS:
+            success_count += 1
+            usage_log.node[start] = nodes[0]
+            node_timelines.states[nodes[0], start] = SUCCESS
+
+    total_slots = int(max_time)
+    efficiency = success_count / total_slots if total_slots else 0
+    throughput = success_count / total_slots if total_slots else 0
+    busy_slots = total_slots - usage_log.count(IDLE)
+    utilization = busy_slots / total_slots if total_slots else 0
+
+    return usage_log, success_count, collision_count, efficiency, throughput, utilization, node_timelines
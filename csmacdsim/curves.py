@@ -0,0 +1,63 @@
+"""Simulated throughput-vs-offered-load curves for the ALOHA protocols."""
+
+import numpy as np
+
+from .pure_aloha import replicate_pure_aloha
+from .slotted_aloha import replicate_slotted_aloha
+
+CURVE_PROTOCOLS = ["Pure ALOHA", "Slotted ALOHA"]
+
+
+def curve_point(task):
+    """
+    Worker for curve sweeps: task is (protocol, num_nodes, p, num_slots,
+    packet_duration, replications, seed, confidence).
+
+    Returns (mean, half_width) of the throughput over the replications, in
+    successes per packet time (per slot for Slotted ALOHA).
+    """
+    protocol, num_nodes, p, num_slots, packet_duration, replications, seed, confidence = task
+    if protocol == "Pure ALOHA":
+        _, summary = replicate_pure_aloha(num_nodes, p, num_slots, packet_duration, replications,
+                                          seed=seed, confidence=confidence)
+        # The engine counts successes per time unit; S = G e^-2G is per packet time
+        scale = packet_duration
+    else:
+        _, summary = replicate_slotted_aloha(num_nodes, p, num_slots, replications,
+                                             seed=seed, confidence=confidence)
+        scale = 1
+    return summary["throughput"]["mean"] * scale, summary["throughput"]["half_width"] * scale
+
+
+def simulate_throughput_curve(protocol, num_nodes, offered_loads, num_slots, replications, root_seed,
+                              packet_duration=1, confidence=0.95, max_workers=None, parallel=True):
+    """
+    Simulated throughput S(G) with confidence half-widths at every offered load.
+
+    Loads and throughputs are per packet time, the units of S = G e^-G and
+    S = G e^-2G: G = N * p for Slotted ALOHA and N * p * packet_duration
+    for Pure ALOHA, where p is per time unit. Loads that would need p > 1
+    are dropped. Each point is a batch of `replications` runs in one
+    worker task; all points share the root seed, so neighbouring points
+    see common random numbers and the curve is smooth. Returns
+    (offered_loads, means, half_widths) arrays.
+    """
+    if protocol not in CURVE_PROTOCOLS:
+        raise ValueError(f"unknown protocol {protocol!r}")
+    # Imported here so the engines load without multiprocessing
+    from .parallel import iter_runs
+
+    attempts_per_load = num_nodes * (packet_duration if protocol == "Pure ALOHA" else 1)
+    offered_loads = np.asarray(offered_loads, dtype=float)
+    offered_loads = offered_loads[(offered_loads > 0) & (offered_loads <= attempts_per_load)]
+    tasks = [
+        (protocol, num_nodes, load / attempts_per_load, num_slots, packet_duration, replications, root_seed,
+         confidence)
+        for load in offered_loads
+    ]
+    means = np.zeros(len(tasks))
+    half_widths = np.zeros(len(tasks))
+    for index, (mean, half_width) in iter_runs(curve_point, tasks, max_workers=max_workers, parallel=parallel):
+        means[index] = mean
+        half_widths[index] = half_width
+    return offered_loads, means, half_widths
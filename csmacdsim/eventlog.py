@@ -0,0 +1,68 @@
+"""Columnar usage log for the CSMA engines."""
+
+import numpy as np
+
+from .timeline import COLLISION, IDLE, SUCCESS
+
+# Event codes; the first three match the NodeTimeline states
+BUSY = 3
+
+EVENT_LABELS = {IDLE: 'Idle', SUCCESS: 'Success', COLLISION: 'Collision', BUSY: 'Busy'}
+
+
+def event_label(code, node=-1):
+    """Display label of one entry, e.g. 'Success (Node 3)'."""
+    if code == SUCCESS and node >= 0:
+        return f"Success (Node {node})"
+    return EVENT_LABELS[code]
+
+
+class EventLog:
+    """
+    Usage log stored as three columns instead of (label, slot) tuples.
+
+    slot is int32 for the slotted engines and float64 for the fractional
+    start times of the discrete-event engine, code is an int8 event code
+    and node an int16 node id (-1 when no single node applies). Labels
+    are only built for display by to_frame(); iterating still yields the
+    old (label, slot) tuples.
+    """
+
+    def __init__(self, slot, code, node):
+        self.slot = np.asarray(slot)
+        self.code = np.asarray(code, dtype=np.int8)
+        self.node = np.asarray(node, dtype=np.int16)
+
+    @classmethod
+    def for_slots(cls, num_slots):
+        """All-idle log with one row per slot, filled in by the slotted engines."""
+        return cls(np.arange(num_slots, dtype=np.int32), np.full(num_slots, IDLE, dtype=np.int8),
+                   np.full(num_slots, -1, dtype=np.int16))
+
+    def __len__(self):
+        return len(self.code)
+
+    def __getitem__(self, index):
+        return event_label(int(self.code[index]), int(self.node[index])), self.slot[index].item()
+
+    def __iter__(self):
+        return zip(map(event_label, self.code.tolist(), self.node.tolist()), self.slot.tolist())
+
+    def count(self, code):
+        """Number of entries with the given event code."""
+        return int(np.count_nonzero(self.code == code))
+
+    def to_frame(self):
+        """DataFrame with a categorical Event column and the Time Slot column."""
+        import pandas as pd
+
+        num_nodes = int(self.node.max()) + 1 if len(self.node) else 0
+        categories = [EVENT_LABELS[code] for code in sorted(EVENT_LABELS)]
+        categories += [event_label(SUCCESS, node) for node in range(num_nodes)]
+        category_codes = np.where((self.code == SUCCESS) & (self.node >= 0),
+                                  len(EVENT_LABELS) + self.node.astype(np.int64), self.code)
+        events = pd.Categorical.from_codes(category_codes, categories).remove_unused_categories()
+        return pd.DataFrame({"Event": events, "Time Slot": self.slot})
+
+    def __repr__(self):
+        return f"EventLog(entries={len(self)}, slot_dtype={self.slot.dtype})"
@@ -0,0 +1,99 @@
+"""
+Lazy event streams for every engine.
+
+Each iter_*_events function is a generator of Event(slot, node, kind)
+tuples, one per node per transmission outcome, with kind SUCCESS or
+COLLISION (the NodeTimeline state codes). Nothing is materialised, so a
+run can be piped straight into write_events_csv, tally_events or a live
+chart.
+
+For the same seed, the Slotted ALOHA, CSMA and CSMA/CA events describe
+the same run as simulate_slotted_aloha_vectorized, simulate_csma (or
+simulate_csma_events) and simulate_csma_ca. Pure ALOHA events come from
+the chunked draws of streaming.iter_pure_aloha_chunks: they describe the
+run stream_pure_aloha makes with the same seed and chunk size, and match
+simulate_pure_aloha_vectorized only in distribution.
+"""
+
+import csv
+from collections import namedtuple
+
+import numpy as np
+
+from .csma import iter_csma_event_outcomes, iter_csma_slots
+from .csma_ca import iter_csma_ca_slots
+from .rng import make_rng
+from .streaming import iter_pure_aloha_chunks
+from .timeline import COLLISION, STATE_LABELS, SUCCESS
+
+Event = namedtuple("Event", ["slot", "node", "kind"])
+
+
+def iter_slotted_aloha_events(num_nodes, p, num_slots, seed=None, chunk_slots=2**16):
+    """Slotted ALOHA events, drawn chunk by chunk like stream_slotted_aloha."""
+    rng = make_rng(seed)
+    for first in range(0, num_slots, chunk_slots):
+        slots = min(chunk_slots, num_slots - first)
+        attempts = rng.random((slots, num_nodes)) < p
+        slot_counts = attempts.sum(axis=1)
+        slot_ids, node_ids = np.nonzero(attempts)
+        kinds = np.where(slot_counts[slot_ids] == 1, SUCCESS, COLLISION)
+        yield from map(Event._make, zip((slot_ids + first).tolist(), node_ids.tolist(), kinds.tolist()))
+
+
+def iter_pure_aloha_events(num_nodes, p, num_time_units, packet_duration, seed=None, chunk_units=2**16):
+    """
+    Pure ALOHA events in start order; slot is the start time unit of the
+    transmission. Drawn like stream_pure_aloha, not simulate_pure_aloha_vectorized.
+    """
+    for _, node_ids, starts, _, collided, _, _ in iter_pure_aloha_chunks(
+            num_nodes, p, num_time_units, packet_duration, seed=seed, chunk_units=chunk_units):
+        kinds = np.where(collided, COLLISION, SUCCESS)
+        yield from map(Event._make, zip(starts.tolist(), node_ids.tolist(), kinds.tolist()))
+
+
+def _slot_events(slots):
+    for t, code, nodes in slots:
+        for node in nodes:
+            yield Event(t, node, code)
+
+
+def iter_csma_events(num_nodes, num_packets, prop_delay, tx_time, gen_prob, protocol, seed=None,
+                     max_time=400, engine="slotted"):
+    """
+    CSMA / CSMA/CD events from the slotted engine or, with engine="events",
+    the discrete-event engine (whose slot is the fractional start time).
+    """
+    if engine == "events":
+        outcomes = iter_csma_event_outcomes(num_nodes, num_packets, prop_delay, tx_time, gen_prob,
+                                            protocol, seed=seed, max_time=max_time)
+        return _slot_events((start, code, nodes) for start, code, nodes, _ in outcomes)
+    return _slot_events(iter_csma_slots(num_nodes, num_packets, prop_delay, tx_time, gen_prob,
+                                        protocol, seed=seed, max_time=max_time))
+
+
+def iter_csma_ca_events(num_nodes, num_packets, prop_delay, tx_time, gen_prob, variant="Basic CSMA/CA",
+                        seed=None, max_time=400):
+    """CSMA/CA events from the per-slot engine."""
+    return _slot_events(iter_csma_ca_slots(num_nodes, num_packets, prop_delay, tx_time, gen_prob,
+                                           variant, seed=seed, max_time=max_time))
+
+
+def tally_events(events):
+    """Count events per kind label ('Success', 'Collision') without storing them."""
+    counts = {STATE_LABELS[SUCCESS]: 0, STATE_LABELS[COLLISION]: 0}
+    for event in events:
+        counts[STATE_LABELS[event.kind]] += 1
+    return counts
+
+
+def write_events_csv(events, path):
+    """Write events to CSV as (Slot, Node, Kind) rows; returns the number written."""
+    written = 0
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Slot", "Node", "Kind"])
+        for event in events:
+            writer.writerow((event.slot, event.node, STATE_LABELS[event.kind]))
+            written += 1
+    return written
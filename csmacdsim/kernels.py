@@ -0,0 +1,204 @@
+"""
+Optional Numba kernels for the slotted CSMA and CSMA/CA loops.
+
+The backoff and persistence logic is sequential, so instead of
+vectorizing it the whole slot loop is compiled with numba.njit when
+Numba is installed. State lives in typed arrays and the results go to
+preallocated int8 / int16 buffers. The kernels draw arrivals one node
+at a time from the run's stream, which consumes it exactly like the
+ArrivalBlocks rows of iter_csma_spans / iter_csma_ca_spans with
+sampling="per-slot", and make the same backoff_rng calls in the same
+order, so a seed gives the same run either way.
+
+Without a working Numba, simulate_csma and simulate_csma_ca keep using
+the Python engines; the kernels below are still plain Python functions then.
+"""
+
+import numpy as np
+
+from .csma import CSMA_PROTOCOLS
+from .csma_ca import CSMA_CA_VARIANTS
+from .eventlog import BUSY, EventLog
+from .rng import spawn_stream
+from .timeline import COLLISION, IDLE, SUCCESS, NodeTimeline
+
+try:
+    from numba import njit
+except Exception:  # not installed, or installed but unable to load (e.g. against a newer NumPy)
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+# Persistence codes passed to the CSMA kernel, by CSMA_PROTOCOLS index
+ONE_PERSISTENT, NON_PERSISTENT, P_PERSISTENT = range(3)
+
+
+def csma_slot_loop(rng, backoff_rng, num_nodes, tx_time, gen_prob, persistence, codes, success_nodes, states):
+    """
+    Slotted CSMA / CSMA/CD over len(codes) slots; returns (success, collisions).
+
+    Fills codes with the eventlog code of every slot, success_nodes with
+    the node that succeeded (left at -1 otherwise) and the (nodes, slots)
+    states with the NodeTimeline codes.
+    """
+    backoff = np.zeros(num_nodes, dtype=np.int64)
+    packet_ready = np.zeros(num_nodes, dtype=np.bool_)
+    retransmission_attempts = np.zeros(num_nodes, dtype=np.int64)
+    sensing = np.empty(num_nodes, dtype=np.int64)
+    channel_busy_until = 0.0
+    success_count = 0
+    collision_count = 0
+
+    for t in range(codes.shape[0]):
+        for i in range(num_nodes):
+            if rng.random() < gen_prob:
+                packet_ready[i] = True
+        num_sensing = 0
+        for i in range(num_nodes):
+            if packet_ready[i] and backoff[i] <= 0:
+                sensing[num_sensing] = i
+                num_sensing += 1
+
+        if t < channel_busy_until:
+            if persistence == NON_PERSISTENT:
+                for j in range(num_sensing):
+                    backoff[sensing[j]] = backoff_rng.integers(2, 8)
+            elif persistence == P_PERSISTENT:
+                for j in range(num_sensing):
+                    backoff_rng.random()
+            codes[t] = BUSY
+        elif num_sensing == 0:
+            codes[t] = IDLE
+        elif num_sensing == 1:
+            node = sensing[0]
+            packet_ready[node] = False
+            retransmission_attempts[node] = 0
+            channel_busy_until = t + max(1.0, tx_time)
+            codes[t] = SUCCESS
+            success_nodes[t] = node
+            states[node, t] = SUCCESS
+            success_count += 1
+        else:
+            for j in range(num_sensing):
+                i = sensing[j]
+                retransmission_attempts[i] += 1
+                k = min(retransmission_attempts[i], 10)
+                backoff[i] = backoff_rng.integers(1, 2 ** k)
+                states[i, t] = COLLISION
+            channel_busy_until = t + max(1.0, tx_time * 0.5)
+            codes[t] = COLLISION
+            collision_count += 1
+
+        for i in range(num_nodes):
+            if backoff[i] > 0:
+                backoff[i] -= 1
+    return success_count, collision_count
+
+
+def csma_ca_slot_loop(rng, backoff_rng, num_nodes, tx_time, gen_prob, rts_cts, codes, success_nodes, states):
+    """CSMA/CA counterpart of csma_slot_loop; rts_cts selects the RTS/CTS variant."""
+    backoff = np.zeros(num_nodes, dtype=np.int64)
+    packet_ready = np.zeros(num_nodes, dtype=np.bool_)
+    active = np.empty(num_nodes, dtype=np.int64)
+    channel_busy_until = 0.0
+    success_count = 0
+    collision_count = 0
+
+    for t in range(codes.shape[0]):
+        for i in range(num_nodes):
+            if rng.random() < gen_prob:
+                packet_ready[i] = True
+
+        if t < channel_busy_until:
+            codes[t] = BUSY
+        else:
+            num_active = 0
+            for i in range(num_nodes):
+                if packet_ready[i] and backoff[i] <= 0:
+                    active[num_active] = i
+                    num_active += 1
+            if num_active == 0:
+                codes[t] = IDLE
+            elif num_active == 1:
+                node = active[0]
+                if rts_cts:
+                    channel_busy_until = t + tx_time + 0.5 * tx_time
+                else:
+                    channel_busy_until = t + tx_time
+                packet_ready[node] = False
+                codes[t] = SUCCESS
+                success_nodes[t] = node
+                states[node, t] = SUCCESS
+                success_count += 1
+            else:
+                for j in range(num_active):
+                    backoff[active[j]] = backoff_rng.integers(1, 8)
+                    states[active[j], t] = COLLISION
+                channel_busy_until = t + tx_time * 0.5
+                codes[t] = COLLISION
+                collision_count += 1
+
+        for i in range(num_nodes):
+            if backoff[i] > 0:
+                backoff[i] -= 1
+    return success_count, collision_count
+
+
+_compiled = {}
+# Kernels Numba failed to compile, so the engines do not retry them every run
+_unusable = set()
+
+
+def compiled(kernel):
+    """numba.njit version of `kernel`, compiled on its first call (RuntimeError without Numba)."""
+    if njit is None:
+        raise RuntimeError("the compiled kernels need a working Numba (pip install numba)")
+    if kernel not in _compiled:
+        _compiled[kernel] = njit(cache=True)(kernel)
+    return _compiled[kernel]
+
+
+def run_kernel(kernel, rng, num_nodes, tx_time, gen_prob, flag, max_time, required=False, compile=True):
+    """
+    Run a slot-loop kernel and package its buffers like the Python engines:
+    (usage_log, success, collisions, efficiency, throughput, utilization, node_timelines).
+
+    Returns None when Numba is missing, fails to load or fails to compile
+    the kernel, so the caller can fall back to its Python engine; with
+    required=True those failures are raised instead.
+    """
+    total_slots = int(max_time)
+    usage_log = EventLog.for_slots(total_slots)
+    node_timelines = NodeTimeline.empty(num_nodes, total_slots)
+    args = (rng, spawn_stream(rng), num_nodes, float(tx_time), float(gen_prob), flag,
+            usage_log.code, usage_log.node, node_timelines.states)
+    if not compile:
+        success_count, collision_count = kernel(*args)
+    elif kernel in _compiled:
+        success_count, collision_count = _compiled[kernel](*args)
+    else:
+        if kernel in _unusable and not required:
+            return None
+        try:
+            # The first call compiles the kernel
+            success_count, collision_count = compiled(kernel)(*args)
+        except Exception:
+            _compiled.pop(kernel, None)
+            _unusable.add(kernel)
+            if required:
+                raise
+            return None
+    busy_slots = total_slots - usage_log.count(IDLE)
+    efficiency = success_count / total_slots if total_slots else 0
+    throughput = success_count / total_slots if total_slots else 0
+    utilization = busy_slots / total_slots if total_slots else 0
+    return usage_log, success_count, collision_count, efficiency, throughput, utilization, node_timelines
+
+
+def csma_persistence(protocol):
+    """Kernel persistence code of a CSMA_PROTOCOLS name (1-persistent for anything else, as in the engine)."""
+    return CSMA_PROTOCOLS.index(protocol) if protocol in CSMA_PROTOCOLS else ONE_PERSISTENT
+
+
+def csma_ca_rts_cts(variant):
+    return variant == CSMA_CA_VARIANTS[1]
@@ -0,0 +1,77 @@
+"""Process-pool helpers for running independent simulations in parallel."""
+
+import multiprocessing
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+
+from .rng import spawn_seeds
+
+
+def process_pool(max_workers=None):
+    """
+    ProcessPoolExecutor for simulation runs.
+
+    Workers and tasks only reference module-level functions of this
+    package, never functions defined in a page script, so they unpickle
+    under any start method. Linux forks the workers, which starts them
+    fastest; elsewhere, where fork is missing or unsafe (macOS), the pool
+    uses forkserver, or spawn where that is missing too (Windows).
+    """
+    if sys.platform.startswith("linux"):
+        # The Streamlit server is multithreaded and a forked child keeps only
+        # the calling thread, so a lock held by another thread at fork time
+        # stays locked in the child. The workers never take such a lock: they
+        # unpickle a task, run a NumPy engine and pickle the result back,
+        # without touching Streamlit, logging or the server's threads.
+        method = "fork"
+    elif "forkserver" in multiprocessing.get_all_start_methods():
+        method = "forkserver"
+    else:
+        method = "spawn"
+    return ProcessPoolExecutor(max_workers, mp_context=multiprocessing.get_context(method))
+
+
+def run_seeds(root_seed, runs):
+    """Per-run child SeedSequences spawned from root_seed."""
+    return spawn_seeds(root_seed, runs)
+
+
+def run_metrics(task):
+    """
+    Worker for protocol comparisons: task is (engine, args, seed, max_time).
+
+    Returns (efficiency, throughput, utilization) from one engine run.
+    """
+    engine, args, seed, max_time = task
+    _, _, _, efficiency, throughput, utilization, _ = engine(*args, seed=seed, max_time=max_time)
+    return efficiency, throughput, utilization
+
+
+def iter_runs(fn, tasks, max_workers=None, parallel=True, max_pending=None):
+    """
+    Yield (index, fn(task)) for every task, in completion order.
+
+    With parallel=False the tasks run in order in this process, which gives
+    the same results as long as every task carries its own seed. `tasks`
+    may be any iterable; with max_pending set, at most that many tasks are
+    in flight at once, so a lazily generated sweep is never materialised.
+    """
+    if not parallel:
+        for index, task in enumerate(tasks):
+            yield index, fn(task)
+        return
+    with process_pool(max_workers) as pool:
+        if max_pending is None:
+            futures = {pool.submit(fn, task): index for index, task in enumerate(tasks)}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+            return
+        pending = {}
+        for index, task in enumerate(tasks):
+            pending[pool.submit(fn, task)] = index
+            if len(pending) >= max_pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future.result()
+        for future in as_completed(pending):
+            yield pending[future], future.result()
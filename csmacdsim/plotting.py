@@ -0,0 +1,63 @@
+"""Matplotlib renderers for simulator timelines."""
+
+import numpy as np
+from matplotlib.colors import ListedColormap
+
+
+def draw_timeline(ax, timeline, colors, height=0.8, **mesh_kwargs):
+    """
+    Draw a NodeTimeline as a single pcolormesh instead of one bar per cell.
+
+    Row i spans i ± height/2 and slot t spans [t, t + 1), the same geometry
+    as ax.barh(i, 1, left=t, height=height). The gaps between rows are
+    masked so they stay blank. `colors` maps state -> colour and extra
+    keyword arguments (edgecolors, linewidth, ...) go to pcolormesh.
+    """
+    states = timeline.states
+    num_nodes, num_slots = states.shape
+    x_edges = np.arange(timeline.start, timeline.start + num_slots + 1)
+
+    rows = np.arange(num_nodes)
+    y_edges = np.empty(2 * num_nodes)
+    y_edges[0::2] = rows - height / 2
+    y_edges[1::2] = rows + height / 2
+
+    values = np.ma.masked_all((max(2 * num_nodes - 1, 0), num_slots), dtype=np.int8)
+    values[0::2] = states
+
+    cmap = ListedColormap([colors[state] for state in sorted(colors)])
+    mesh_kwargs.setdefault('rasterized', True)
+    return ax.pcolormesh(x_edges, y_edges, values, cmap=cmap,
+                         vmin=-0.5, vmax=len(colors) - 0.5, **mesh_kwargs)
+
+
+class LiveChart:
+    """
+    Running throughput and utilization, redrawn in place while a run progresses.
+
+    The figure and its two lines are created once; update() appends a
+    point, moves the line data and returns the same Figure, so a Streamlit
+    placeholder can re-render it every chunk without allocating a new one.
+    """
+
+    def __init__(self, total_slots, figsize=(12, 3)):
+        import matplotlib.pyplot as plt
+
+        self.fig, self.ax = plt.subplots(figsize=figsize)
+        self.slots, self.throughput, self.utilization = [], [], []
+        (self.throughput_line,) = self.ax.plot([], [], color='#32CD32', label='Throughput so far')
+        (self.utilization_line,) = self.ax.plot([], [], color='#1f77b4', label='Channel utilization so far')
+        self.ax.set_xlim(0, total_slots)
+        self.ax.set_ylim(0, 1)
+        self.ax.set_xlabel('Time Slot')
+        self.ax.grid(alpha=0.3)
+        self.ax.legend(loc='upper right')
+        self.fig.tight_layout()
+
+    def update(self, slots, throughput, utilization):
+        self.slots.append(slots)
+        self.throughput.append(throughput)
+        self.utilization.append(utilization)
+        self.throughput_line.set_data(self.slots, self.throughput)
+        self.utilization_line.set_data(self.slots, self.utilization)
+        return self.fig
@@ -0,0 +1,312 @@
+"""Pure ALOHA engines: tick loop, vectorized engine and collision resolvers."""
+
+import numpy as np
+
+from .rng import make_rng
+from .stats import summarize_replications
+
+# Collision resolution for Pure ALOHA transmissions
+def resolve_collisions_pairwise(all_transmissions):
+    """
+    Reference O(n²) resolver: compare every transmission against every other.
+    
+    Marks the status field of each [node, start, end, status] entry in place
+    and returns (successful, collisions). Kept for equivalence checks against
+    resolve_collisions_sweep.
+    """
+    successful = 0
+    collisions = 0
+    for i, trans_i in enumerate(all_transmissions):
+        node_i, start_i, end_i, _ = trans_i
+        has_collision = False
+        
+        # Check overlap with other transmissions
+        for j, trans_j in enumerate(all_transmissions):
+            if i == j:
+                continue
+            node_j, start_j, end_j, _ = trans_j
+            
+            # Check if transmissions overlap
+            if not (end_i <= start_j or end_j <= start_i):
+                has_collision = True
+                break
+        
+        if has_collision:
+            all_transmissions[i][3] = "Collision"
+            collisions += 1
+        else:
+            all_transmissions[i][3] = "Success"
+            successful += 1
+    
+    return successful, collisions
+
+def sweep_collision_mask(starts, ends):
+    """
+    Boolean collision mask for transmissions given as start/end arrays.
+    
+    Transmissions are sorted by start time. A transmission collides with an
+    earlier one if its start is before the running maximum end of everything
+    sorted before it, and with a later one if the next start (the smallest
+    later start) is before its own end.
+    """
+    n = len(starts)
+    collided = np.zeros(n, dtype=bool)
+    if n == 0:
+        return collided
+    
+    order = np.argsort(starts, kind='stable')
+    sorted_starts = starts[order]
+    sorted_ends = ends[order]
+    
+    collided_sorted = np.zeros(n, dtype=bool)
+    # Overlap with an earlier transmission: running max end of predecessors
+    prev_max_end = np.maximum.accumulate(sorted_ends)[:-1]
+    collided_sorted[1:] |= sorted_starts[1:] < prev_max_end
+    # Overlap with a later transmission: the next start is the smallest later start
+    collided_sorted[:-1] |= sorted_starts[1:] < sorted_ends[:-1]
+    
+    collided[order] = collided_sorted
+    return collided
+
+def resolve_collisions_sweep(all_transmissions):
+    """
+    O(n log n) resolver giving the same outcomes as resolve_collisions_pairwise.
+    """
+    n = len(all_transmissions)
+    if n == 0:
+        return 0, 0
+    
+    starts = np.fromiter((trans[1] for trans in all_transmissions), dtype=np.int64, count=n)
+    ends = np.fromiter((trans[2] for trans in all_transmissions), dtype=np.int64, count=n)
+    collided = sweep_collision_mask(starts, ends)
+    for trans, has_collision in zip(all_transmissions, collided):
+        trans[3] = "Collision" if has_collision else "Success"
+    
+    collisions = int(collided.sum())
+    return n - collisions, collisions
+
+def pure_aloha_statistics(num_nodes, p, num_time_units, successful_transmissions, collisions,
+                          idle_time_units, total_transmissions):
+    """Summary statistics shared by the Pure ALOHA engines"""
+    # Calculate throughput (successful transmissions per time unit)
+    throughput = successful_transmissions / num_time_units
+    
+    # Theoretical maximum throughput for Pure ALOHA is 1/(2e) ≈ 0.184
+    theoretical_max = 1 / (2 * np.e)
+    
+    # Calculate offered load (G = N * p)
+    offered_load = num_nodes * p
+    
+    statistics = {
+        "successful": successful_transmissions,
+        "collisions": collisions,
+        "idle": idle_time_units,
+        "throughput": throughput,
+        "theoretical_max": theoretical_max,
+        "offered_load": offered_load,
+        "efficiency": (throughput / theoretical_max) * 100,
+        "total_transmissions": total_transmissions
+    }
+    
+    return statistics
+
+# Pure ALOHA simulation logic
+def simulate_pure_aloha(num_nodes, p, num_time_units, packet_duration, resolver=None, seed=None):
+    """
+    Simulate Pure ALOHA protocol
+    
+    In Pure ALOHA, nodes can transmit at any time. A collision occurs if
+    any part of a packet overlaps with another packet.
+    
+    Returns:
+    - time_units_data: List of tuples (time_unit, active_transmissions, status)
+    - node_transmissions: Dict tracking transmission periods for each node
+    - statistics: Dictionary with overall statistics
+    
+    `resolver` decides Success/Collision for the collected transmissions and
+    defaults to the O(n log n) sweep in resolve_collisions_sweep.
+    """
+    if resolver is None:
+        resolver = resolve_collisions_sweep
+    rng = make_rng(seed)
+    
+    # Track ongoing transmissions: {node_id: end_time}
+    active_transmissions = {}
+    
+    # Track all transmission events
+    all_transmissions = []  # (node_id, start_time, end_time, success/collision)
+    
+    time_units_data = []
+    node_transmissions = {i: [] for i in range(num_nodes)}
+    
+    idle_time_units = 0
+    
+    for t in range(num_time_units):
+        # Clean up completed transmissions
+        completed_nodes = [node for node, end_time in active_transmissions.items() if end_time <= t]
+        for node in completed_nodes:
+            del active_transmissions[node]
+        
+        # Each node decides to transmit with probability p (if not already transmitting)
+        for node in range(num_nodes):
+            if node not in active_transmissions and rng.random() < p:
+                # Node attempts to transmit
+                end_time = t + packet_duration
+                active_transmissions[node] = end_time
+                all_transmissions.append([node, t, end_time, None])  # Status to be determined
+        
+        # Check current status
+        num_active = len(active_transmissions)
+        
+        if num_active == 0:
+            status = "Idle"
+            idle_time_units += 1
+        elif num_active == 1:
+            status = "Transmitting"
+        else:
+            status = "Collision"
+        
+        time_units_data.append((t, num_active, status))
+    
+    # Determine success/collision for each transmission
+    successful_transmissions, collisions = resolver(all_transmissions)
+    for node_i, start_i, end_i, status in all_transmissions:
+        node_transmissions[node_i].append((start_i, end_i, status))
+    
+    statistics = pure_aloha_statistics(
+        num_nodes, p, num_time_units, successful_transmissions, collisions,
+        idle_time_units, len(all_transmissions)
+    )
+    
+    return time_units_data, node_transmissions, statistics, all_transmissions
+
+def attempt_batch(p, num_time_units, packet_duration):
+    """Gap columns drawn per node at a time: the expected attempts in num_time_units, with headroom."""
+    if p <= 0:
+        return 0
+    cycle = packet_duration - 1 + 1 / p
+    return int(num_time_units / cycle * 1.1) + 16
+
+def geometric_attempt_times(rng, num_rows, p, num_time_units, packet_duration, batch):
+    """
+    (row, start) of every attempt before num_time_units, one node per row,
+    from geometric gaps drawn batch columns at a time (see
+    simulate_pure_aloha_vectorized). Empty when p <= 0: nodes never attempt.
+    """
+    if p <= 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    gaps = rng.geometric(p, size=(num_rows, batch))
+    gaps[:, 1:] += packet_duration - 1
+    attempt_times = np.cumsum(gaps, axis=1) - 1
+    while attempt_times[:, -1].min() < num_time_units:
+        gaps = rng.geometric(p, size=(num_rows, batch)) + packet_duration - 1
+        more_times = attempt_times[:, -1:] + np.cumsum(gaps, axis=1)
+        attempt_times = np.hstack([attempt_times, more_times])
+    rows, attempt_idx = np.nonzero(attempt_times < num_time_units)
+    return rows, attempt_times[rows, attempt_idx]
+
+def simulate_pure_aloha_vectorized(num_nodes, p, num_time_units, packet_duration, seed=None):
+    """
+    Vectorized Pure ALOHA engine with the same outputs as simulate_pure_aloha
+    
+    An idle node attempts with probability p in each time unit, so the wait
+    until its next attempt is geometric, and after an attempt it is busy for
+    packet_duration units. Attempt times are therefore the cumulative sum of
+    a (nodes × attempts) matrix of gaps drawn in one call, which respects the
+    busy window without stepping through time units one by one.
+    """
+    rng = make_rng(seed)
+    node_ids, starts = geometric_attempt_times(
+        rng, num_nodes, p, num_time_units, packet_duration, attempt_batch(p, num_time_units, packet_duration))
+    
+    # Ordered by start time then node like the tick loop
+    order = np.lexsort((node_ids, starts))
+    node_ids = node_ids[order]
+    starts = starts[order]
+    ends = starts + packet_duration
+    collided = sweep_collision_mask(starts, ends)
+    
+    # Active transmissions per time unit from start/end counts
+    active = np.cumsum(
+        np.bincount(starts, minlength=num_time_units + 1)
+        - np.bincount(np.minimum(ends, num_time_units), minlength=num_time_units + 1)
+    )[:num_time_units]
+    status_labels = np.array(["Idle", "Transmitting", "Collision"])
+    time_units_data = list(zip(range(num_time_units), active.tolist(),
+                               status_labels[np.minimum(active, 2)].tolist()))
+    
+    outcome_labels = np.where(collided, "Collision", "Success").tolist()
+    all_transmissions = list(map(list, zip(node_ids.tolist(), starts.tolist(),
+                                           ends.tolist(), outcome_labels)))
+    node_transmissions = {i: [] for i in range(num_nodes)}
+    for node_i, start_i, end_i, status in all_transmissions:
+        node_transmissions[node_i].append((start_i, end_i, status))
+    
+    collisions = int(collided.sum())
+    statistics = pure_aloha_statistics(
+        num_nodes, p, num_time_units, len(all_transmissions) - collisions, collisions,
+        int(np.count_nonzero(active == 0)), len(all_transmissions)
+    )
+    
+    return time_units_data, node_transmissions, statistics, all_transmissions
+
+def replicate_pure_aloha(num_nodes, p, num_time_units, packet_duration, replications, seed=None,
+                         confidence=0.95, chunk_cells=2**22):
+    """
+    Run `replications` independent Pure ALOHA runs as one batched array pass.
+
+    Uses the geometric-gap construction of simulate_pure_aloha_vectorized
+    with one row per (replication, node). Each replication is shifted onto
+    its own stretch of a shared time axis, so a single sort and collision
+    sweep handles the whole chunk. Chunks hold at most chunk_cells gap
+    cells, and idle time comes from the merged attempt intervals rather
+    than a per-time-unit array, so memory is bounded by chunk_cells
+    whatever num_time_units is. Results are reproducible for a given seed
+    and chunk size.
+
+    Returns (per_replication, summary) like replicate_slotted_aloha, with
+    total_transmissions added to the per-replication metrics.
+    """
+    rng = make_rng(seed)
+    successful = np.zeros(replications, dtype=np.int64)
+    collisions = np.zeros(replications, dtype=np.int64)
+    idle = np.zeros(replications, dtype=np.int64)
+    batch = attempt_batch(p, num_time_units, packet_duration)
+    reps_per_chunk = max(1, chunk_cells // (num_nodes * max(batch, 1)))
+    # Replications never overlap on the shared axis: ends are below T + D
+    stride = num_time_units + packet_duration
+
+    for first in range(0, replications, reps_per_chunk):
+        reps = min(reps_per_chunk, replications - first)
+        rows, starts = geometric_attempt_times(rng, reps * num_nodes, p, num_time_units, packet_duration, batch)
+        rep_ids = rows // num_nodes
+        starts = starts + rep_ids * stride
+        ends = starts + packet_duration
+        collided = sweep_collision_mask(starts, ends)
+
+        total = np.bincount(rep_ids, minlength=reps)
+        collisions[first:first + reps] = np.bincount(rep_ids[collided], minlength=reps)
+        successful[first:first + reps] = total - collisions[first:first + reps]
+        # Busy time per replication as the merged length of the sorted
+        # intervals, so no array spans the time axis
+        order = np.argsort(starts, kind="stable")
+        sorted_starts = starts[order]
+        sorted_ends = np.minimum(ends, rep_ids * stride + num_time_units)[order]
+        covered = np.maximum.accumulate(np.concatenate([[-1], sorted_ends]))[:-1]
+        new_time = np.maximum(sorted_ends - np.maximum(sorted_starts, covered), 0)
+        busy = np.bincount(rep_ids[order], weights=new_time, minlength=reps)
+        idle[first:first + reps] = num_time_units - busy.astype(np.int64)
+
+    per_replication = {
+        "successful": successful,
+        "collisions": collisions,
+        "idle": idle,
+        "throughput": successful / num_time_units,
+        "total_transmissions": successful + collisions,
+    }
+    return per_replication, summarize_replications(per_replication, confidence)
+
+# Theoretical throughput curve
+def get_theoretical_throughput(G_values):
+    """Calculate theoretical throughput for Pure ALOHA: S = G * e^(-2G)"""
+    return G_values * np.exp(-2 * G_values)
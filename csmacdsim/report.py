@@ -0,0 +1,66 @@
+"""DOCX report builder used by the Download page."""
+
+import io
+from datetime import datetime
+
+from docx import Document
+from docx.shared import Inches
+
+
+def add_sim_section(doc, name, data, plot=None, plot_title=None):
+    """
+    Append one simulation to `doc`: its parameters and metrics, the first
+    20 event-log rows, a per-node summary when data has a node_timeline,
+    and the PNG in `plot` (bytes or a file-like object) under plot_title.
+    """
+    doc.add_page_break()
+    doc.add_heading(f"{name} Simulation", level=1)
+    doc.add_heading("Parameters & Metrics", level=2)
+    for k, v in data.items():
+        if k not in ("event_log", "node_timeline"):
+            doc.add_paragraph(f"{k.replace('_',' ').title()}: {v}")
+    doc.add_heading("Event Log (First 20 Rows)", level=2)
+    df = data["event_log"].head(20)
+    t = doc.add_table(rows=1, cols=len(df.columns))
+    hdr_cells = t.rows[0].cells
+    for i, c in enumerate(df.columns):
+        hdr_cells[i].text = c
+    for _, row in df.iterrows():
+        row_cells = t.add_row().cells
+        for i, val in enumerate(row):
+            row_cells[i].text = str(val)
+    if "node_timeline" in data:
+        doc.add_heading("Node Activity Summary", level=2)
+        counts = data["node_timeline"].state_counts()
+        t = doc.add_table(rows=1, cols=3)
+        for i, c in enumerate(["Node", "Successful Slots", "Collision Slots"]):
+            t.rows[0].cells[i].text = c
+        for node, (_, node_success, node_collisions) in enumerate(counts.tolist()):
+            row_cells = t.add_row().cells
+            row_cells[0].text = f"Node {node}"
+            row_cells[1].text = str(node_success)
+            row_cells[2].text = str(node_collisions)
+    if plot is not None:
+        if isinstance(plot, bytes):
+            plot = io.BytesIO(plot)
+        plot.seek(0)
+        doc.add_heading(plot_title, level=2)
+        doc.add_picture(plot, width=Inches(6))
+
+
+def build_report(sections, generated_on=None):
+    """
+    Network Protocol Simulation Report with one add_sim_section per
+    (name, data, plot, plot_title) tuple, saved to a rewound BytesIO.
+    """
+    doc = Document()
+    doc.add_heading("Network Protocol Simulation Report", level=1)
+    generated_on = generated_on or datetime.now()
+    doc.add_paragraph(f"Generated on: {generated_on.strftime('%Y-%m-%d %H:%M:%S')}")
+    for name, data, plot, plot_title in sections:
+        add_sim_section(doc, name, data, plot, plot_title)
+
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    buffer.seek(0)
+    return buffer
@@ -0,0 +1,114 @@
+"""Random streams for the simulators.
+
+Engines never touch numpy's global random state. Every engine takes a
+`seed` that may be None, an int, a SeedSequence or a ready Generator and
+draws all of its randomness from make_rng(seed). Batched and parallel
+runs get independent child streams from spawn_seeds().
+"""
+
+import heapq
+import math
+
+import numpy as np
+
+
+def make_rng(seed=None):
+    """Generator for `seed`; an existing Generator is returned unchanged."""
+    return np.random.default_rng(seed)
+
+
+def spawn_seeds(root_seed, n):
+    """n independent child SeedSequences of root_seed (int or SeedSequence)."""
+    if not isinstance(root_seed, np.random.SeedSequence):
+        root_seed = np.random.SeedSequence(root_seed)
+    return root_seed.spawn(n)
+
+
+def fresh_seed():
+    """New root seed from OS entropy, small enough to show and type back in."""
+    return int(np.random.SeedSequence().generate_state(1)[0])
+
+
+# How the slotted engines draw per-slot Bernoulli events: one draw per node
+# per slot, or the geometric gap to each node's next event
+SAMPLING_MODES = ["per-slot", "geometric"]
+
+
+def check_sampling(sampling):
+    if sampling not in SAMPLING_MODES:
+        raise ValueError(f"unknown sampling mode {sampling!r}")
+
+
+class GeometricArrivals:
+    """
+    Packet arrivals of the nodes without a waiting packet, kept in a min-heap.
+
+    With an arrival in each slot with probability prob, the slot of a
+    node's next arrival is its current slot plus a geometric gap, so an
+    engine can jump straight to the next arrival instead of drawing every
+    node in every slot.
+    """
+
+    def __init__(self, rng, prob, num_nodes):
+        self.rng = rng
+        self.prob = prob
+        self.heap = []
+        if prob > 0:
+            first = rng.geometric(prob, size=num_nodes) - 1
+            self.heap = sorted(zip(first.tolist(), range(num_nodes)))
+
+    def schedule(self, node, after_slot):
+        """Draw the next arrival of `node`, in a slot after after_slot."""
+        if self.prob > 0:
+            heapq.heappush(self.heap, (after_slot + int(self.rng.geometric(self.prob)), node))
+
+    def next_slot(self):
+        return self.heap[0][0] if self.heap else math.inf
+
+    def pop_before(self, stop):
+        """(slot, node) of the arrivals before slot `stop`, in slot order."""
+        arrived = []
+        while self.heap and self.heap[0][0] < stop:
+            arrived.append(heapq.heappop(self.heap))
+        return arrived
+
+
+class ArrivalBlocks:
+    """
+    Per-slot Bernoulli arrivals pre-drawn as boolean (block_slots, nodes) matrices.
+
+    An engine takes the rows of the slots it steps through with take(),
+    so arrivals cost one rng.random call per block_slots slots instead of
+    one per slot. Rows come out in order whatever the take() sizes are, so
+    jumping over a busy period consumes the same arrivals as stepping
+    through it. Give the engine's other draws their own stream (see
+    spawn_stream), or they would depend on how far ahead a block is drawn.
+    """
+
+    def __init__(self, rng, prob, num_nodes, block_slots=256):
+        self.rng = rng
+        self.prob = prob
+        self.num_nodes = num_nodes
+        self.block_slots = block_slots
+        self.block = np.zeros((0, num_nodes), dtype=bool)
+        self.pos = 0
+
+    def take(self, slots=1):
+        """Arrivals of the next `slots` slots, a (slots, nodes) boolean array."""
+        rows = self.block[self.pos:self.pos + slots]
+        self.pos += len(rows)
+        if len(rows) == slots:
+            return rows
+        parts = [rows]
+        needed = slots - len(rows)
+        while needed > 0:
+            self.block = self.rng.random((self.block_slots, self.num_nodes)) < self.prob
+            self.pos = min(needed, self.block_slots)
+            parts.append(self.block[:self.pos])
+            needed -= self.pos
+        return np.concatenate(parts)
+
+
+def spawn_stream(rng):
+    """Independent child Generator of rng, for draws that must not shift rng's own stream."""
+    return rng.spawn(1)[0]
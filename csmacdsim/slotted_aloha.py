@@ -0,0 +1,196 @@
+"""Slotted ALOHA engines: per-slot loop, vectorized attempt matrix and statistics-only counts."""
+
+import numpy as np
+
+from .rng import check_sampling, make_rng
+from .stats import summarize_replications
+from .timeline import NodeTimeline
+
+def slotted_aloha_statistics(num_nodes, p, num_slots, successful_transmissions, collisions, idle_slots):
+    """Summary statistics shared by the Slotted ALOHA engines"""
+    throughput = successful_transmissions / num_slots
+    theoretical_max = 1 / np.e
+    return {
+        "successful": successful_transmissions,
+        "collisions": collisions,
+        "idle": idle_slots,
+        "throughput": throughput,
+        "theoretical_max": theoretical_max,
+        "offered_load": num_nodes * p,
+        "efficiency": (throughput / theoretical_max) * 100
+    }
+
+# Slotted ALOHA simulation logic
+def simulate_slotted_aloha(num_nodes, p, num_slots, seed=None):
+    rng = make_rng(seed)
+    slots_data = []
+    node_transmissions = NodeTimeline.empty(num_nodes, num_slots)
+    successful_transmissions = 0
+    collisions = 0
+    idle_slots = 0
+
+    for slot in range(num_slots):
+        transmitting_nodes = rng.random(num_nodes) < p
+        num_transmissions = np.sum(transmitting_nodes)
+
+        if num_transmissions == 0:
+            status = "Idle"
+            idle_slots += 1
+        elif num_transmissions == 1:
+            status = "Success"
+            successful_transmissions += 1
+            node_transmissions.states[transmitting_nodes, slot] = 1
+        else:
+            status = "Collision"
+            collisions += 1
+            node_transmissions.states[transmitting_nodes, slot] = 2
+
+        slots_data.append((slot, num_transmissions, status))
+
+    stats = slotted_aloha_statistics(num_nodes, p, num_slots, successful_transmissions, collisions, idle_slots)
+
+    return slots_data, node_transmissions, stats
+
+def geometric_attempt_slots(rng, num_nodes, p, num_slots):
+    """
+    (node, slot) of every attempt, drawn as per-node geometric gaps between
+    attempts instead of one Bernoulli per node per slot; the work grows
+    with the number of attempts rather than with num_nodes * num_slots.
+    """
+    if p <= 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    batch = int(num_slots * p * 1.1) + 16
+    times = np.cumsum(rng.geometric(p, size=(num_nodes, batch)), axis=1) - 1
+    while times[:, -1].min() < num_slots:
+        gaps = rng.geometric(p, size=(num_nodes, batch))
+        times = np.hstack([times, times[:, -1:] + np.cumsum(gaps, axis=1)])
+    node_ids, attempt_idx = np.nonzero(times < num_slots)
+    return node_ids, times[node_ids, attempt_idx]
+
+def simulate_slotted_aloha_vectorized(num_nodes, p, num_slots, seed=None, on_chunk=None, chunk_slots=100,
+                                      sampling="per-slot"):
+    """
+    Vectorized Slotted ALOHA: one (slots, nodes) attempt matrix for the whole run.
+
+    Returns the per-slot transmission counts, a NodeTimeline over the int8
+    (nodes, slots) state matrix (0 idle, 1 success, 2 collision) and the
+    same stats as simulate_slotted_aloha (identical for the same seed).
+    With on_chunk set, the matrix is filled chunk_slots rows at a time and
+    on_chunk receives the stats so far after each chunk; the draws are in
+    the same order, so the results do not change.
+
+    sampling="geometric" draws the attempts with geometric_attempt_slots,
+    which is much faster at small p but uses a different random stream;
+    on_chunk then gets the same per-chunk stats once the run is drawn.
+    """
+    check_sampling(sampling)
+    rng = make_rng(seed)
+    if sampling == "geometric":
+        node_ids, attempt_slots = geometric_attempt_slots(rng, num_nodes, p, num_slots)
+        slot_counts = np.bincount(attempt_slots, minlength=num_slots)
+        slot_status = np.minimum(slot_counts, 2).astype(np.int8)
+        states = np.zeros((num_nodes, num_slots), dtype=np.int8)
+        states[node_ids, attempt_slots] = slot_status[attempt_slots]
+        if on_chunk is not None:
+            successful = np.cumsum(slot_status == 1)
+            collisions = np.cumsum(slot_status == 2)
+            for done in range(chunk_slots, num_slots + chunk_slots, chunk_slots):
+                done = min(done, num_slots)
+                s, c = int(successful[done - 1]), int(collisions[done - 1])
+                on_chunk(slotted_aloha_statistics(num_nodes, p, done, s, c, done - s - c))
+        return slot_counts, NodeTimeline(states), _slotted_aloha_stats(num_nodes, p, num_slots, slot_status)
+    if on_chunk is None:
+        attempts = rng.random((num_slots, num_nodes)) < p
+    else:
+        attempts = np.empty((num_slots, num_nodes), dtype=bool)
+        successful = collisions = 0
+        for first in range(0, num_slots, chunk_slots):
+            chunk = attempts[first:first + chunk_slots]
+            chunk[:] = rng.random(chunk.shape) < p
+            counts = chunk.sum(axis=1)
+            successful += int(np.count_nonzero(counts == 1))
+            collisions += int(np.count_nonzero(counts >= 2))
+            done = first + len(chunk)
+            on_chunk(slotted_aloha_statistics(num_nodes, p, done, successful, collisions,
+                                              done - successful - collisions))
+    slot_counts = attempts.sum(axis=1)
+    slot_status = np.minimum(slot_counts, 2).astype(np.int8)
+    node_transmissions = NodeTimeline(np.ascontiguousarray((attempts * slot_status[:, None]).T))
+
+    return slot_counts, node_transmissions, _slotted_aloha_stats(num_nodes, p, num_slots, slot_status)
+
+def _slotted_aloha_stats(num_nodes, p, num_slots, slot_status):
+    successful_transmissions = int(np.count_nonzero(slot_status == 1))
+    collisions = int(np.count_nonzero(slot_status == 2))
+    idle_slots = num_slots - successful_transmissions - collisions
+    return slotted_aloha_statistics(num_nodes, p, num_slots, successful_transmissions, collisions, idle_slots)
+
+def simulate_slotted_aloha_stats(num_nodes, p, num_slots, seed=None, chunk_slots=2**20, on_chunk=None):
+    """
+    Statistics-only Slotted ALOHA, without per-node decisions or a timeline.
+
+    The number of transmitters in a slot is Binomial(num_nodes, p), so each
+    chunk of slots is a single rng.binomial call classified as idle (0),
+    success (1) or collision (2+). The run costs O(num_slots) time and
+    O(chunk_slots) memory, which makes 1e8-slot checks of S = G e^-G
+    practical. Returns the same stats dict as the other engines; on_chunk
+    receives the stats so far after every chunk.
+    """
+    rng = make_rng(seed)
+    successful_transmissions = collisions = 0
+    for first in range(0, num_slots, chunk_slots):
+        counts = rng.binomial(num_nodes, p, size=min(chunk_slots, num_slots - first))
+        successful_transmissions += int(np.count_nonzero(counts == 1))
+        collisions += int(np.count_nonzero(counts >= 2))
+        if on_chunk is not None:
+            done = first + len(counts)
+            on_chunk(slotted_aloha_statistics(num_nodes, p, done, successful_transmissions, collisions,
+                                              done - successful_transmissions - collisions))
+    idle_slots = num_slots - successful_transmissions - collisions
+    return slotted_aloha_statistics(num_nodes, p, num_slots, successful_transmissions, collisions, idle_slots)
+
+def get_theoretical_throughput(G_values):
+    return G_values * np.exp(-G_values)
+
+def replicate_slotted_aloha(num_nodes, p, num_slots, replications, seed=None, confidence=0.95,
+                            chunk_cells=2**22):
+    """
+    Run `replications` independent Slotted ALOHA runs as one batched array pass.
+
+    Attempts are drawn as a (replications, slots, nodes) matrix, in chunks
+    of at most chunk_cells cells (whole replications, or slot ranges of a
+    single replication when one does not fit). Draws follow the same stream
+    order whatever the chunk size, so results only depend on the seed, and
+    replication 0 is the run simulate_slotted_aloha_vectorized makes with it.
+
+    Returns (per_replication, summary): per_replication maps successful,
+    collisions, idle and throughput to arrays of length `replications`, and
+    summary gives mean and confidence interval of each.
+    """
+    rng = make_rng(seed)
+    successful = np.zeros(replications, dtype=np.int64)
+    collisions = np.zeros(replications, dtype=np.int64)
+    run_cells = num_slots * num_nodes
+    if run_cells <= chunk_cells:
+        reps_per_chunk = max(1, chunk_cells // max(run_cells, 1))
+        for first in range(0, replications, reps_per_chunk):
+            reps = min(reps_per_chunk, replications - first)
+            slot_counts = (rng.random((reps, num_slots, num_nodes)) < p).sum(axis=2)
+            successful[first:first + reps] = np.count_nonzero(slot_counts == 1, axis=1)
+            collisions[first:first + reps] = np.count_nonzero(slot_counts >= 2, axis=1)
+    else:
+        slots_per_chunk = max(1, chunk_cells // num_nodes)
+        for rep in range(replications):
+            for first in range(0, num_slots, slots_per_chunk):
+                slots = min(slots_per_chunk, num_slots - first)
+                slot_counts = (rng.random((slots, num_nodes)) < p).sum(axis=1)
+                successful[rep] += np.count_nonzero(slot_counts == 1)
+                collisions[rep] += np.count_nonzero(slot_counts >= 2)
+
+    per_replication = {
+        "successful": successful,
+        "collisions": collisions,
+        "idle": num_slots - successful - collisions,
+        "throughput": successful / num_slots,
+    }
+    return per_replication, summarize_replications(per_replication, confidence)
@@ -0,0 +1,29 @@
+"""Summary statistics over Monte-Carlo replications."""
+
+from statistics import NormalDist
+
+import numpy as np
+
+
+def summarize_replications(per_replication, confidence=0.95):
+    """
+    Mean and confidence interval for every metric in `per_replication`.
+
+    `per_replication` maps metric -> array with one value per replication.
+    The interval is the normal approximation mean ± z * s / sqrt(R), which
+    is what the hundreds of replications these are meant for justify; with
+    a single replication the interval collapses to the mean.
+    """
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    summary = {}
+    for metric, values in per_replication.items():
+        values = np.asarray(values, dtype=float)
+        mean = float(values.mean())
+        half_width = float(z * values.std(ddof=1) / np.sqrt(len(values))) if len(values) > 1 else 0.0
+        summary[metric] = {
+            "mean": mean,
+            "ci_low": mean - half_width,
+            "ci_high": mean + half_width,
+            "half_width": half_width,
+        }
+    return summary
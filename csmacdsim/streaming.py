@@ -0,0 +1,248 @@
+"""
+Streaming runners: engines run in fixed-size chunks with bounded memory.
+
+Instead of materialising per-slot logs and full timelines, each runner
+keeps running counts, a fixed window of the first slots for plotting,
+and can spill events to a CSV file chunk by chunk. on_chunk(stats) is
+called after every chunk with the statistics so far, which makes very
+long ALOHA runs (1e8 slots) feasible and observable. stream_csma bounds
+memory the same way but still steps one slot at a time in Python.
+"""
+
+import csv
+
+import numpy as np
+
+from .csma import csma_progress, iter_csma_slots
+from .eventlog import event_label
+from .pure_aloha import attempt_batch, pure_aloha_statistics
+from .rng import make_rng
+from .slotted_aloha import slotted_aloha_statistics
+from .timeline import COLLISION, IDLE, SUCCESS, NodeTimeline
+
+
+class EventSpill:
+    """Appends event rows to a CSV file; a no-op when path is None."""
+
+    def __init__(self, path, header):
+        self.file = open(path, "w", newline="") if path is not None else None
+        if self.file is not None:
+            self.writer = csv.writer(self.file)
+            self.writer.writerow(header)
+
+    def write(self, rows):
+        if self.file is not None:
+            self.writer.writerows(rows)
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+
+
+def stream_slotted_aloha(num_nodes, p, num_slots, seed=None, chunk_slots=2**16, window_slots=100,
+                         spill_path=None, on_chunk=None):
+    """
+    Slotted ALOHA in chunks of chunk_slots slots.
+
+    Attempts are drawn in the same order as simulate_slotted_aloha_vectorized,
+    so the statistics are identical for the same seed. Non-idle slots are
+    spilled as (Slot, Num Transmissions, Status) rows. Returns (stats,
+    window) where window is the NodeTimeline of the first window_slots slots.
+    """
+    rng = make_rng(seed)
+    status_labels = np.array(["Idle", "Success", "Collision"])
+    window = NodeTimeline.empty(num_nodes, min(window_slots, num_slots))
+    spill = EventSpill(spill_path, ["Slot", "Num Transmissions", "Status"])
+    successful = collisions = 0
+    try:
+        for first in range(0, num_slots, chunk_slots):
+            slots = min(chunk_slots, num_slots - first)
+            attempts = rng.random((slots, num_nodes)) < p
+            slot_counts = attempts.sum(axis=1)
+            slot_status = np.minimum(slot_counts, 2)
+            successful += int(np.count_nonzero(slot_status == 1))
+            collisions += int(np.count_nonzero(slot_status == 2))
+
+            if first < window.num_slots:
+                keep = min(window.num_slots - first, slots)
+                window.states[:, first:first + keep] = (attempts[:keep] * slot_status[:keep, None]).T
+            if spill_path is not None:
+                busy = np.flatnonzero(slot_counts)
+                spill.write(zip((busy + first).tolist(), slot_counts[busy].tolist(),
+                                status_labels[slot_status[busy]].tolist()))
+
+            if on_chunk is not None:
+                done = first + slots
+                on_chunk(slotted_aloha_statistics(num_nodes, p, done, successful, collisions,
+                                                  done - successful - collisions))
+    finally:
+        spill.close()
+    stats = slotted_aloha_statistics(num_nodes, p, num_slots, successful, collisions,
+                                     num_slots - successful - collisions)
+    return stats, window
+
+
+def iter_pure_aloha_chunks(num_nodes, p, num_time_units, packet_duration, seed=None, chunk_units=2**16):
+    """
+    Run the Pure ALOHA model in chunks of chunk_units time units.
+
+    Same model as simulate_pure_aloha_vectorized, with each node's next
+    attempt time carried across chunks. Attempts arrive sorted by start
+    time, so the collision sweep only has to carry the running maximum end
+    and the last attempt (whose successor is not drawn yet) into the next
+    chunk. Yields (stop, node_ids, starts, ends, collided, idle, attempts)
+    per chunk: the transmissions settled so far in start order, plus the
+    idle time units and attempts of the chunk ending at `stop`. The draws
+    depend on chunk_units, so a run is reproduced by its seed and chunk size.
+    """
+    rng = make_rng(seed)
+    if p <= 0:
+        # Nodes never attempt: every time unit is idle
+        empty = np.zeros(0, dtype=np.int64)
+        for first in range(0, num_time_units, chunk_units):
+            stop = min(first + chunk_units, num_time_units)
+            yield stop, empty, empty, empty, np.zeros(0, dtype=bool), stop - first, 0
+        return
+    batch = attempt_batch(p, chunk_units, packet_duration)
+
+    next_times = rng.geometric(p, size=num_nodes) - 1
+    # Attempt left open at the end of the previous chunk: (node, start, end, hit_earlier)
+    carry = None
+    prev_max_end = -1
+    # Transmissions still active when the previous chunk ended, by end time
+    pending_ends = np.zeros(0, dtype=np.int64)
+
+    for first in range(0, num_time_units, chunk_units):
+        stop = min(first + chunk_units, num_time_units)
+        # Attempts of every node in [first, stop)
+        gaps = rng.geometric(p, size=(num_nodes, batch)) + packet_duration - 1
+        times = np.hstack([next_times[:, None], next_times[:, None] + np.cumsum(gaps, axis=1)])
+        while times[:, -1].min() < stop:
+            gaps = rng.geometric(p, size=(num_nodes, batch)) + packet_duration - 1
+            times = np.hstack([times, times[:, -1:] + np.cumsum(gaps, axis=1)])
+        inside = times < stop
+        next_times = times[np.arange(num_nodes), inside.sum(axis=1)]
+        node_ids, attempt_idx = np.nonzero(inside)
+        starts = times[node_ids, attempt_idx]
+        order = np.lexsort((node_ids, starts))
+        node_ids = node_ids[order]
+        starts = starts[order]
+        ends = starts + packet_duration
+        attempts = len(starts)
+
+        # Idle time units from start/end counts, carrying active transmissions over
+        length = stop - first
+        all_ends = np.concatenate([pending_ends, np.minimum(ends, num_time_units)])
+        ending = all_ends[all_ends <= stop]
+        active = len(pending_ends) + np.cumsum(
+            np.bincount(starts - first, minlength=length + 1)
+            - np.bincount(ending - first, minlength=length + 1)
+        )[:length]
+        idle = int(np.count_nonzero(active == 0))
+        pending_ends = all_ends[all_ends > stop]
+
+        # Collision sweep over [carried attempt] + this chunk's attempts
+        if carry is not None:
+            node_ids = np.concatenate([[carry[0]], node_ids])
+            starts = np.concatenate([[carry[1]], starts])
+            ends = np.concatenate([[carry[2]], ends])
+        if len(starts) == 0:
+            yield stop, node_ids, starts, ends, np.zeros(0, dtype=bool), idle, attempts
+            continue
+        running_max = np.maximum.accumulate(np.concatenate([[prev_max_end], ends]))
+        hit_earlier = starts < running_max[:-1]
+        if carry is not None:
+            hit_earlier[0] = carry[3]
+        hit_later = np.zeros(len(starts), dtype=bool)
+        hit_later[:-1] = starts[1:] < ends[:-1]
+        collided = hit_earlier | hit_later
+        carry = (int(node_ids[-1]), int(starts[-1]), int(ends[-1]), bool(hit_earlier[-1]))
+        prev_max_end = int(running_max[-2])
+        yield stop, node_ids[:-1], starts[:-1], ends[:-1], collided[:-1], idle, attempts
+
+    if carry is not None:
+        node_ids, starts, ends, collided = (np.array([value]) for value in carry)
+        yield num_time_units, node_ids, starts, ends, collided, 0, 0
+
+
+def stream_pure_aloha(num_nodes, p, num_time_units, packet_duration, seed=None, chunk_units=2**16,
+                      window_units=100, spill_path=None, on_chunk=None):
+    """
+    Pure ALOHA in chunks of chunk_units time units (see iter_pure_aloha_chunks).
+
+    Transmissions are spilled as (Node, Start, End, Status) rows. Returns
+    (stats, window) where window holds the [node, start, end, status]
+    entries that start in the first window_units time units.
+    """
+    window = []
+    spill = EventSpill(spill_path, ["Node", "Start", "End", "Status"])
+    successful = collisions = idle = total = 0
+    try:
+        for stop, node_ids, starts, ends, collided, chunk_idle, attempts in iter_pure_aloha_chunks(
+                num_nodes, p, num_time_units, packet_duration, seed=seed, chunk_units=chunk_units):
+            hits = int(np.count_nonzero(collided))
+            collisions += hits
+            successful += len(collided) - hits
+            idle += chunk_idle
+            total += attempts
+            status = np.where(collided, "Collision", "Success")
+            rows = np.flatnonzero(starts < window_units)
+            window.extend(map(list, zip(node_ids[rows].tolist(), starts[rows].tolist(),
+                                        ends[rows].tolist(), status[rows].tolist())))
+            if spill_path is not None:
+                spill.write(zip(node_ids.tolist(), starts.tolist(), ends.tolist(), status.tolist()))
+            if on_chunk is not None:
+                on_chunk(pure_aloha_statistics(num_nodes, p, stop, successful, collisions, idle, total))
+    finally:
+        spill.close()
+    stats = pure_aloha_statistics(num_nodes, p, num_time_units, successful, collisions, idle, total)
+    return stats, window
+
+
+def stream_csma(num_nodes, num_packets, prop_delay, tx_time, gen_prob, protocol, seed=None, max_time=400,
+                chunk_slots=2**16, window_slots=400, spill_path=None, on_chunk=None):
+    """
+    Slotted CSMA / CSMA/CD without the usage log and full node timeline.
+
+    Consumes the same slot stream as simulate_csma, so the counts match it
+    for the same seed. Non-idle usage-log entries are spilled as (Event,
+    Time Slot) rows and on_chunk receives the metrics every chunk_slots
+    slots. Returns (success, collisions, efficiency, throughput,
+    utilization, window) with window the NodeTimeline of the first
+    window_slots slots.
+
+    There is no compiled kernel or geometric path here: the slot loop runs
+    in Python at roughly 10 us per slot, so 1e6 slots take seconds but
+    1e8 slots take the better part of an hour. Use it for bounded memory
+    on runs up to a few million slots; for longer CSMA runs use
+    simulate_csma, which has the Numba kernel and sampling="geometric".
+    """
+    window = NodeTimeline.empty(num_nodes, min(window_slots, int(max_time)))
+    spill = EventSpill(spill_path, ["Event", "Time Slot"])
+    success_count = collision_count = busy_slots = 0
+
+    rows = []
+    try:
+        for t, code, nodes in iter_csma_slots(num_nodes, num_packets, prop_delay, tx_time, gen_prob,
+                                              protocol, seed=seed, max_time=max_time):
+            if code != IDLE:
+                busy_slots += 1
+                if spill_path is not None:
+                    rows.append((event_label(code, nodes[0] if nodes else -1), t))
+            if code == COLLISION:
+                collision_count += 1
+            elif code == SUCCESS:
+                success_count += 1
+            if nodes and t < window.num_slots:
+                window.states[nodes, t] = code
+            if (t + 1) % chunk_slots == 0:
+                spill.write(rows)
+                rows = []
+                if on_chunk is not None:
+                    on_chunk(csma_progress(t + 1, success_count, collision_count, busy_slots))
+        spill.write(rows)
+    finally:
+        spill.close()
+    result = csma_progress(int(max_time), success_count, collision_count, busy_slots)
+    return (success_count, collision_count, result["efficiency"], result["throughput"],
+            result["utilization"], window)
@@ -0,0 +1,182 @@
+"""Parameter sweeps: lazy run grids, a per-run worker and streaming result writers."""
+
+import csv
+import itertools
+
+import numpy as np
+
+from .csma import CSMA_PROTOCOLS, simulate_csma, simulate_csma_events
+from .csma_ca import CSMA_CA_VARIANTS, simulate_csma_ca
+from .pure_aloha import simulate_pure_aloha_vectorized
+from .slotted_aloha import simulate_slotted_aloha_vectorized
+
+ALOHA_PROTOCOLS = ["Pure ALOHA", "Slotted ALOHA"]
+SWEEP_PROTOCOLS = ALOHA_PROTOCOLS + CSMA_PROTOCOLS + CSMA_CA_VARIANTS
+
+# Columns of one result row; parameters that do not apply to a protocol are None
+ROW_FIELDS = ["protocol", "num_nodes", "p", "gen_prob", "tx_time", "root_seed", "replication",
+              "successful", "collisions", "throughput", "efficiency", "utilization"]
+
+
+def check_range(name, values, low, high=None, strict=False):
+    """
+    Raise ValueError unless every value lies in [low, high] (no upper bound
+    when high is None); strict=True also excludes low itself.
+    """
+    for value in values:
+        if value < low or (strict and value == low) or (high is not None and value > high):
+            if high is not None:
+                bound = f"in [{low}, {high}]"
+            else:
+                bound = f"> {low}" if strict else f">= {low}"
+            raise ValueError(f"{name} must be {bound}, got {value}")
+
+
+def sweep_points(protocols, nodes, p_values, gen_probs, tx_times, replications, root_seed,
+                 num_slots=1000, packet_duration=1, num_packets=5, prop_delay=0.0, max_time=400,
+                 csma_engine="slotted", sampling="per-slot"):
+    """
+    Lazily yield one run description (a dict) per grid point and replication.
+
+    ALOHA protocols sweep nodes x p, CSMA and CSMA/CA sweep
+    nodes x gen_prob x tx_time; the unused axes are not multiplied in.
+    Replication r of every point uses child r of SeedSequence(root_seed),
+    so all points see common random numbers, as in the protocol comparisons.
+    sampling is passed to the slotted engines (Slotted ALOHA, slotted CSMA
+    and CSMA/CA); Pure ALOHA and the event-driven engine ignore it.
+
+    The grid is checked up front, so an out-of-range value raises
+    ValueError before any run rather than partway through the sweep.
+    """
+    for protocol in protocols:
+        if protocol not in SWEEP_PROTOCOLS:
+            raise ValueError(f"unknown protocol {protocol!r}")
+    check_range("nodes", nodes, 1)
+    check_range("p", p_values, 0, 1)
+    check_range("gen_prob", gen_probs, 0, 1)
+    check_range("tx_time", tx_times, 0, strict=True)
+    for name, value in [("replications", replications), ("num_slots", num_slots),
+                        ("packet_duration", packet_duration), ("max_time", max_time)]:
+        check_range(name, [value], 1)
+    return _iter_points(protocols, nodes, p_values, gen_probs, tx_times, replications, root_seed, num_slots,
+                        packet_duration, num_packets, prop_delay, max_time, csma_engine, sampling)
+
+
+def _iter_points(protocols, nodes, p_values, gen_probs, tx_times, replications, root_seed, num_slots,
+                 packet_duration, num_packets, prop_delay, max_time, csma_engine, sampling):
+    for protocol in protocols:
+        if protocol in ALOHA_PROTOCOLS:
+            grid = itertools.product(nodes, p_values, [None], [None])
+        else:
+            grid = itertools.product(nodes, [None], gen_probs, tx_times)
+        for (n, p, gen_prob, tx_time), replication in itertools.product(grid, range(replications)):
+            yield {
+                "protocol": protocol, "num_nodes": n, "p": p, "gen_prob": gen_prob,
+                "tx_time": packet_duration if protocol == "Pure ALOHA" else tx_time,
+                "root_seed": root_seed, "replication": replication,
+                "num_slots": num_slots, "num_packets": num_packets, "prop_delay": prop_delay,
+                "max_time": max_time, "csma_engine": csma_engine, "sampling": sampling,
+            }
+
+
+def run_point(point):
+    """
+    Worker for sweeps: run the engine described by `point` and return its result row.
+
+    Efficiency is a ratio, not a percentage: for ALOHA it is throughput
+    over the theoretical maximum, for CSMA it is the engine's own figure.
+    Utilization is the fraction of non-idle slots.
+    """
+    seed = np.random.SeedSequence(point["root_seed"], spawn_key=(point["replication"],))
+    protocol = point["protocol"]
+    n = point["num_nodes"]
+    if protocol in ALOHA_PROTOCOLS:
+        if protocol == "Pure ALOHA":
+            _, _, stats, _ = simulate_pure_aloha_vectorized(
+                n, point["p"], point["num_slots"], point["tx_time"], seed=seed)
+        else:
+            _, _, stats = simulate_slotted_aloha_vectorized(n, point["p"], point["num_slots"], seed=seed,
+                                                            sampling=point["sampling"])
+        success, collisions = stats["successful"], stats["collisions"]
+        throughput = stats["throughput"]
+        efficiency = stats["efficiency"] / 100
+        utilization = 1 - stats["idle"] / point["num_slots"]
+    else:
+        options = {"sampling": point["sampling"]}
+        if protocol in CSMA_CA_VARIANTS:
+            engine = simulate_csma_ca
+        elif point["csma_engine"] == "events":
+            engine, options = simulate_csma_events, {}
+        else:
+            engine = simulate_csma
+        _, success, collisions, efficiency, throughput, utilization, _ = engine(
+            n, point["num_packets"], point["prop_delay"], point["tx_time"], point["gen_prob"],
+            protocol, seed=seed, max_time=point["max_time"], **options)
+
+    row = {field: point[field] for field in ROW_FIELDS[:7]}
+    row.update(successful=int(success), collisions=int(collisions), throughput=float(throughput),
+               efficiency=float(efficiency), utilization=float(utilization))
+    return row
+
+
+class CsvRowWriter:
+    """Writes result rows to CSV as they arrive, flushing after every row."""
+
+    def __init__(self, path):
+        self.file = open(path, "w", newline="")
+        self.writer = csv.DictWriter(self.file, fieldnames=ROW_FIELDS)
+        self.writer.writeheader()
+
+    def write(self, row):
+        self.writer.writerow(row)
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetRowWriter:
+    """
+    Writes result rows to Parquet in row groups of `batch_size` rows.
+
+    Needs pyarrow, which is an optional dependency. Only the current
+    batch is held in memory.
+    """
+
+    def __init__(self, path, batch_size=1000):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise RuntimeError("Parquet output needs pyarrow (pip install pyarrow)") from exc
+        self.pa = pa
+        self.schema = pa.schema([
+            ("protocol", pa.string()), ("num_nodes", pa.int64()), ("p", pa.float64()),
+            ("gen_prob", pa.float64()), ("tx_time", pa.float64()), ("root_seed", pa.int64()),
+            ("replication", pa.int64()), ("successful", pa.int64()), ("collisions", pa.int64()),
+            ("throughput", pa.float64()), ("efficiency", pa.float64()), ("utilization", pa.float64()),
+        ])
+        self.writer = pq.ParquetWriter(path, self.schema)
+        self.batch_size = batch_size
+        self.rows = []
+
+    def write(self, row):
+        self.rows.append(row)
+        if len(self.rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self.rows:
+            self.writer.write_table(self.pa.Table.from_pylist(self.rows, schema=self.schema))
+            self.rows = []
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+
+
+def open_row_writer(path, batch_size=1000):
+    """CSV or Parquet row writer, chosen by the file extension."""
+    if str(path).endswith((".parquet", ".pq")):
+        return ParquetRowWriter(path, batch_size=batch_size)
+    return CsvRowWriter(path)
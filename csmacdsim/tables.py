@@ -0,0 +1,33 @@
+"""Server-side filtering and paging for large event tables."""
+
+import math
+
+import numpy as np
+
+
+def filter_events(df, column_values=None, time_column=None, time_range=None):
+    """
+    Rows of `df` that pass every filter, selected with one boolean mask.
+
+    column_values maps a column to the values to keep (an empty selection
+    keeps everything); time_range is an inclusive (low, high) on time_column.
+    """
+    mask = np.ones(len(df), dtype=bool)
+    for column, values in (column_values or {}).items():
+        if values:
+            mask &= df[column].isin(values).to_numpy()
+    if time_range is not None:
+        times = df[time_column].to_numpy()
+        mask &= (times >= time_range[0]) & (times <= time_range[1])
+    return df[mask]
+
+
+def page_count(num_rows, page_size):
+    """Number of pages needed for num_rows rows (at least one)."""
+    return max(1, math.ceil(num_rows / page_size))
+
+
+def paginate(df, page, page_size):
+    """Rows of the 1-based `page`, clamped to the available pages."""
+    page = min(max(page, 1), page_count(len(df), page_size))
+    return df.iloc[(page - 1) * page_size:page * page_size]
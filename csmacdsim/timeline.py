@@ -0,0 +1,108 @@
+"""Compact per-node slot timelines shared by the simulators."""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+# Slot states stored in the timeline matrix
+IDLE = 0
+SUCCESS = 1
+COLLISION = 2
+
+STATE_LABELS = {IDLE: 'Idle', SUCCESS: 'Success', COLLISION: 'Collision'}
+
+
+class NodeTrack(Sequence):
+    """
+    Read-only view of one node's row, exposed as a sequence of (slot, state) tuples.
+
+    Behaves like the old per-node list of tuples: it can be iterated,
+    indexed and sliced, but the tuples are only built on access.
+    """
+
+    def __init__(self, row, start=0):
+        self.row = row
+        self.start = start
+
+    def __len__(self):
+        return len(self.row)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            first, _, step = index.indices(len(self.row))
+            states = self.row[index].tolist()
+            return [(self.start + first + k * step, state) for k, state in enumerate(states)]
+        if index < 0:
+            index += len(self.row)
+        if not 0 <= index < len(self.row):
+            raise IndexError("slot index out of range")
+        return (self.start + index, int(self.row[index]))
+
+    def __iter__(self):
+        return zip(range(self.start, self.start + len(self.row)), self.row.tolist())
+
+
+class NodeTimeline:
+    """
+    Node timelines backed by an int8 (nodes, slots) state matrix.
+
+    Reads like the old {node: [(slot, state), ...]} dict: iterating yields
+    node ids, timeline[node] is a NodeTrack, and keys()/values()/items()
+    are available. window() slices a time range without copying.
+    """
+
+    def __init__(self, states, start=0):
+        self.states = np.asarray(states, dtype=np.int8)
+        self.start = start
+
+    @classmethod
+    def empty(cls, num_nodes, num_slots):
+        """All-idle timeline that engines fill in slot by slot."""
+        return cls(np.zeros((num_nodes, num_slots), dtype=np.int8))
+
+    @property
+    def num_nodes(self):
+        return self.states.shape[0]
+
+    @property
+    def num_slots(self):
+        return self.states.shape[1]
+
+    def __len__(self):
+        return self.num_nodes
+
+    def __iter__(self):
+        return iter(range(self.num_nodes))
+
+    def __contains__(self, node):
+        return 0 <= node < self.num_nodes
+
+    def __getitem__(self, node):
+        if node not in self:
+            raise KeyError(node)
+        return NodeTrack(self.states[node], self.start)
+
+    def keys(self):
+        return range(self.num_nodes)
+
+    def values(self):
+        return [self[node] for node in self]
+
+    def items(self):
+        return [(node, self[node]) for node in self]
+
+    def window(self, start, stop):
+        """View of slots start <= t < stop (absolute slot numbers)."""
+        first = max(start, self.start) - self.start
+        last = max(first, min(stop, self.start + self.num_slots) - self.start)
+        return NodeTimeline(self.states[:, first:last], start=self.start + first)
+
+    def state_counts(self):
+        """(nodes, 3) array counting idle, success and collision slots per node."""
+        counts = np.zeros((self.num_nodes, len(STATE_LABELS)), dtype=np.int64)
+        for state in STATE_LABELS:
+            counts[:, state] = np.count_nonzero(self.states == state, axis=1)
+        return counts
+
+    def __repr__(self):
+        return f"NodeTimeline(nodes={self.num_nodes}, slots={self.num_slots}, start={self.start})"
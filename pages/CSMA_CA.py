@@ -7,6 +7,11 @@ import matplotlib.pyplot as plt
 from matplotlib.patches import Patch
 import os
 
+from csmacdsim.csma_ca import CSMA_CA_VARIANTS, simulate_csma_ca
+from csmacdsim.parallel import iter_runs, run_metrics, run_seeds
+from csmacdsim.plotting import draw_timeline
+from csmacdsim.rng import fresh_seed
+
 # --------------------- PAGE CONFIG ---------------------
 st.set_page_config(
     page_title="CSMA/CA Simulator",
@@ -63,94 +68,28 @@ tx_time = st.sidebar.number_input("Transmission Time (slots)", 1.0, 10.0, 1.0, 0
 packet_gen_prob = st.sidebar.slider("Packet Generation Probability", 0.0, 1.0, 0.1, 0.01)
 protocol_type = st.sidebar.selectbox(
     "CSMA/CA Variant",
-    ["Basic CSMA/CA", "CSMA/CA with RTS/CTS"]
+    CSMA_CA_VARIANTS
 )
 compare_protocols = st.sidebar.checkbox("Compare Both Variants (avg)")
 compare_runs = st.sidebar.slider("Comparison: runs per variant", 3, 20, 5)
+if "csma_ca_seed" not in st.session_state:
+    st.session_state["csma_ca_seed"] = fresh_seed()
+seed0 = st.sidebar.number_input(
+    "Seed", min_value=0, max_value=2**32 - 1, step=1, key="csma_ca_seed",
+    help="Runs with the same parameters and seed are served from cache"
+)
+st.sidebar.button("Fresh Seed", on_click=lambda: st.session_state.update(csma_ca_seed=fresh_seed()),
+                  help="Draw a new seed, bypassing cached results")
 run_simulation = st.sidebar.button("Run Simulation", type="primary")
 
-# --------------------- SIMULATOR ---------------------
-def simulate_csma_ca(num_nodes, num_packets, prop_delay, tx_time, gen_prob, variant="Basic CSMA/CA", seed=None, max_time=400):
-    if seed is not None:
-        np.random.seed(seed)
-
-    success_count = 0
-    collision_count = 0
-    usage_log = []
-    node_timelines = {i: [] for i in range(num_nodes)}
-
-    channel_busy_until = 0.0
-    backoff = np.zeros(num_nodes)
-    packet_ready = np.zeros(num_nodes)
-    waiting_ack = np.zeros(num_nodes)
-
-    for t in range(int(max_time)):
-        # Packet generation
-        for i in range(num_nodes):
-            if np.random.rand() < gen_prob:
-                packet_ready[i] = 1
-
-        active_nodes = [i for i in range(num_nodes) if packet_ready[i] == 1 and backoff[i] <= 0]
-
-        # Channel busy
-        if t < channel_busy_until:
-            usage_log.append(("Busy", t))
-            for n in range(num_nodes):
-                node_timelines[n].append((t, 0))
-            backoff = np.maximum(backoff - 1, 0)
-            continue
-
-        if len(active_nodes) == 0:
-            usage_log.append(("Idle", t))
-            for n in range(num_nodes):
-                node_timelines[n].append((t, 0))
-        elif len(active_nodes) == 1:
-            node = active_nodes[0]
-            success_count += 1
-            usage_log.append((f"Success (Node {node})", t))
-
-            # RTS/CTS handshake delay
-            if variant == "CSMA/CA with RTS/CTS":
-                handshake_time = 0.5 * tx_time
-                channel_busy_until = t + tx_time + handshake_time
-            else:
-                channel_busy_until = t + tx_time
-
-            packet_ready[node] = 0
-            for n in range(num_nodes):
-                node_timelines[n].append((t, 1 if n == node else 0))
-        else:
-            # Virtual collisions due to RTS overlaps
-            collision_count += 1
-            usage_log.append(("Collision", t))
-            for i in active_nodes:
-                backoff[i] = np.random.randint(1, 8)
-            for n in range(num_nodes):
-                node_timelines[n].append((t, 2 if n in active_nodes else 0))
-            channel_busy_until = t + tx_time * 0.5
-
-        backoff = np.maximum(backoff - 1, 0)
-
-    total_slots = int(max_time)
-    efficiency = success_count / total_slots if total_slots else 0
-    throughput = success_count / total_slots if total_slots else 0
-    busy_slots = sum(1 for e, _ in usage_log if e != "Idle")
-    utilization = busy_slots / total_slots if total_slots else 0
-
-    return usage_log, success_count, collision_count, efficiency, throughput, utilization, node_timelines
-
 # --------------------- PLOT TIMELINE ---------------------
 def plot_node_gantt(node_timelines, max_time):
     colors = {0: '#d3d3d3', 1: '#32CD32', 2: '#FF6347'}
     labels = {0: 'Idle', 1: 'Successful Transmission', 2: 'Collision'}
 
     fig, ax = plt.subplots(figsize=(12, 0.6 * len(node_timelines) + 1))
-    max_t = 0
-    for i, (node, timeline) in enumerate(sorted(node_timelines.items())):
-        for t, state in timeline:
-            ax.barh(i, 1, left=t, color=colors[state], height=0.6)
-            if t > max_t:
-                max_t = t
+    draw_timeline(ax, node_timelines, colors, height=0.6)
+    max_t = node_timelines.start + node_timelines.num_slots - 1
     ax.set_xlabel("Time Slot")
     ax.set_ylabel("Node")
     ax.set_title("Node-level Activity Timeline (Gantt view)", fontsize=13, pad=8)
@@ -163,35 +102,55 @@ def plot_node_gantt(node_timelines, max_time):
     st.pyplot(fig)
 
 # --------------------- COMPARISON ---------------------
-def run_compare(protocols, runs, **kwargs):
-    effs, thrs, utils = [], [], []
-    for proto in protocols:
-        e_list, t_list, u_list = [], [], []
-        for _ in range(runs):
-            seed = np.random.randint(0, 2**31 - 1)
-            _, _, _, eff, thr, util, _ = simulate_csma_ca(
-                kwargs['num_nodes'], kwargs['num_packets'],
-                kwargs['prop_delay'], kwargs['tx_time'],
-                kwargs['gen_prob'], proto, seed=seed, max_time=kwargs.get('max_time', 400)
-            )
-            e_list.append(eff)
-            t_list.append(thr)
-            u_list.append(util)
-        effs.append(np.mean(e_list))
-        thrs.append(np.mean(t_list))
-        utils.append(np.mean(u_list))
+def run_compare(protocols, runs, root_seed, parallel=True, on_progress=None, **kwargs):
+    """
+    Average efficiency/throughput/utilization over `runs` runs per protocol.
+
+    Run seeds are spawned from SeedSequence(root_seed) and shared by all
+    protocols; runs go to a process pool when `parallel` is set and are
+    collected as they complete, so the result is the same as a serial run
+    with the same root seed. on_progress(done, total) is called after each run.
+    """
+    seeds = run_seeds(root_seed, runs)
+    tasks = [
+        (simulate_csma_ca,
+         (kwargs['num_nodes'], kwargs['num_packets'], kwargs['prop_delay'],
+          kwargs['tx_time'], kwargs['gen_prob'], proto),
+         seed, kwargs.get('max_time', 400))
+        for proto in protocols for seed in seeds
+    ]
+    results = np.zeros((len(tasks), 3))
+    for done, (index, result) in enumerate(iter_runs(run_metrics, tasks, parallel=parallel), start=1):
+        results[index] = result
+        if on_progress is not None:
+            on_progress(done, len(tasks))
+    means = results.reshape(len(protocols), runs, 3).mean(axis=1)
+    effs, thrs, utils = means.T.tolist()
     return effs, thrs, utils
 
+# --------------------- CACHED RUNS ---------------------
+@st.cache_data(max_entries=32, ttl=3600, show_spinner=False)
+def cached_simulate_csma_ca(num_nodes, num_packets, prop_delay, tx_time, gen_prob, variant, seed, max_time):
+    return simulate_csma_ca(num_nodes, num_packets, prop_delay, tx_time, gen_prob, variant, seed=seed, max_time=max_time)
+
 # --------------------- MAIN EXECUTION ---------------------
+# A click saves the run; every later rerun replays it through the cache,
+# so changing a sidebar widget does not start a new simulation or comparison
 if run_simulation:
+    st.session_state["csma_ca_run"] = (num_nodes, num_packets, prop_delay, tx_time, packet_gen_prob,
+                                       protocol_type, seed0, compare_protocols, compare_runs)
+
+if "csma_ca_run" in st.session_state:
+    (num_nodes, num_packets, prop_delay, tx_time, packet_gen_prob,
+     protocol_type, seed0, compare_protocols, compare_runs) = st.session_state["csma_ca_run"]
     st.spinner("Running simulation...")
 
-    seed0 = np.random.randint(0, 2**31 - 1)
-    usage, success, collisions, eff, thr, util, timelines = simulate_csma_ca(
-        num_nodes, num_packets, prop_delay, tx_time, packet_gen_prob, variant=protocol_type, seed=seed0, max_time=400
+    usage, success, collisions, eff, thr, util, timelines = cached_simulate_csma_ca(
+        num_nodes, num_packets, prop_delay, tx_time, packet_gen_prob, protocol_type, seed0, 400
     )
 
     st.subheader("Simulation Results")
+    st.caption(f"Seed: {seed0}")
     c1, c2, c3, c4 = st.columns(4)
     c1.metric("Successful Transmissions", success)
     c2.metric("Collisions", collisions)
@@ -203,19 +162,27 @@ if run_simulation:
     st.subheader("Node Timeline")
     plot_node_gantt(timelines, max_time=400)
 
-    df = pd.DataFrame(usage, columns=["Event", "Time Slot"])
+    df = usage.to_frame()
     st.dataframe(df, use_container_width=True)
     st.download_button("Download Event Data (CSV)", df.to_csv(index=False), "csma_ca_events.csv", "text/csv")
 
     if compare_protocols:
         st.subheader("Comparison of CSMA/CA Variants (avg)")
-        protocols = ["Basic CSMA/CA", "CSMA/CA with RTS/CTS"]
-        effs, thrs, utils = run_compare(
-            protocols, compare_runs,
-            num_nodes=num_nodes, num_packets=num_packets,
-            prop_delay=prop_delay, tx_time=tx_time,
-            gen_prob=packet_gen_prob, max_time=400
-        )
+        protocols = CSMA_CA_VARIANTS
+        # The progress bar cannot live inside st.cache_data, so the last
+        # comparison is memoised in session state instead
+        compare_key = (compare_runs, seed0, num_nodes, num_packets, prop_delay, tx_time, packet_gen_prob)
+        if st.session_state.get("csma_ca_compare_key") != compare_key:
+            progress = st.progress(0.0, text="Running comparison...")
+            st.session_state["csma_ca_compare"] = run_compare(
+                protocols, compare_runs, root_seed=seed0,
+                on_progress=lambda done, total: progress.progress(done / total, text=f"Completed {done}/{total} runs"),
+                num_nodes=num_nodes, num_packets=num_packets,
+                prop_delay=prop_delay, tx_time=tx_time,
+                gen_prob=packet_gen_prob, max_time=400
+            )
+            st.session_state["csma_ca_compare_key"] = compare_key
+        effs, thrs, utils = st.session_state["csma_ca_compare"]
 
         fig, axes = plt.subplots(1, 3, figsize=(15, 4))
         labels = ["Efficiency (%)", "Throughput (pkts/slot)", "Utilization (%)"]
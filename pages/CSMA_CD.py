@@ -5,6 +5,10 @@ import matplotlib.pyplot as plt
 from matplotlib.patches import Patch
 import io
 
+from csmacdsim.csma import CSMA_PROTOCOLS, compare_csma_protocols, simulate_csma, simulate_csma_events
+from csmacdsim.plotting import LiveChart, draw_timeline
+from csmacdsim.rng import fresh_seed
+
 # --------------------- PAGE CONFIG ---------------------
 st.set_page_config(
     page_title="CSMA & CSMA/CD Simulator",
@@ -54,89 +58,34 @@ tx_time = st.sidebar.number_input("Packet Transmission Time (slots)", 1.0, 10.0,
 packet_gen_prob = st.sidebar.slider("Probability of New Packet Generation", 0.0, 1.0, 0.12, 0.01)
 protocol_type = st.sidebar.selectbox(
     "Protocol Type",
-    ["1-Persistent CSMA", "Non-Persistent CSMA", "p-Persistent CSMA (CSMA/CD)"]
+    CSMA_PROTOCOLS
+)
+engine = st.sidebar.selectbox(
+    "Simulation Engine",
+    ["Slotted (per-slot loop)", "Event-driven (discrete-event)"],
+    help="The event-driven engine jumps between events and keeps fractional times exact"
 )
 compare_protocols = st.sidebar.checkbox("Compare All Protocols (Efficiency & Throughput)")
 compare_runs = st.sidebar.slider("Comparison: runs per protocol (avg)", 3, 20, 6)
+live_updates = st.sidebar.checkbox("Live Updates", help="Show running throughput and utilization while the simulation runs")
+live_every = st.sidebar.slider("Live: update every N slots", 10, 200, 50, 10)
+if "csma_cd_seed" not in st.session_state:
+    st.session_state["csma_cd_seed"] = fresh_seed()
+seed0 = st.sidebar.number_input(
+    "Seed", min_value=0, max_value=2**32 - 1, step=1, key="csma_cd_seed",
+    help="Runs with the same parameters and seed are served from cache"
+)
+st.sidebar.button("Fresh Seed", on_click=lambda: st.session_state.update(csma_cd_seed=fresh_seed()),
+                  help="Draw a new seed, bypassing cached results")
 run_simulation = st.sidebar.button("Run Simulation", type="primary")
 
-# --------------------- SIMULATOR ---------------------
-def simulate_csma(num_nodes, num_packets, prop_delay, tx_time, gen_prob, protocol, seed=None, max_time=400):
-    if seed is not None:
-        np.random.seed(seed)
-
-    success_count = 0
-    collision_count = 0
-    usage_log = []
-    node_timelines = {i: [] for i in range(num_nodes)}
-    channel_busy_until = 0.0
-    backoff = np.zeros(num_nodes)
-    packet_ready = np.zeros(num_nodes)
-    retransmission_attempts = np.zeros(num_nodes)
-
-    for t in range(int(max_time)):
-        for i in range(num_nodes):
-            if np.random.rand() < gen_prob:
-                packet_ready[i] = 1
-
-        sensing_nodes = [i for i in range(num_nodes) if packet_ready[i] == 1 and backoff[i] <= 0]
-
-        if t < channel_busy_until:
-            if protocol == "Non-Persistent CSMA":
-                for i in sensing_nodes:
-                    backoff[i] = np.random.randint(2, 8)
-            elif protocol == "p-Persistent CSMA (CSMA/CD)":
-                p = 0.4
-                sensing_nodes = [i for i in sensing_nodes if np.random.rand() < p]
-            usage_log.append(("Busy", t))
-            for n in range(num_nodes):
-                node_timelines[n].append((t, 0))
-            backoff = np.maximum(backoff - 1, 0)
-            continue
-
-        if len(sensing_nodes) == 0:
-            usage_log.append(("Idle", t))
-            for n in range(num_nodes):
-                node_timelines[n].append((t, 0))
-        elif len(sensing_nodes) == 1:
-            node = sensing_nodes[0]
-            success_count += 1
-            usage_log.append((f"Success (Node {node})", t))
-            packet_ready[node] = 0
-            retransmission_attempts[node] = 0
-            for n in range(num_nodes):
-                node_timelines[n].append((t, 1 if n == node else 0))
-            channel_busy_until = t + max(1.0, tx_time)
-        else:
-            collision_count += 1
-            usage_log.append(("Collision", t))
-            for i in sensing_nodes:
-                retransmission_attempts[i] += 1
-                k = int(min(retransmission_attempts[i], 10))
-                backoff[i] = np.random.randint(1, 2 ** k)
-            for n in range(num_nodes):
-                node_timelines[n].append((t, 2 if n in sensing_nodes else 0))
-            channel_busy_until = t + max(1.0, tx_time * 0.5)
-        backoff = np.maximum(backoff - 1, 0)
-
-    total_slots = int(max_time)
-    efficiency = success_count / total_slots
-    throughput = success_count / total_slots
-    busy_slots = sum(1 for e, _ in usage_log if e != "Idle")
-    utilization = busy_slots / total_slots
-    return usage_log, success_count, collision_count, efficiency, throughput, utilization, node_timelines
-
 # --------------------- PLOT ---------------------
 def plot_node_gantt(node_timelines, max_time):
     colors = {0: '#d3d3d3', 1: '#32CD32', 2: '#FF6347'}
     labels = {0: 'Idle', 1: 'Successful Transmission', 2: 'Collision'}
     fig, ax = plt.subplots(figsize=(12, 0.6 * len(node_timelines) + 1))
-    max_t = 0
-    for i, (node, timeline) in enumerate(sorted(node_timelines.items())):
-        for t, state in timeline:
-            ax.barh(i, 1, left=t, color=colors[state], height=0.6)
-            if t > max_t:
-                max_t = t
+    draw_timeline(ax, node_timelines, colors, height=0.6)
+    max_t = node_timelines.start + node_timelines.num_slots - 1
     ax.set_xlabel("Time Slot")
     ax.set_ylabel("Node")
     ax.set_title("Node-level Activity Timeline (Gantt view)", fontsize=13, pad=8)
@@ -149,14 +98,60 @@ def plot_node_gantt(node_timelines, max_time):
     st.pyplot(fig)
     return fig
 
+# --------------------- CACHED RUNS ---------------------
+ENGINES = {
+    "Slotted (per-slot loop)": simulate_csma,
+    "Event-driven (discrete-event)": simulate_csma_events
+}
+
+@st.cache_data(max_entries=32, ttl=3600, show_spinner=False)
+def cached_simulate_csma(engine, num_nodes, num_packets, prop_delay, tx_time, gen_prob, protocol, seed, max_time):
+    return ENGINES[engine](num_nodes, num_packets, prop_delay, tx_time, gen_prob, protocol, seed=seed, max_time=max_time)
+
+@st.cache_data(max_entries=16, ttl=3600, show_spinner=False)
+def cached_compare_csma(engine, num_nodes, num_packets, prop_delay, tx_time, gen_prob, runs, root_seed, max_time):
+    return compare_csma_protocols(num_nodes, num_packets, prop_delay, tx_time, gen_prob, runs,
+                                  root_seed=root_seed, engine=ENGINES[engine], max_time=max_time)
+
+# --------------------- LIVE RUN ---------------------
+def run_live():
+    """Run uncached with a live chart; st.* calls cannot happen inside st.cache_data."""
+    st.subheader("Live Progress")
+    metrics_slot = st.empty()
+    chart_slot = st.empty()
+    chart = LiveChart(total_slots=400)
+
+    def show(progress):
+        with metrics_slot.container():
+            m1, m2, m3 = st.columns(3)
+            m1.metric("Throughput so far", f"{progress['throughput']:.4f}")
+            m2.metric("Collisions so far", progress["collisions"])
+            m3.metric("Channel Utilization so far", f"{progress['utilization']*100:.1f}%")
+        chart_slot.pyplot(chart.update(progress["slots"], progress["throughput"], progress["utilization"]))
+
+    return ENGINES[engine](num_nodes, num_packets, prop_delay, tx_time, packet_gen_prob, protocol_type,
+                           seed=seed0, max_time=400, on_chunk=show, chunk_slots=live_every)
+
 # --------------------- MAIN EXECUTION ---------------------
+# A click saves the run; every later rerun replays it through the cache,
+# so changing a sidebar widget does not start a new simulation or sweep
 if run_simulation:
-    seed0 = np.random.randint(0, 2**31 - 1)
-    usage, success, collisions, efficiency, throughput, utilization, node_timeline = simulate_csma(
-        num_nodes, num_packets, prop_delay, tx_time, packet_gen_prob, protocol_type, seed=seed0, max_time=400
-    )
+    st.session_state["csma_cd_run"] = (engine, num_nodes, num_packets, prop_delay, tx_time, packet_gen_prob,
+                                       protocol_type, seed0, compare_protocols, compare_runs)
+
+if "csma_cd_run" in st.session_state:
+    (engine, num_nodes, num_packets, prop_delay, tx_time, packet_gen_prob,
+     protocol_type, seed0, compare_protocols, compare_runs) = st.session_state["csma_cd_run"]
+    if run_simulation and live_updates:
+        result = run_live()
+    else:
+        result = cached_simulate_csma(
+            engine, num_nodes, num_packets, prop_delay, tx_time, packet_gen_prob, protocol_type, seed0, 400
+        )
+    usage, success, collisions, efficiency, throughput, utilization, node_timeline = result
 
     st.subheader("Simulation Results")
+    st.caption(f"Seed: {seed0}")
     c1, c2, c3, c4 = st.columns(4)
     c1.metric("Successful Transmissions", success)
     c2.metric("Collisions", collisions)
@@ -167,9 +162,44 @@ if run_simulation:
     fig = plot_node_gantt(node_timeline, max_time=400)
 
     st.subheader("Event Table")
-    df = pd.DataFrame(usage, columns=["Event", "Time Slot"])
+    df = usage.to_frame()
     st.dataframe(df, use_container_width=True)
 
+    if compare_protocols:
+        st.subheader("Protocol Comparison (avg over runs)")
+        with st.spinner(f"Running {len(CSMA_PROTOCOLS) * compare_runs} simulations in parallel..."):
+            means, stdevs = cached_compare_csma(
+                engine, num_nodes, num_packets, prop_delay, tx_time, packet_gen_prob, compare_runs, seed0, 400
+            )
+
+        fig_cmp, axes = plt.subplots(1, 3, figsize=(15, 4))
+        labels = ["Efficiency (%)", "Throughput (pkts/slot)", "Utilization (%)"]
+        scales = [100, 1, 100]
+        for i, ax in enumerate(axes):
+            values = means[:, i] * scales[i]
+            errors = stdevs[:, i] * scales[i]
+            ax.bar(range(len(CSMA_PROTOCOLS)), values, yerr=errors, capsize=4)
+            ax.set_title(labels[i])
+            ax.set_xticks(range(len(CSMA_PROTOCOLS)))
+            ax.set_xticklabels(CSMA_PROTOCOLS, rotation=15, ha='right', fontsize=9)
+            for j, v in enumerate(values):
+                ax.text(j, v + errors[j] + (max(values.max(), 1e-9) * 0.02), f"{v:.2f}", ha='center', fontweight='bold')
+        plt.tight_layout()
+        st.pyplot(fig_cmp)
+
+        comp_df = pd.DataFrame({
+            "Protocol": CSMA_PROTOCOLS,
+            "Avg Efficiency (%)": np.round(means[:, 0] * 100, 2),
+            "Std Efficiency (%)": np.round(stdevs[:, 0] * 100, 2),
+            "Avg Throughput (pkts/slot)": np.round(means[:, 1], 4),
+            "Std Throughput (pkts/slot)": np.round(stdevs[:, 1], 4),
+            "Avg Utilization (%)": np.round(means[:, 2] * 100, 2),
+            "Std Utilization (%)": np.round(stdevs[:, 2] * 100, 2)
+        })
+        st.dataframe(comp_df, use_container_width=True)
+        st.download_button("Download Comparison (CSV)", comp_df.to_csv(index=False),
+                           "csma_comparison.csv", "text/csv")
+
     # Save results for Download.py
     st.session_state["csma_results"] = {
         "num_nodes": num_nodes,
@@ -183,7 +213,8 @@ if run_simulation:
         "collisions": collisions,
         "success": success,
         "utilization": utilization,
-        "event_log": df
+        "event_log": df,
+        "node_timeline": node_timeline
     }
 
     buf = io.BytesIO()
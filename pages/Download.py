@@ -1,9 +1,7 @@
 import streamlit as st
 import pandas as pd
-import io
-from datetime import datetime
-from docx import Document
-from docx.shared import Inches
+
+from csmacdsim.report import build_report
 
 # Page config
 st.set_page_config(page_title="Download", page_icon="📥", layout="wide")
@@ -33,43 +31,15 @@ if has_csma or has_aloha:
     )
 
     if st.button("📄 Generate DOCX Report"):
-        doc = Document()
-        doc.add_heading("Network Protocol Simulation Report", level=1)
-        doc.add_paragraph(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-
-        def add_sim_section(doc, name, data_key, plot_key, title):
-            data = st.session_state[data_key]
-            doc.add_page_break()
-            doc.add_heading(f"{name} Simulation", level=1)
-            doc.add_heading("Parameters & Metrics", level=2)
-            for k, v in data.items():
-                if k != "event_log":
-                    doc.add_paragraph(f"{k.replace('_',' ').title()}: {v}")
-            doc.add_heading("Event Log (First 20 Rows)", level=2)
-            df = data["event_log"].head(20)
-            t = doc.add_table(rows=1, cols=len(df.columns))
-            hdr_cells = t.rows[0].cells
-            for i, c in enumerate(df.columns):
-                hdr_cells[i].text = c
-            for _, row in df.iterrows():
-                row_cells = t.add_row().cells
-                for i, val in enumerate(row):
-                    row_cells[i].text = str(val)
-            if plot_key in st.session_state:
-                doc.add_heading(title, level=2)
-                doc.add_picture(st.session_state[plot_key], width=Inches(6))
-
-        if sim_choice == "CSMA/CD Only":
-            add_sim_section(doc, "CSMA/CD", "csma_results", "csma_plot", "Timeline")
-        elif sim_choice == "Slotted ALOHA Only":
-            add_sim_section(doc, "Slotted ALOHA", "aloha_results", "aloha_plot", "Throughput Graph")
-        elif sim_choice == "Combined Report (CSMA/CD + Slotted ALOHA)":
-            add_sim_section(doc, "CSMA/CD", "csma_results", "csma_plot", "Timeline")
-            add_sim_section(doc, "Slotted ALOHA", "aloha_results", "aloha_plot", "Throughput Graph")
-
-        buffer = io.BytesIO()
-        doc.save(buffer)
-        buffer.seek(0)
+        sections = []
+        if sim_choice != "Slotted ALOHA Only":
+            sections.append(("CSMA/CD", st.session_state["csma_results"],
+                             st.session_state.get("csma_plot"), "Timeline"))
+        if sim_choice != "CSMA/CD Only":
+            sections.append(("Slotted ALOHA", st.session_state["aloha_results"],
+                             st.session_state.get("aloha_plot"), "Throughput Graph"))
+
+        buffer = build_report(sections)
         name = "combined_network_report.docx" if "Combined" in sim_choice else f"{sim_choice.lower().replace(' ', '_')}.docx"
 
         st.download_button(
@@ -3,6 +3,11 @@ import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
 
+from csmacdsim.pure_aloha import get_theoretical_throughput, simulate_pure_aloha, simulate_pure_aloha_vectorized
+from csmacdsim.curves import simulate_throughput_curve
+from csmacdsim.rng import fresh_seed
+from csmacdsim.tables import filter_events, page_count, paginate
+
 # Page configuration
 st.set_page_config(
     page_title="Pure ALOHA Simulator",
@@ -81,114 +86,35 @@ packet_duration = st.sidebar.slider(
     help="Duration (in time units) for transmitting one packet"
 )
 
-# Run simulation button
-run_simulation = st.sidebar.button("Run Simulation", type="primary")
+engine = st.sidebar.selectbox(
+    "Simulation Engine",
+    ["Vectorized (NumPy)", "Tick loop (reference)"],
+    help="The vectorized engine draws all attempts in bulk and handles long runs in seconds"
+)
 
-# Pure ALOHA simulation logic
-def simulate_pure_aloha(num_nodes, p, num_time_units, packet_duration):
-    """
-    Simulate Pure ALOHA protocol
-    
-    In Pure ALOHA, nodes can transmit at any time. A collision occurs if
-    any part of a packet overlaps with another packet.
-    
-    Returns:
-    - time_units_data: List of tuples (time_unit, active_transmissions, status)
-    - node_transmissions: Dict tracking transmission periods for each node
-    - statistics: Dictionary with overall statistics
-    """
-    # Track ongoing transmissions: {node_id: end_time}
-    active_transmissions = {}
-    
-    # Track all transmission events
-    all_transmissions = []  # (node_id, start_time, end_time, success/collision)
-    
-    time_units_data = []
-    node_transmissions = {i: [] for i in range(num_nodes)}
-    
-    successful_transmissions = 0
-    collisions = 0
-    idle_time_units = 0
-    
-    for t in range(num_time_units):
-        # Clean up completed transmissions
-        completed_nodes = [node for node, end_time in active_transmissions.items() if end_time <= t]
-        for node in completed_nodes:
-            del active_transmissions[node]
-        
-        # Each node decides to transmit with probability p (if not already transmitting)
-        for node in range(num_nodes):
-            if node not in active_transmissions and np.random.random() < p:
-                # Node attempts to transmit
-                end_time = t + packet_duration
-                active_transmissions[node] = end_time
-                all_transmissions.append([node, t, end_time, None])  # Status to be determined
-        
-        # Check current status
-        num_active = len(active_transmissions)
-        
-        if num_active == 0:
-            status = "Idle"
-            idle_time_units += 1
-        elif num_active == 1:
-            status = "Transmitting"
-        else:
-            status = "Collision"
-        
-        time_units_data.append((t, num_active, status))
-    
-    # Determine success/collision for each transmission
-    for i, trans_i in enumerate(all_transmissions):
-        node_i, start_i, end_i, _ = trans_i
-        has_collision = False
-        
-        # Check overlap with other transmissions
-        for j, trans_j in enumerate(all_transmissions):
-            if i == j:
-                continue
-            node_j, start_j, end_j, _ = trans_j
-            
-            # Check if transmissions overlap
-            if not (end_i <= start_j or end_j <= start_i):
-                has_collision = True
-                break
-        
-        if has_collision:
-            all_transmissions[i][3] = "Collision"
-            collisions += 1
-        else:
-            all_transmissions[i][3] = "Success"
-            successful_transmissions += 1
-        
-        # Record in node_transmissions
-        node_transmissions[node_i].append((start_i, end_i, all_transmissions[i][3]))
-    
-    # Calculate throughput (successful transmissions per time unit)
-    throughput = successful_transmissions / num_time_units
-    
-    # Theoretical maximum throughput for Pure ALOHA is 1/(2e) ≈ 0.184
-    theoretical_max = 1 / (2 * np.e)
-    
-    # Calculate offered load (G = N * p)
-    offered_load = num_nodes * p
-    
-    statistics = {
-        "successful": successful_transmissions,
-        "collisions": collisions,
-        "idle": idle_time_units,
-        "throughput": throughput,
-        "theoretical_max": theoretical_max,
-        "offered_load": offered_load,
-        "efficiency": (throughput / theoretical_max) * 100,
-        "total_transmissions": len(all_transmissions)
-    }
-    
-    return time_units_data, node_transmissions, statistics, all_transmissions
+simulate_curve = st.sidebar.checkbox(
+    "Simulate Full Throughput Curve",
+    help="Sweep G over 50 points with many seeds and overlay the simulated S(G) on the theory"
+)
+curve_replications = st.sidebar.slider(
+    "Curve: replications per point",
+    min_value=10,
+    max_value=200,
+    value=50,
+    step=10
+)
 
-# Theoretical throughput curve
-def get_theoretical_throughput(G_values):
-    """Calculate theoretical throughput for Pure ALOHA: S = G * e^(-2G)"""
-    return G_values * np.exp(-2 * G_values)
+if "pure_aloha_seed" not in st.session_state:
+    st.session_state["pure_aloha_seed"] = fresh_seed()
+seed0 = st.sidebar.number_input(
+    "Seed", min_value=0, max_value=2**32 - 1, step=1, key="pure_aloha_seed",
+    help="Runs with the same parameters and seed are served from cache"
+)
+st.sidebar.button("Fresh Seed", on_click=lambda: st.session_state.update(pure_aloha_seed=fresh_seed()),
+                  help="Draw a new seed, bypassing cached results")
+
+# Run simulation button
+run_simulation = st.sidebar.button("Run Simulation", type="primary")
 
 # Plot node-level timeline diagram (Gantt chart)
 def plot_node_timeline(node_transmissions, num_time_units_to_show=100):
@@ -229,15 +155,43 @@ def plot_node_timeline(node_transmissions, num_time_units_to_show=100):
     plt.tight_layout()
     st.pyplot(fig)
 
+# Cached runs keyed by engine, parameters and seed
+@st.cache_data(max_entries=16, ttl=3600, show_spinner=False)
+def cached_simulate_pure_aloha(engine, num_nodes, p, num_time_units, packet_duration, seed):
+    simulate = simulate_pure_aloha_vectorized if engine == "Vectorized (NumPy)" else simulate_pure_aloha
+    return simulate(num_nodes, p, num_time_units, packet_duration, seed=seed)
+
+@st.cache_data(max_entries=16, ttl=3600, show_spinner=False)
+def cached_transmission_table(engine, num_nodes, p, num_time_units, packet_duration, seed):
+    """Transmission events as a start-ordered DataFrame, plus its CSV export."""
+    *_, all_transmissions = cached_simulate_pure_aloha(engine, num_nodes, p, num_time_units, packet_duration, seed)
+    df = pd.DataFrame(all_transmissions, columns=['Node', 'Start Time', 'End Time', 'Status'])
+    df = df.sort_values('Start Time').reset_index(drop=True)
+    return df, df.to_csv(index=False)
+
+@st.cache_data(max_entries=8, ttl=3600, show_spinner=False)
+def cached_throughput_curve(num_nodes, num_time_units, packet_duration, replications, seed):
+    return simulate_throughput_curve("Pure ALOHA", num_nodes, np.linspace(0.1, 5, 50), num_time_units,
+                                     replications, root_seed=seed, packet_duration=packet_duration)
+
 # Main simulation
+# A click saves the run; every later rerun replays it through the cache,
+# so changing a sidebar widget does not start a new simulation or curve sweep
 if run_simulation:
+    st.session_state["pure_aloha_run"] = (engine, num_nodes, transmission_prob, num_time_units, packet_duration,
+                                          seed0, simulate_curve, curve_replications)
+
+if "pure_aloha_run" in st.session_state:
+    (engine, num_nodes, transmission_prob, num_time_units, packet_duration,
+     seed0, simulate_curve, curve_replications) = st.session_state["pure_aloha_run"]
     with st.spinner("Running simulation..."):
-        time_units_data, node_transmissions, stats, all_transmissions = simulate_pure_aloha(
-            num_nodes, transmission_prob, num_time_units, packet_duration
+        time_units_data, node_transmissions, stats, all_transmissions = cached_simulate_pure_aloha(
+            engine, num_nodes, transmission_prob, num_time_units, packet_duration, seed0
         )
     
     # Display statistics
     st.header("Simulation Results")
+    st.caption(f"Seed: {seed0}")
     
     col1, col2, col3, col4 = st.columns(4)
     
@@ -272,13 +226,24 @@ if run_simulation:
     st.subheader("Transmission Events Table")
     st.markdown("Detailed log of all transmission attempts showing start time, duration, and outcome")
     
-    # Create DataFrame from transmission events
-    df_transmissions = pd.DataFrame(all_transmissions, 
-                                   columns=['Node', 'Start Time', 'End Time', 'Status'])
-    df_transmissions = df_transmissions.sort_values('Start Time').reset_index(drop=True)
-    
-    # Display table
-    st.dataframe(df_transmissions, use_container_width=True, height=400)
+    # Built once per run: page flips and filter changes reuse the table and its CSV
+    df_transmissions, csv_events = cached_transmission_table(
+        engine, num_nodes, transmission_prob, num_time_units, packet_duration, seed0
+    )
+    
+    # Filter and page on the server; only the visible page is sent to the browser
+    filter_col1, filter_col2, filter_col3, filter_col4 = st.columns([2, 2, 3, 1])
+    status_filter = filter_col1.multiselect("Status", ['Success', 'Collision'], placeholder="All statuses")
+    node_filter = filter_col2.multiselect("Node", list(range(num_nodes)), placeholder="All nodes")
+    time_range = filter_col3.slider("Start time range", 0, num_time_units - 1, (0, num_time_units - 1))
+    page_size = filter_col4.selectbox("Rows per page", [25, 50, 100, 250], index=2)
+    filtered_transmissions = filter_events(df_transmissions, {'Status': status_filter, 'Node': node_filter},
+                                           'Start Time', time_range)
+    num_pages = page_count(len(filtered_transmissions), page_size)
+    page = st.number_input("Page", min_value=1, max_value=num_pages, value=1, step=1)
+    st.dataframe(paginate(filtered_transmissions, page, page_size), use_container_width=True, hide_index=True)
+    st.caption(f"Page {page} of {num_pages} · {len(filtered_transmissions)} matching transmissions "
+               f"of {len(df_transmissions)}")
     
     st.divider()
     
@@ -326,10 +291,19 @@ if run_simulation:
         # Slotted ALOHA comparison
         S_slotted = G_range * np.exp(-G_range)
         ax1.plot(G_range, S_slotted, 'g--', linewidth=2, alpha=0.5, label='Slotted ALOHA (for comparison)')
-        
-        # Simulated point
-        ax1.plot(stats['offered_load'], stats['throughput'], 'ro', 
-                markersize=12, label=f'Simulated (G={stats["offered_load"]:.2f})')
+
+        # Simulated curve with confidence intervals
+        if simulate_curve:
+            with st.spinner("Simulating throughput curve..."):
+                G_sim, S_sim, S_err = cached_throughput_curve(num_nodes, num_time_units, packet_duration,
+                                                              curve_replications, seed0)
+            ax1.errorbar(G_sim, S_sim, yerr=S_err, fmt='o', color='orange', markersize=3, capsize=2,
+                         label=f'Simulated ({curve_replications} runs/point, 95% CI)')
+
+        # Simulated point, per packet time like the theoretical curve
+        G_point = stats['offered_load'] * packet_duration
+        ax1.plot(G_point, stats['throughput'] * packet_duration, 'ro',
+                markersize=12, label=f'Simulated (G={G_point:.2f})')
         
         # Mark maximum throughput
         max_G = 0.5
@@ -337,8 +311,8 @@ if run_simulation:
         ax1.plot(max_G, max_S, 'r*', markersize=15, 
                 label=f'Maximum (G=0.5, S={max_S:.3f})')
         
-        ax1.set_xlabel('Offered Load (G = N × p)', fontsize=12)
-        ax1.set_ylabel('Throughput (S)', fontsize=12)
+        ax1.set_xlabel('Offered Load per Packet Time (G = N × p × duration)', fontsize=12)
+        ax1.set_ylabel('Throughput per Packet Time (S)', fontsize=12)
         ax1.set_title('Efficiency Graph: Throughput vs Offered Load', fontsize=14, fontweight='bold')
         ax1.grid(True, alpha=0.3)
         ax1.legend()
@@ -409,7 +383,6 @@ if run_simulation:
     
     with col_dl1:
         # Transmission events CSV
-        csv_events = df_transmissions.to_csv(index=False)
         st.download_button(
             label="Download Transmission Events (CSV)",
             data=csv_events,
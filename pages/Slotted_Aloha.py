@@ -4,6 +4,12 @@ import matplotlib.pyplot as plt
 import pandas as pd
 import io
 
+from csmacdsim.curves import simulate_throughput_curve
+from csmacdsim.rng import fresh_seed
+from csmacdsim.slotted_aloha import get_theoretical_throughput, simulate_slotted_aloha_vectorized
+from csmacdsim.tables import filter_events, page_count, paginate
+from csmacdsim.plotting import LiveChart, draw_timeline
+
 # Page configuration
 st.set_page_config(
     page_title="Slotted ALOHA Simulator",
@@ -72,63 +78,41 @@ num_slots = st.sidebar.slider(
     help="Total number of time slots to simulate"
 )
 
-# Run simulation button
-run_simulation = st.sidebar.button("Run Simulation", type="primary")
+simulate_curve = st.sidebar.checkbox(
+    "Simulate Full Throughput Curve",
+    help="Sweep G over 50 points with many seeds and overlay the simulated S(G) on the theory"
+)
+curve_replications = st.sidebar.slider(
+    "Curve: replications per point",
+    min_value=10,
+    max_value=200,
+    value=50,
+    step=10
+)
 
-# Slotted ALOHA simulation logic
-def simulate_slotted_aloha(num_nodes, p, num_slots):
-    slots_data = []
-    node_transmissions = {i: [] for i in range(num_nodes)}
-    successful_transmissions = 0
-    collisions = 0
-    idle_slots = 0
-
-    for slot in range(num_slots):
-        transmitting_nodes = np.random.random(num_nodes) < p
-        num_transmissions = np.sum(transmitting_nodes)
-        transmitting_node_ids = [i for i in range(num_nodes) if transmitting_nodes[i]]
-
-        if num_transmissions == 0:
-            status = "Idle"
-            idle_slots += 1
-            for i in range(num_nodes):
-                node_transmissions[i].append((slot, 0))
-        elif num_transmissions == 1:
-            status = "Success"
-            successful_transmissions += 1
-            for i in range(num_nodes):
-                if i in transmitting_node_ids:
-                    node_transmissions[i].append((slot, 1))
-                else:
-                    node_transmissions[i].append((slot, 0))
-        else:
-            status = "Collision"
-            collisions += 1
-            for i in range(num_nodes):
-                if i in transmitting_node_ids:
-                    node_transmissions[i].append((slot, 2))
-                else:
-                    node_transmissions[i].append((slot, 0))
-
-        slots_data.append((slot, num_transmissions, status))
-
-    throughput = successful_transmissions / num_slots
-    theoretical_max = 1 / np.e
-    offered_load = num_nodes * p
-    stats = {
-        "successful": successful_transmissions,
-        "collisions": collisions,
-        "idle": idle_slots,
-        "throughput": throughput,
-        "theoretical_max": theoretical_max,
-        "offered_load": offered_load,
-        "efficiency": (throughput / theoretical_max) * 100
-    }
+live_updates = st.sidebar.checkbox(
+    "Live Updates",
+    help="Show running throughput and utilization while the simulation runs"
+)
+live_every = st.sidebar.slider(
+    "Live: update every N slots",
+    min_value=50,
+    max_value=1000,
+    value=250,
+    step=50
+)
 
-    return slots_data, node_transmissions, stats
+if "slotted_aloha_seed" not in st.session_state:
+    st.session_state["slotted_aloha_seed"] = fresh_seed()
+seed0 = st.sidebar.number_input(
+    "Seed", min_value=0, max_value=2**32 - 1, step=1, key="slotted_aloha_seed",
+    help="Runs with the same parameters and seed are served from cache"
+)
+st.sidebar.button("Fresh Seed", on_click=lambda: st.session_state.update(slotted_aloha_seed=fresh_seed()),
+                  help="Draw a new seed, bypassing cached results")
 
-def get_theoretical_throughput(G_values):
-    return G_values * np.exp(-G_values)
+# Run simulation button
+run_simulation = st.sidebar.button("Run Simulation", type="primary")
 
 def plot_node_timeline(node_transmissions, num_slots_to_show=50):
     colors = {0: '#d3d3d3', 1: '#2ecc71', 2: '#e74c3c'}
@@ -137,9 +121,8 @@ def plot_node_timeline(node_transmissions, num_slots_to_show=50):
     display_slots = min(num_slots_to_show, len(node_transmissions[0]))
     fig, ax = plt.subplots(figsize=(14, max(6, num_nodes * 0.4)))
 
-    for node_id, transmissions in node_transmissions.items():
-        for slot, state in transmissions[:display_slots]:
-            ax.barh(node_id, 1, left=slot, color=colors[state], height=0.8, edgecolor='white', linewidth=0.5)
+    draw_timeline(ax, node_transmissions.window(0, display_slots), colors, height=0.8,
+                  edgecolors='white', linewidth=0.5)
 
     ax.set_xlabel('Time Slot', fontsize=12)
     ax.set_ylabel('Node ID', fontsize=12)
@@ -155,12 +138,55 @@ def plot_node_timeline(node_transmissions, num_slots_to_show=50):
     plt.tight_layout()
     st.pyplot(fig)
 
+# --------------------- CACHED RUNS ---------------------
+@st.cache_data(max_entries=32, ttl=3600, show_spinner=False)
+def cached_simulate_slotted_aloha(num_nodes, p, num_slots, seed):
+    return simulate_slotted_aloha_vectorized(num_nodes, p, num_slots, seed=seed)
+
+@st.cache_data(max_entries=8, ttl=3600, show_spinner=False)
+def cached_throughput_curve(num_nodes, num_slots, replications, seed):
+    return simulate_throughput_curve("Slotted ALOHA", num_nodes, np.linspace(0.1, 5, 50), num_slots,
+                                     replications, root_seed=seed)
+
+# --------------------- LIVE RUN ---------------------
+def run_live():
+    """Run uncached with a live chart; st.* calls cannot happen inside st.cache_data."""
+    st.subheader("Live Progress")
+    metrics_slot = st.empty()
+    chart_slot = st.empty()
+    chart = LiveChart(total_slots=num_slots)
+
+    def show(progress):
+        slots = progress['successful'] + progress['collisions'] + progress['idle']
+        utilization = 1 - progress['idle'] / slots
+        with metrics_slot.container():
+            m1, m2, m3 = st.columns(3)
+            m1.metric("Throughput so far", f"{progress['throughput']:.4f}")
+            m2.metric("Collisions so far", progress['collisions'])
+            m3.metric("Channel Utilization so far", f"{utilization*100:.1f}%")
+        chart_slot.pyplot(chart.update(slots, progress['throughput'], utilization))
+
+    return simulate_slotted_aloha_vectorized(num_nodes, transmission_prob, num_slots, seed=seed0,
+                                             on_chunk=show, chunk_slots=live_every)
+
 # --------------------- MAIN SIMULATION ---------------------
+# A click saves the run; every later rerun replays it through the cache,
+# so changing a sidebar widget does not start a new simulation or curve sweep
 if run_simulation:
-    with st.spinner("Running simulation..."):
-        slots_data, node_transmissions, stats = simulate_slotted_aloha(num_nodes, transmission_prob, num_slots)
+    st.session_state["slotted_aloha_run"] = (num_nodes, transmission_prob, num_slots, seed0,
+                                             simulate_curve, curve_replications)
+
+if "slotted_aloha_run" in st.session_state:
+    (num_nodes, transmission_prob, num_slots, seed0,
+     simulate_curve, curve_replications) = st.session_state["slotted_aloha_run"]
+    if run_simulation and live_updates:
+        slot_counts, node_transmissions, stats = run_live()
+    else:
+        with st.spinner("Running simulation..."):
+            slot_counts, node_transmissions, stats = cached_simulate_slotted_aloha(num_nodes, transmission_prob, num_slots, seed0)
 
     st.header("Simulation Results")
+    st.caption(f"Seed: {seed0}")
 
     col1, col2, col3, col4 = st.columns(4)
     col1.metric("Throughput (S)", f"{stats['throughput']:.4f}")
@@ -171,8 +197,22 @@ if run_simulation:
     st.divider()
 
     st.subheader("Slot-wise Event Table")
-    df_events = pd.DataFrame(slots_data, columns=['Slot', 'Num Transmissions', 'Status'])
-    st.dataframe(df_events, use_container_width=True, height=400)
+    df_events = pd.DataFrame({
+        'Slot': np.arange(num_slots),
+        'Num Transmissions': slot_counts,
+        'Status': pd.Categorical.from_codes(np.minimum(slot_counts, 2), ['Idle', 'Success', 'Collision'])
+    })
+    # Filter and page on the server; only the visible page is sent to the browser
+    filter_col1, filter_col2, filter_col3 = st.columns([2, 3, 1])
+    status_filter = filter_col1.multiselect("Status", ['Idle', 'Success', 'Collision'],
+                                            placeholder="All statuses")
+    slot_range = filter_col2.slider("Slot range", 0, num_slots - 1, (0, num_slots - 1))
+    page_size = filter_col3.selectbox("Rows per page", [25, 50, 100, 250], index=2)
+    filtered_events = filter_events(df_events, {'Status': status_filter}, 'Slot', slot_range)
+    num_pages = page_count(len(filtered_events), page_size)
+    page = st.number_input("Page", min_value=1, max_value=num_pages, value=1, step=1)
+    st.dataframe(paginate(filtered_events, page, page_size), use_container_width=True, hide_index=True)
+    st.caption(f"Page {page} of {num_pages} · {len(filtered_events)} matching slots of {num_slots}")
 
     st.divider()
     st.subheader("Timeline Diagram: Packet Transmission Attempts")
@@ -204,6 +244,11 @@ if run_simulation:
         G_range = np.linspace(0, 5, 100)
         S_theoretical = get_theoretical_throughput(G_range)
         ax1.plot(G_range, S_theoretical, 'b-', linewidth=2, label='Theoretical')
+        if simulate_curve:
+            with st.spinner("Simulating throughput curve..."):
+                G_sim, S_sim, S_err = cached_throughput_curve(num_nodes, num_slots, curve_replications, seed0)
+            ax1.errorbar(G_sim, S_sim, yerr=S_err, fmt='o', color='orange', markersize=3, capsize=2,
+                         label=f'Simulated ({curve_replications} runs/point, 95% CI)')
         ax1.plot(stats['offered_load'], stats['throughput'], 'ro', markersize=12, label=f'Simulated (G={stats["offered_load"]:.2f})')
         ax1.plot(1, 1/np.e, 'g*', markersize=15, label=f'Maximum (G=1, S={1/np.e:.3f})')
         ax1.set_xlabel('Offered Load (G = N × p)', fontsize=12)
@@ -232,9 +277,9 @@ if run_simulation:
     with chart_col2:
         fig3, ax3 = plt.subplots(figsize=(8, 6))
         display_slots = min(100, num_slots)
-        slot_numbers = [s[0] for s in slots_data[:display_slots]]
-        num_transmissions = [s[1] for s in slots_data[:display_slots]]
-        statuses = [s[2] for s in slots_data[:display_slots]]
+        slot_numbers = df_events['Slot'][:display_slots]
+        num_transmissions = df_events['Num Transmissions'][:display_slots]
+        statuses = df_events['Status'][:display_slots]
         colors_map = {'Idle': '#95a5a6', 'Success': '#2ecc71', 'Collision': '#e74c3c'}
         bar_colors = [colors_map[status] for status in statuses]
         ax3.bar(slot_numbers, num_transmissions, color=bar_colors, alpha=0.7)
@@ -262,7 +307,8 @@ if run_simulation:
         "idle": stats["idle"],
         "successful": stats["successful"],
         "offered_load": stats["offered_load"],
-        "event_log": df_events
+        "event_log": df_events,
+        "node_timeline": node_transmissions
     }
 
     buf = io.BytesIO()
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Tests import csmacdsim from the repository root, however pytest is launched
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
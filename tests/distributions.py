@@ -0,0 +1,16 @@
+"""Distributional comparisons shared by the equivalence tests."""
+
+import numpy as np
+
+
+def assert_same_mean(engine_counts, reference_counts):
+    """
+    Column means of two (runs, metrics) samples within 4 standard errors of
+    their difference, e.g. success and collision counts over many seeds.
+    """
+    engine_counts = np.asarray(engine_counts, dtype=float)
+    reference_counts = np.asarray(reference_counts, dtype=float)
+    for column in range(engine_counts.shape[1]):
+        a, b = engine_counts[:, column], reference_counts[:, column]
+        stderr = np.sqrt(a.var(ddof=1) / len(a) + b.var(ddof=1) / len(b))
+        assert abs(a.mean() - b.mean()) <= 4 * max(stderr, 1e-9), (column, a.mean(), b.mean())
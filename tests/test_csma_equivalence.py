@@ -0,0 +1,99 @@
+"""
+The slotted CSMA and CSMA/CA engines against the original scalar slot loops.
+
+The engines pre-draw arrivals in blocks and take backoffs from a child
+stream, so a seed no longer gives the run of the scalar loop; the model
+is unchanged, so the success and collision counts must agree in
+distribution over many seeds.
+"""
+
+import numpy as np
+import pytest
+
+from csmacdsim.csma import CSMA_PROTOCOLS, simulate_csma
+from csmacdsim.csma_ca import CSMA_CA_VARIANTS, simulate_csma_ca
+from distributions import assert_same_mean
+
+NUM_NODES, TX_TIME, MAX_TIME, SEEDS = 8, 3, 250, 100
+
+
+def scalar_csma(num_nodes, tx_time, gen_prob, protocol, rng, max_time):
+    """The original per-node loop: one scalar draw per node per slot."""
+    success_count = collision_count = 0
+    channel_busy_until = 0.0
+    backoff = np.zeros(num_nodes)
+    packet_ready = np.zeros(num_nodes)
+    retransmission_attempts = np.zeros(num_nodes)
+    for t in range(max_time):
+        for i in range(num_nodes):
+            if rng.random() < gen_prob:
+                packet_ready[i] = 1
+        sensing_nodes = [i for i in range(num_nodes) if packet_ready[i] == 1 and backoff[i] <= 0]
+        if t < channel_busy_until:
+            if protocol == "Non-Persistent CSMA":
+                for i in sensing_nodes:
+                    backoff[i] = rng.integers(2, 8)
+            elif protocol == "p-Persistent CSMA (CSMA/CD)":
+                sensing_nodes = [i for i in sensing_nodes if rng.random() < 0.4]
+        elif len(sensing_nodes) == 1:
+            success_count += 1
+            packet_ready[sensing_nodes[0]] = 0
+            retransmission_attempts[sensing_nodes[0]] = 0
+            channel_busy_until = t + max(1.0, tx_time)
+        elif len(sensing_nodes) > 1:
+            collision_count += 1
+            for i in sensing_nodes:
+                retransmission_attempts[i] += 1
+                backoff[i] = rng.integers(1, 2 ** int(min(retransmission_attempts[i], 10)))
+            channel_busy_until = t + max(1.0, tx_time * 0.5)
+        backoff = np.maximum(backoff - 1, 0)
+    return success_count, collision_count
+
+
+def scalar_csma_ca(num_nodes, tx_time, gen_prob, variant, rng, max_time):
+    """The original per-node CSMA/CA loop."""
+    success_count = collision_count = 0
+    channel_busy_until = 0.0
+    backoff = np.zeros(num_nodes)
+    packet_ready = np.zeros(num_nodes)
+    for t in range(max_time):
+        for i in range(num_nodes):
+            if rng.random() < gen_prob:
+                packet_ready[i] = 1
+        active_nodes = [i for i in range(num_nodes) if packet_ready[i] == 1 and backoff[i] <= 0]
+        if t < channel_busy_until:
+            pass
+        elif len(active_nodes) == 1:
+            success_count += 1
+            if variant == "CSMA/CA with RTS/CTS":
+                channel_busy_until = t + tx_time + 0.5 * tx_time
+            else:
+                channel_busy_until = t + tx_time
+            packet_ready[active_nodes[0]] = 0
+        elif len(active_nodes) > 1:
+            collision_count += 1
+            for i in active_nodes:
+                backoff[i] = rng.integers(1, 8)
+            channel_busy_until = t + tx_time * 0.5
+        backoff = np.maximum(backoff - 1, 0)
+    return success_count, collision_count
+
+
+@pytest.mark.parametrize("gen_prob", [0.02, 0.1])
+@pytest.mark.parametrize("protocol", CSMA_PROTOCOLS)
+def test_csma_counts_match_the_scalar_loop(protocol, gen_prob):
+    engine = [simulate_csma(NUM_NODES, 20, 1, TX_TIME, gen_prob, protocol, seed=seed, max_time=MAX_TIME,
+                            jit=False)[1:3] for seed in range(SEEDS)]
+    reference = [scalar_csma(NUM_NODES, TX_TIME, gen_prob, protocol, np.random.default_rng(10_000 + seed),
+                             MAX_TIME) for seed in range(SEEDS)]
+    assert_same_mean(engine, reference)
+
+
+@pytest.mark.parametrize("gen_prob", [0.02, 0.1])
+@pytest.mark.parametrize("variant", CSMA_CA_VARIANTS)
+def test_csma_ca_counts_match_the_scalar_loop(variant, gen_prob):
+    engine = [simulate_csma_ca(NUM_NODES, 20, 1, TX_TIME, gen_prob, variant, seed=seed, max_time=MAX_TIME,
+                               jit=False)[1:3] for seed in range(SEEDS)]
+    reference = [scalar_csma_ca(NUM_NODES, TX_TIME, gen_prob, variant, np.random.default_rng(10_000 + seed),
+                                MAX_TIME) for seed in range(SEEDS)]
+    assert_same_mean(engine, reference)
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from csmacdsim.csma import CSMA_PROTOCOLS, iter_csma_event_outcomes, simulate_csma, simulate_csma_events
+from csmacdsim.timeline import COLLISION, SUCCESS
+from distributions import assert_same_mean
+
+# (tx_time, prop_delay), including fractional and zero-delay edge values
+TIMINGS = [(1, 0), (2.5, 0.3), (0.5, 0), (0.5, 1.25), (1.5, 0.5), (3, 3)]
+
+
+def check_invariants(num_nodes, tx_time, prop_delay, gen_prob, protocol, seed, max_time=300):
+    outcomes = list(iter_csma_event_outcomes(num_nodes, 20, prop_delay, tx_time, gen_prob, protocol,
+                                             seed=seed, max_time=max_time))
+    usage, success, collisions, efficiency, throughput, utilization, timeline = simulate_csma_events(
+        num_nodes, 20, prop_delay, tx_time, gen_prob, protocol, seed=seed, max_time=max_time)
+
+    assert success + collisions == len(outcomes) == len(usage)
+    assert success == sum(code == SUCCESS for _, code, _, _ in outcomes)
+    assert all(len(nodes) == 1 for _, code, nodes, _ in outcomes if code == SUCCESS)
+    assert all(len(nodes) >= 2 for _, code, nodes, _ in outcomes if code == COLLISION)
+    # A transmission only starts once the channel is released, so no two ever overlap
+    for (start, _, _, busy_until), (next_start, _, _, _) in zip(outcomes, outcomes[1:]):
+        assert start < busy_until <= next_start
+    assert 0 <= utilization <= 1
+    assert efficiency == throughput == success / max_time
+    assert np.count_nonzero(timeline.states == SUCCESS) <= success
+
+
+@pytest.mark.parametrize("tx_time, prop_delay", TIMINGS)
+@pytest.mark.parametrize("protocol", CSMA_PROTOCOLS)
+def test_event_engine_invariants(protocol, tx_time, prop_delay):
+    for seed in range(3):
+        for gen_prob in (0.02, 0.3):
+            check_invariants(6, tx_time, prop_delay, gen_prob, protocol, seed)
+
+
+@pytest.mark.parametrize("protocol", CSMA_PROTOCOLS)
+def test_event_engine_is_reproducible(protocol):
+    first = simulate_csma_events(6, 20, 0.3, 2.5, 0.1, protocol, seed=11)
+    second = simulate_csma_events(6, 20, 0.3, 2.5, 0.1, protocol, seed=11)
+    np.testing.assert_array_equal(first[0].slot, second[0].slot)
+    np.testing.assert_array_equal(first[0].code, second[0].code)
+    np.testing.assert_array_equal(first[0].node, second[0].node)
+    assert first[1:6] == second[1:6]
+    np.testing.assert_array_equal(first[6].states, second[6].states)
+
+
+def test_event_engine_without_arrivals_is_idle():
+    _, success, collisions, _, _, utilization, _ = simulate_csma_events(6, 20, 0.5, 1.5, 0.0, CSMA_PROTOCOLS[0])
+    assert (success, collisions, utilization) == (0, 0, 0)
+
+
+# The p-persistent engines differ by design (see simulate_csma_events), so only these two are compared
+@pytest.mark.parametrize("gen_prob", [0.02, 0.1])
+@pytest.mark.parametrize("tx_time", [1, 2, 4])
+@pytest.mark.parametrize("protocol", CSMA_PROTOCOLS[:2])
+def test_event_engine_matches_the_slotted_engine_at_integer_times(protocol, tx_time, gen_prob):
+    events = [simulate_csma_events(8, 20, 0, tx_time, gen_prob, protocol, seed=seed, max_time=300)[1:3]
+              for seed in range(150)]
+    slotted = [simulate_csma(8, 20, 0, tx_time, gen_prob, protocol, seed=10_000 + seed, max_time=300,
+                             jit=False)[1:3] for seed in range(150)]
+    assert_same_mean(events, slotted)
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from csmacdsim.curves import simulate_throughput_curve
+from csmacdsim.pure_aloha import replicate_pure_aloha
+
+
+def test_pure_aloha_curve_is_per_packet_time():
+    loads, means, half_widths = simulate_throughput_curve("Pure ALOHA", 20, [0.5, 1.0], 4000, 20, 3,
+                                                          packet_duration=20, parallel=False)
+    np.testing.assert_allclose(means, loads * np.exp(-2 * loads), atol=0.03)
+    assert np.all(half_widths > 0)
+
+
+def test_pure_aloha_point_scales_the_engine_throughput():
+    loads, means, half_widths = simulate_throughput_curve("Pure ALOHA", 10, [0.5], 500, 8, 3,
+                                                          packet_duration=5, parallel=False)
+    _, summary = replicate_pure_aloha(10, 0.5 / (10 * 5), 500, 5, 8, seed=3)
+    assert means[0] == pytest.approx(summary["throughput"]["mean"] * 5)
+    assert half_widths[0] == pytest.approx(summary["throughput"]["half_width"] * 5)
+
+
+def test_slotted_aloha_curve_matches_theory():
+    loads, means, _ = simulate_throughput_curve("Slotted ALOHA", 20, [0.5, 1.0], 2000, 20, 3, parallel=False)
+    np.testing.assert_allclose(means, loads * np.exp(-loads), atol=0.02)
+
+
+@pytest.mark.parametrize("protocol, packet_duration, kept", [
+    ("Slotted ALOHA", 1, [1.0, 4.0]),
+    ("Pure ALOHA", 1, [1.0, 4.0]),
+    ("Pure ALOHA", 3, [1.0, 4.0, 9.0]),
+])
+def test_loads_needing_p_above_one_are_dropped(protocol, packet_duration, kept):
+    loads, means, _ = simulate_throughput_curve(protocol, 4, [0.0, 1.0, 4.0, 9.0, 13.0], 50, 2, 1,
+                                                packet_duration=packet_duration, parallel=False)
+    np.testing.assert_array_equal(loads, kept)
+    assert len(means) == len(kept)
+
+
+def test_unknown_protocol_is_rejected():
+    with pytest.raises(ValueError):
+        simulate_throughput_curve("CSMA", 4, [1.0], 50, 2, 1, parallel=False)
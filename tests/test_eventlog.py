@@ -0,0 +1,43 @@
+import numpy as np
+
+from csmacdsim.eventlog import BUSY, EventLog, event_label
+from csmacdsim.timeline import COLLISION, IDLE, SUCCESS
+
+
+def sample_log():
+    return EventLog([0, 1, 2, 3, 4], [IDLE, SUCCESS, COLLISION, BUSY, SUCCESS], [-1, 2, -1, -1, 0])
+
+
+def test_labels():
+    assert event_label(SUCCESS, 3) == "Success (Node 3)"
+    assert event_label(SUCCESS) == "Success"
+    assert event_label(COLLISION, 1) == "Collision"
+    assert event_label(BUSY) == "Busy"
+
+
+def test_iteration_yields_label_slot_tuples():
+    log = sample_log()
+    expected = [("Idle", 0), ("Success (Node 2)", 1), ("Collision", 2), ("Busy", 3), ("Success (Node 0)", 4)]
+    assert len(log) == 5
+    assert list(log) == expected
+    assert [log[index] for index in range(len(log))] == expected
+    assert log.count(SUCCESS) == 2 and log.count(IDLE) == 1
+
+
+def test_for_slots_starts_idle():
+    log = EventLog.for_slots(4)
+    assert log.slot.dtype == np.int32
+    assert list(log) == [("Idle", slot) for slot in range(4)]
+
+
+def test_to_frame_matches_iteration():
+    log = sample_log()
+    frame = log.to_frame()
+    assert list(zip(frame["Event"].astype(str), frame["Time Slot"])) == list(log)
+    assert set(frame["Event"].cat.categories) == {label for label, _ in log}
+
+
+def test_fractional_slots_keep_their_type():
+    log = EventLog(np.array([0.5, 2.25]), [SUCCESS, COLLISION], [1, -1])
+    assert list(log) == [("Success (Node 1)", 0.5), ("Collision", 2.25)]
+    assert log.to_frame()["Time Slot"].dtype == np.float64
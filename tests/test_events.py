@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from csmacdsim.csma import CSMA_PROTOCOLS, simulate_csma, simulate_csma_events
+from csmacdsim.csma_ca import CSMA_CA_VARIANTS, simulate_csma_ca
+from csmacdsim.events import (iter_csma_ca_events, iter_csma_events, iter_pure_aloha_events,
+                              iter_slotted_aloha_events, tally_events, write_events_csv)
+from csmacdsim.pure_aloha import simulate_pure_aloha_vectorized
+from csmacdsim.slotted_aloha import simulate_slotted_aloha_vectorized
+from csmacdsim.streaming import stream_pure_aloha
+from csmacdsim.timeline import SUCCESS
+from distributions import assert_same_mean
+
+
+def timeline_tally(timeline):
+    _, successes, collisions = timeline.state_counts().sum(axis=0).tolist()
+    return {"Success": successes, "Collision": collisions}
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_slotted_aloha_events_are_the_engine_run(seed):
+    _, timeline, stats = simulate_slotted_aloha_vectorized(8, 0.15, 700, seed=seed)
+    tally = tally_events(iter_slotted_aloha_events(8, 0.15, 700, seed=seed, chunk_slots=64))
+    assert tally == timeline_tally(timeline)
+    assert tally["Success"] == stats["successful"]
+
+
+@pytest.mark.parametrize("protocol", CSMA_PROTOCOLS)
+def test_csma_events_are_the_engine_run(protocol):
+    for seed in range(3):
+        _, success, _, _, _, _, timeline = simulate_csma(6, 20, 1, 3, 0.1, protocol, seed=seed)
+        tally = tally_events(iter_csma_events(6, 20, 1, 3, 0.1, protocol, seed=seed))
+        assert tally == timeline_tally(timeline)
+        assert tally["Success"] == success
+
+
+@pytest.mark.parametrize("protocol", CSMA_PROTOCOLS)
+def test_csma_event_engine_events_are_the_engine_run(protocol):
+    for seed in range(3):
+        usage, success, collisions, _, _, _, _ = simulate_csma_events(6, 20, 0.3, 2.5, 0.1, protocol, seed=seed)
+        events = list(iter_csma_events(6, 20, 0.3, 2.5, 0.1, protocol, seed=seed, engine="events"))
+        assert tally_events(events)["Success"] == success
+        successes = [(event.slot, event.node) for event in events if event.kind == SUCCESS]
+        assert successes == [(slot, node) for slot, code, node in zip(usage.slot, usage.code, usage.node)
+                             if code == SUCCESS]
+        # Every collision involves at least two nodes
+        assert tally_events(events)["Collision"] >= 2 * collisions
+
+
+@pytest.mark.parametrize("variant", CSMA_CA_VARIANTS)
+def test_csma_ca_events_are_the_engine_run(variant):
+    for seed in range(3):
+        _, success, _, _, _, _, timeline = simulate_csma_ca(6, 20, 1, 3, 0.1, variant, seed=seed)
+        tally = tally_events(iter_csma_ca_events(6, 20, 1, 3, 0.1, variant, seed=seed))
+        assert tally == timeline_tally(timeline)
+        assert tally["Success"] == success
+
+
+def test_pure_aloha_events_are_the_stream_run():
+    for seed in range(3):
+        stats, _ = stream_pure_aloha(8, 0.05, 900, 2, seed=seed, chunk_units=128)
+        tally = tally_events(iter_pure_aloha_events(8, 0.05, 900, 2, seed=seed, chunk_units=128))
+        assert tally == {"Success": stats["successful"], "Collision": stats["collisions"]}
+
+
+def test_pure_aloha_events_match_the_vectorized_engine_in_distribution():
+    events = []
+    engine = []
+    for seed in range(150):
+        tally = tally_events(iter_pure_aloha_events(8, 0.05, 900, 2, seed=seed, chunk_units=128))
+        events.append([tally["Success"], tally["Collision"]])
+        stats = simulate_pure_aloha_vectorized(8, 0.05, 900, 2, seed=10_000 + seed)[2]
+        engine.append([stats["successful"], stats["collisions"]])
+    assert_same_mean(events, engine)
+
+
+def test_write_events_csv(tmp_path):
+    path = tmp_path / "events.csv"
+    events = list(iter_slotted_aloha_events(5, 0.3, 50, seed=1))
+    assert write_events_csv(iter(events), path) == len(events)
+    lines = path.read_text().splitlines()
+    assert lines[0] == "Slot,Node,Kind"
+    assert len(lines) == len(events) + 1
+    assert np.all([line.split(",")[2] in ("Success", "Collision") for line in lines[1:]])
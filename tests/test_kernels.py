@@ -0,0 +1,102 @@
+import importlib
+import sys
+
+import numpy as np
+import pytest
+
+from csmacdsim import kernels
+from csmacdsim.csma import CSMA_PROTOCOLS, simulate_csma
+from csmacdsim.csma_ca import CSMA_CA_VARIANTS, simulate_csma_ca
+from csmacdsim.rng import make_rng
+
+PARAMS = [(5, 1, 0.1, 400), (10, 5, 0.05, 1000), (20, 10, 0.3, 777), (8, 0.5, 0.5, 300)]
+
+
+def assert_same_run(a, b):
+    np.testing.assert_array_equal(a[0].code, b[0].code)
+    np.testing.assert_array_equal(a[0].node, b[0].node)
+    assert a[1:6] == b[1:6]
+    np.testing.assert_array_equal(a[6].states, b[6].states)
+
+
+@pytest.mark.parametrize("protocol", CSMA_PROTOCOLS)
+@pytest.mark.parametrize("num_nodes, tx_time, gen_prob, max_time", PARAMS)
+def test_csma_kernel_matches_python_engine(protocol, num_nodes, tx_time, gen_prob, max_time):
+    for seed in range(3):
+        expected = simulate_csma(num_nodes, 20, 1, tx_time, gen_prob, protocol, seed=seed,
+                                 max_time=max_time, jit=False)
+        result = kernels.run_kernel(kernels.csma_slot_loop, make_rng(seed), num_nodes, tx_time, gen_prob,
+                                    kernels.csma_persistence(protocol), max_time, compile=False)
+        assert_same_run(result, expected)
+
+
+@pytest.mark.parametrize("variant", CSMA_CA_VARIANTS)
+@pytest.mark.parametrize("num_nodes, tx_time, gen_prob, max_time", PARAMS)
+def test_csma_ca_kernel_matches_python_engine(variant, num_nodes, tx_time, gen_prob, max_time):
+    for seed in range(3):
+        expected = simulate_csma_ca(num_nodes, 20, 1, tx_time, gen_prob, variant, seed=seed,
+                                    max_time=max_time, jit=False)
+        result = kernels.run_kernel(kernels.csma_ca_slot_loop, make_rng(seed), num_nodes, tx_time, gen_prob,
+                                    kernels.csma_ca_rts_cts(variant), max_time, compile=False)
+        assert_same_run(result, expected)
+
+
+@pytest.fixture
+def broken_numba_import(monkeypatch):
+    """Reload kernels as if `import numba` raised, then restore the real module."""
+    monkeypatch.setitem(sys.modules, "numba", None)
+    importlib.reload(kernels)
+    yield
+    monkeypatch.undo()
+    importlib.reload(kernels)
+
+
+@pytest.fixture
+def failing_compiler(monkeypatch):
+    """Make every kernel compilation fail, as a Numba that cannot type the kernels would."""
+    def njit(**options):
+        def compile_kernel(kernel):
+            def fail(*args):
+                raise RuntimeError("compilation failed")
+            return fail
+        return compile_kernel
+    monkeypatch.setattr(kernels, "njit", njit)
+    monkeypatch.setattr(kernels, "_compiled", {})
+    monkeypatch.setattr(kernels, "_unusable", set())
+
+
+@pytest.mark.parametrize("numba_failure", ["broken_numba_import", "failing_compiler"])
+def test_default_engines_fall_back_without_a_working_numba(numba_failure, request):
+    request.getfixturevalue(numba_failure)
+    args = (6, 20, 1, 3, 0.1)
+    assert_same_run(simulate_csma(*args, CSMA_PROTOCOLS[1], seed=4),
+                    simulate_csma(*args, CSMA_PROTOCOLS[1], seed=4, jit=False))
+    assert_same_run(simulate_csma_ca(*args, CSMA_CA_VARIANTS[0], seed=4),
+                    simulate_csma_ca(*args, CSMA_CA_VARIANTS[0], seed=4, jit=False))
+    with pytest.raises(RuntimeError):
+        simulate_csma(*args, CSMA_PROTOCOLS[1], seed=4, jit=True)
+    with pytest.raises(RuntimeError):
+        simulate_csma_ca(*args, CSMA_CA_VARIANTS[0], seed=4, jit=True)
+
+
+def test_jit_true_rejects_modes_the_kernels_do_not_cover():
+    with pytest.raises(ValueError):
+        simulate_csma(5, 20, 1, 1, 0.1, CSMA_PROTOCOLS[0], jit=True, on_chunk=print)
+    with pytest.raises(ValueError):
+        simulate_csma(5, 20, 1, 1, 0.1, CSMA_PROTOCOLS[0], jit=True, sampling="geometric")
+    with pytest.raises(ValueError):
+        simulate_csma_ca(5, 20, 1, 1, 0.1, jit=True, sampling="geometric")
+
+
+@pytest.mark.parametrize("num_nodes, tx_time, gen_prob, max_time", PARAMS)
+def test_compiled_kernels_match_python_engines(num_nodes, tx_time, gen_prob, max_time):
+    pytest.importorskip("numba")
+    for seed in range(2):
+        for protocol in CSMA_PROTOCOLS:
+            args = (num_nodes, 20, 1, tx_time, gen_prob, protocol)
+            assert_same_run(simulate_csma(*args, seed=seed, max_time=max_time, jit=True),
+                            simulate_csma(*args, seed=seed, max_time=max_time, jit=False))
+        for variant in CSMA_CA_VARIANTS:
+            args = (num_nodes, 20, 1, tx_time, gen_prob, variant)
+            assert_same_run(simulate_csma_ca(*args, seed=seed, max_time=max_time, jit=True),
+                            simulate_csma_ca(*args, seed=seed, max_time=max_time, jit=False))
@@ -0,0 +1,27 @@
+import sys
+
+import pytest
+
+from csmacdsim.csma import CSMA_PROTOCOLS, simulate_csma
+from csmacdsim.parallel import iter_runs, process_pool, run_metrics, run_seeds
+
+
+def comparison_tasks():
+    return [(simulate_csma, (5, 20, 1, 2, 0.1, protocol), seed, 200)
+            for protocol in CSMA_PROTOCOLS for seed in run_seeds(7, 2)]
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="fork is only used on Linux")
+def test_linux_pool_forks():
+    with process_pool(1) as pool:
+        assert pool._mp_context.get_start_method() == "fork"
+
+
+def test_pool_without_fork_runs_the_package_workers(monkeypatch):
+    monkeypatch.setattr(sys, "platform", "darwin")
+    with process_pool(1) as pool:
+        assert pool._mp_context.get_start_method() in ("forkserver", "spawn")
+    tasks = comparison_tasks()
+    parallel = dict(iter_runs(run_metrics, tasks, max_workers=2))
+    serial = dict(iter_runs(run_metrics, tasks, parallel=False))
+    assert parallel == serial
@@ -0,0 +1,67 @@
+import copy
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from csmacdsim.pure_aloha import (replicate_pure_aloha, resolve_collisions_pairwise, resolve_collisions_sweep,
+                                  simulate_pure_aloha, simulate_pure_aloha_vectorized)
+from csmacdsim.streaming import stream_pure_aloha
+from distributions import assert_same_mean
+
+
+def test_engines_match_the_tick_loop_when_nodes_never_attempt():
+    time_units_data, node_transmissions, stats, all_transmissions = simulate_pure_aloha(4, 0, 50, 2, seed=1)
+    assert stats["idle"] == 50 and stats["total_transmissions"] == 0
+
+    assert simulate_pure_aloha_vectorized(4, 0, 50, 2, seed=1) == (
+        time_units_data, node_transmissions, stats, all_transmissions)
+    assert stream_pure_aloha(4, 0, 50, 2, seed=1, chunk_units=16) == (stats, [])
+    per_replication, _ = replicate_pure_aloha(4, 0, 50, 2, 3, seed=1)
+    np.testing.assert_array_equal(per_replication["idle"], [50, 50, 50])
+    np.testing.assert_array_equal(per_replication["total_transmissions"], [0, 0, 0])
+
+
+def assert_resolvers_agree(transmissions):
+    pairwise = copy.deepcopy(transmissions)
+    sweep = copy.deepcopy(transmissions)
+    assert resolve_collisions_sweep(sweep) == resolve_collisions_pairwise(pairwise)
+    assert [t[3] for t in sweep] == [t[3] for t in pairwise]
+
+
+def test_resolvers_agree_on_equal_starts_and_touching_ends():
+    # [0, 2) and [2, 4) only touch; [5, 7) and [5, 6) start together; [8, 9) nests in [7, 10)
+    assert_resolvers_agree([[0, 0, 2, None], [1, 2, 4, None], [2, 5, 7, None], [3, 5, 6, None],
+                            [0, 7, 10, None], [1, 8, 9, None], [2, 12, 13, None]])
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_resolvers_agree_on_random_intervals(seed):
+    rng = np.random.default_rng(seed)
+    # A short time axis and short durations make equal starts and touching ends common
+    count = int(rng.integers(0, 60))
+    starts = rng.integers(0, 40, size=count)
+    ends = starts + rng.integers(1, 5, size=count)
+    assert_resolvers_agree([[i % 7, int(start), int(end), None]
+                            for i, (start, end) in enumerate(zip(starts, ends))])
+
+
+def test_replications_match_the_vectorized_engine_in_distribution():
+    per_replication, _ = replicate_pure_aloha(10, 0.03, 2000, 3, 150, seed=5, chunk_cells=20_000)
+    replicated = np.column_stack([per_replication[key] for key in ("successful", "collisions", "idle")])
+    engine = [[stats["successful"], stats["collisions"], stats["idle"]]
+              for stats in (simulate_pure_aloha_vectorized(10, 0.03, 2000, 3, seed=1000 + seed)[2]
+                            for seed in range(150))]
+    assert_same_mean(replicated, engine)
+
+
+def test_replication_memory_does_not_grow_with_the_time_axis():
+    tracemalloc.start()
+    try:
+        per_replication, _ = replicate_pure_aloha(10, 0.001, 1_000_000, 2, 40, seed=2, chunk_cells=2**18)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert per_replication["idle"].min() > 0
+    # 40 replications of 10**6 time units: a dense time axis alone would take 320 MB
+    assert peak < 64 * 2**20
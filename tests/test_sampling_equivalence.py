@@ -0,0 +1,47 @@
+"""
+sampling="geometric" against sampling="per-slot".
+
+Geometric sampling draws the gap to each node's next event instead of a
+Bernoulli per node per slot, so a seed gives a different run; the counts
+must still agree in distribution over many seeds.
+"""
+
+import pytest
+
+from csmacdsim.csma import CSMA_PROTOCOLS, simulate_csma
+from csmacdsim.csma_ca import CSMA_CA_VARIANTS, simulate_csma_ca
+from csmacdsim.slotted_aloha import simulate_slotted_aloha_vectorized
+from distributions import assert_same_mean
+
+NUM_NODES, TX_TIME, MAX_TIME, SEEDS = 8, 3, 300, 150
+
+
+def csma_counts(sampling, gen_prob, protocol):
+    return [simulate_csma(NUM_NODES, 20, 1, TX_TIME, gen_prob, protocol, seed=seed, max_time=MAX_TIME,
+                          sampling=sampling, jit=False)[1:3] for seed in range(SEEDS)]
+
+
+def csma_ca_counts(sampling, gen_prob, variant):
+    return [simulate_csma_ca(NUM_NODES, 20, 1, TX_TIME, gen_prob, variant, seed=seed, max_time=MAX_TIME,
+                             sampling=sampling, jit=False)[1:3] for seed in range(SEEDS)]
+
+
+@pytest.mark.parametrize("gen_prob", [0.005, 0.05])
+@pytest.mark.parametrize("protocol", CSMA_PROTOCOLS)
+def test_geometric_csma_matches_per_slot(protocol, gen_prob):
+    assert_same_mean(csma_counts("geometric", gen_prob, protocol), csma_counts("per-slot", gen_prob, protocol))
+
+
+@pytest.mark.parametrize("gen_prob", [0.005, 0.05])
+@pytest.mark.parametrize("variant", CSMA_CA_VARIANTS)
+def test_geometric_csma_ca_matches_per_slot(variant, gen_prob):
+    assert_same_mean(csma_ca_counts("geometric", gen_prob, variant), csma_ca_counts("per-slot", gen_prob, variant))
+
+
+@pytest.mark.parametrize("p", [0.002, 0.05, 0.3])
+def test_geometric_slotted_aloha_matches_per_slot(p):
+    def counts(sampling):
+        runs = (simulate_slotted_aloha_vectorized(20, p, 1000, seed=seed, sampling=sampling)[2]
+                for seed in range(SEEDS))
+        return [[stats["successful"], stats["collisions"], stats["idle"]] for stats in runs]
+    assert_same_mean(counts("geometric"), counts("per-slot"))
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+from distributions import assert_same_mean
+
+from csmacdsim.slotted_aloha import (
+    replicate_slotted_aloha,
+    simulate_slotted_aloha,
+    simulate_slotted_aloha_stats,
+    simulate_slotted_aloha_vectorized,
+)
+
+
+@pytest.mark.parametrize("chunk_slots", [None, 1, 7, 1000])
+def test_vectorized_engine_is_the_slot_loop(chunk_slots):
+    slots_data, timeline, stats = simulate_slotted_aloha(12, 0.08, 500, seed=9)
+    progress = []
+    options = {} if chunk_slots is None else {"on_chunk": progress.append, "chunk_slots": chunk_slots}
+    slot_counts, vec_timeline, vec_stats = simulate_slotted_aloha_vectorized(12, 0.08, 500, seed=9, **options)
+    assert vec_stats == stats
+    np.testing.assert_array_equal(slot_counts, [count for _, count, _ in slots_data])
+    np.testing.assert_array_equal(vec_timeline.states, timeline.states)
+    if chunk_slots is not None:
+        assert progress[-1] == stats
+
+
+@pytest.mark.parametrize("chunk_cells", [2**22, 12 * 500 * 3, 100])
+def test_first_replication_is_the_vectorized_run(chunk_cells):
+    per_replication, _ = replicate_slotted_aloha(12, 0.08, 500, 5, seed=9, chunk_cells=chunk_cells)
+    _, _, stats = simulate_slotted_aloha_vectorized(12, 0.08, 500, seed=9)
+    assert per_replication["successful"][0] == stats["successful"]
+    assert per_replication["collisions"][0] == stats["collisions"]
+    assert per_replication["idle"][0] == stats["idle"]
+
+
+def test_stats_engine_matches_vectorized_in_distribution():
+    def counts(engine, seed):
+        stats = engine(12, 0.08, 400, seed=seed)
+        stats = stats if isinstance(stats, dict) else stats[2]
+        return stats["successful"], stats["collisions"], stats["idle"]
+
+    binomial = [counts(simulate_slotted_aloha_stats, seed) for seed in range(200)]
+    per_node = [counts(simulate_slotted_aloha_vectorized, seed) for seed in range(1000, 1200)]
+    assert_same_mean(binomial, per_node)
+
+
+@pytest.mark.parametrize("num_nodes, p", [(10, 0.1), (50, 0.01), (3, 0.5)])
+def test_stats_engine_matches_theory(num_nodes, p):
+    num_slots = 200_000
+    stats = simulate_slotted_aloha_stats(num_nodes, p, num_slots, seed=4, chunk_slots=30_000)
+    assert stats["successful"] + stats["collisions"] + stats["idle"] == num_slots
+    for observed, prob in [(stats["successful"], num_nodes * p * (1 - p) ** (num_nodes - 1)),
+                           (stats["idle"], (1 - p) ** num_nodes)]:
+        stderr = np.sqrt(num_slots * prob * (1 - prob))
+        assert abs(observed - num_slots * prob) <= 4 * stderr, (observed, num_slots * prob)
+
+
+def test_stats_engine_reports_progress_per_chunk():
+    progress = []
+    stats = simulate_slotted_aloha_stats(8, 0.1, 1000, seed=2, chunk_slots=300, on_chunk=progress.append)
+    assert [entry["successful"] + entry["collisions"] + entry["idle"] for entry in progress] == [300, 600, 900, 1000]
+    assert progress[-1] == stats
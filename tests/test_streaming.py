@@ -0,0 +1,18 @@
+import numpy as np
+
+from csmacdsim.slotted_aloha import simulate_slotted_aloha_vectorized
+from csmacdsim.streaming import stream_slotted_aloha
+
+
+def test_slotted_aloha_window_with_chunks_smaller_than_window():
+    window_slots = 100
+    stats, window = stream_slotted_aloha(10, 0.1, 500, seed=3, chunk_slots=33, window_slots=window_slots)
+    _, timeline, expected_stats = simulate_slotted_aloha_vectorized(10, 0.1, 500, seed=3)
+    assert stats == expected_stats
+    np.testing.assert_array_equal(window.states, timeline.states[:, :window_slots])
+
+
+def test_slotted_aloha_window_longer_than_run():
+    _, window = stream_slotted_aloha(4, 0.3, 50, seed=1, chunk_slots=7, window_slots=100)
+    _, timeline, _ = simulate_slotted_aloha_vectorized(4, 0.3, 50, seed=1)
+    np.testing.assert_array_equal(window.states, timeline.states)
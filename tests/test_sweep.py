@@ -0,0 +1,50 @@
+import pytest
+
+from csmacdsim.cli import build_parser, parse_grid
+from csmacdsim.csma import CSMA_PROTOCOLS
+from csmacdsim.sweep import sweep_points
+
+
+def test_parse_grid_ranges_and_bounds():
+    assert parse_grid("1,2,5", int) == [1, 2, 5]
+    assert parse_grid("0:1:3") == [0.0, 0.5, 1.0]
+    with pytest.raises(ValueError, match="p must be in"):
+        parse_grid("0.5:1.5:3", name="p", low=0, high=1)
+
+
+@pytest.mark.parametrize("option, value", [("--p", "0.1,1.2"), ("--p", "-0.1"), ("--gen-prob", "0:2:5"),
+                                           ("--nodes", "0,5"), ("--tx-time", "0"), ("--tx-time", "1,-2")])
+def test_cli_rejects_out_of_range_grid_values(option, value, capsys):
+    with pytest.raises(SystemExit) as exc:
+        build_parser().parse_args(["sweep", "--out", "x.csv", option, value])
+    assert exc.value.code == 2
+    assert "invalid grid" in capsys.readouterr().err
+
+
+def test_sweep_points_checks_the_grid_before_yielding():
+    with pytest.raises(ValueError, match="gen_prob"):
+        sweep_points(CSMA_PROTOCOLS[:1], [5], [0.1], [0.1, 1.5], [1], 2, 0)
+    points = list(sweep_points(["Slotted ALOHA"], [1, 5], [0.0, 1.0], [0.1], [1], 2, 0))
+    assert len(points) == 8
+
+
+@pytest.mark.parametrize("option", ["--seeds", "--slots", "--packet-duration", "--max-time", "--workers",
+                                    "--batch-size"])
+@pytest.mark.parametrize("value", ["0", "-3"])
+def test_cli_rejects_non_positive_counts(option, value, capsys):
+    with pytest.raises(SystemExit) as exc:
+        build_parser().parse_args(["sweep", "--out", "x.csv", option, value])
+    assert exc.value.code == 2
+    assert "must be >= 1" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("options, message", [
+    ({"num_slots": 0}, "num_slots"), ({"packet_duration": 0}, "packet_duration"),
+    ({"max_time": 0}, "max_time"), ({"replications": 0}, "replications"), ({"tx_times": [0.0]}, "tx_time"),
+])
+def test_sweep_points_rejects_non_positive_lengths(options, message):
+    args = {"protocols": ["Pure ALOHA"], "nodes": [5], "p_values": [1.0], "gen_probs": [0.1], "tx_times": [1],
+            "replications": 1, "root_seed": 0}
+    args.update(options)
+    with pytest.raises(ValueError, match=message):
+        sweep_points(**args)
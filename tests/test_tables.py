@@ -0,0 +1,42 @@
+import pandas as pd
+
+from csmacdsim.tables import filter_events, page_count, paginate
+
+
+def sample_events():
+    return pd.DataFrame({
+        "Node": [0, 1, 2, 0, 1],
+        "Start Time": [0, 3, 5, 8, 12],
+        "Status": ["Success", "Collision", "Collision", "Success", "Success"],
+    })
+
+
+def test_empty_selections_keep_every_row():
+    df = sample_events()
+    assert filter_events(df).equals(df)
+    assert filter_events(df, {"Status": [], "Node": []}).equals(df)
+
+
+def test_filters_combine():
+    df = sample_events()
+    kept = filter_events(df, {"Status": ["Success"], "Node": [0, 1]}, "Start Time", (0, 8))
+    assert kept["Start Time"].tolist() == [0, 8]
+
+
+def test_time_range_is_inclusive():
+    kept = filter_events(sample_events(), time_column="Start Time", time_range=(3, 8))
+    assert kept["Start Time"].tolist() == [3, 5, 8]
+
+
+def test_page_count():
+    assert page_count(0, 10) == 1
+    assert page_count(10, 10) == 1
+    assert page_count(11, 10) == 2
+
+
+def test_paginate_clamps_the_page():
+    df = sample_events()
+    assert paginate(df, 2, 2)["Start Time"].tolist() == [5, 8]
+    assert paginate(df, 9, 2)["Start Time"].tolist() == [12]
+    assert paginate(df, 0, 2)["Start Time"].tolist() == [0, 3]
+    assert paginate(df.iloc[:0], 1, 2).empty